@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .schemas import (
+    SummaryEntry,
+    SummaryHeadlineQuantile,
+    SummarySeriesAggregate,
+    SummarySeriesContributor,
+    SummarySeriesHighlight,
+)
+from .sketches import KllSketch, TopK
+
+
+class CompensatedSum:
+    """Running sum that stays exact for any number of finite terms.
+
+    Keeps Shewchuk's non-overlapping partials (the algorithm behind
+    ``math.fsum``) so totals in the billions do not drift as entries stream in.
+    """
+
+    __slots__ = ("_partials", "_special")
+
+    def __init__(self) -> None:
+        self._partials: List[float] = []
+        self._special = 0.0
+
+    def add(self, value: float) -> None:
+        if not math.isfinite(value):
+            self._special += value
+            return
+        partials = self._partials
+        index = 0
+        for other in partials:
+            if abs(value) < abs(other):
+                value, other = other, value
+            high = value + other
+            low = other - (high - value)
+            if low:
+                partials[index] = low
+                index += 1
+            value = high
+        partials[index:] = [value]
+
+    @property
+    def value(self) -> float:
+        if self._special:
+            return self._special
+        return math.fsum(self._partials)
+
+    @property
+    def partials(self) -> List[float]:
+        """Terms whose exact sum is the running total; adding them to another sum merges exactly."""
+        return [self._special] if self._special else list(self._partials)
+
+    def merge(self, other: "CompensatedSum") -> None:
+        for value in other.partials:
+            self.add(value)
+
+
+def series_aggregate(
+    series: str,
+    count: int,
+    total: float,
+    minimum: float,
+    maximum: float,
+    top_model: str,
+    bottom_model: str,
+) -> SummarySeriesAggregate:
+    average = total / count if count else 0.0
+    return SummarySeriesAggregate(
+        series=series,
+        model_count=count,
+        headline_total=round(total, 2),
+        headline_average=round(average, 2),
+        headline_min=round(minimum, 2),
+        headline_max=round(maximum, 2),
+        top_model=SummarySeriesHighlight(model=top_model, headline_amount=round(maximum, 2)),
+        bottom_model=SummarySeriesHighlight(model=bottom_model, headline_amount=round(minimum, 2)),
+    )
+
+
+class SeriesAccumulator:
+    """One-pass count/total/min/max tracker for a single series."""
+
+    __slots__ = ("series", "count", "total", "minimum", "maximum", "top_model", "bottom_model")
+
+    def __init__(self, series: str) -> None:
+        self.series = series
+        self.count = 0
+        self.total = CompensatedSum()
+        self.minimum = 0.0
+        self.maximum = 0.0
+        self.top_model = ""
+        self.bottom_model = ""
+
+    def add(self, model: str, amount: float) -> None:
+        if not self.count:
+            self.minimum = self.maximum = amount
+            self.top_model = self.bottom_model = model
+        elif amount > self.maximum:
+            self.maximum = amount
+            self.top_model = model
+        elif amount < self.minimum:
+            self.minimum = amount
+            self.bottom_model = model
+        self.count += 1
+        self.total.add(amount)
+
+    def merge(self, other: "SeriesAccumulator") -> None:
+        """Fold in another shard of the same series; ties keep this shard's models."""
+        if not other.count:
+            return
+        if not self.count:
+            self.minimum, self.bottom_model = other.minimum, other.bottom_model
+            self.maximum, self.top_model = other.maximum, other.top_model
+        else:
+            if other.maximum > self.maximum:
+                self.maximum, self.top_model = other.maximum, other.top_model
+            if other.minimum < self.minimum:
+                self.minimum, self.bottom_model = other.minimum, other.bottom_model
+        self.count += other.count
+        self.total.merge(other.total)
+
+    def to_aggregate(self) -> SummarySeriesAggregate:
+        return series_aggregate(
+            self.series,
+            self.count,
+            self.total.value,
+            self.minimum,
+            self.maximum,
+            self.top_model,
+            self.bottom_model,
+        )
+
+
+class ReportAccumulator:
+    """Folds summary entries into per-series aggregates as they arrive."""
+
+    def __init__(self) -> None:
+        self.series: Dict[str, SeriesAccumulator] = {}
+        self.total = CompensatedSum()
+        self.count = 0
+
+    def add(self, entry: SummaryEntry) -> None:
+        accumulator = self.series.get(entry.series)
+        if accumulator is None:
+            accumulator = self.series[entry.series] = SeriesAccumulator(entry.series)
+        accumulator.add(entry.model, entry.headline_amount)
+        self.total.add(entry.headline_amount)
+        self.count += 1
+
+    @property
+    def overall_total(self) -> float:
+        return self.total.value
+
+    def series_summary(self) -> List[SummarySeriesAggregate]:
+        return [accumulator.to_aggregate() for accumulator in self.series.values()]
+
+
+class SeriesStats:
+    """Optional per-series top-K contributors and quantile sketch."""
+
+    __slots__ = ("top", "sketch")
+
+    def __init__(self, top_k: int = 0, sketch: bool = False) -> None:
+        self.top: Optional[TopK[Tuple[str, Optional[str]]]] = TopK(top_k) if top_k else None
+        self.sketch: Optional[KllSketch] = KllSketch() if sketch else None
+
+    def add(self, entry: SummaryEntry) -> None:
+        amount = entry.headline_amount
+        if self.top is not None and self.top.accepts(amount):
+            self.top.push(amount, (entry.model, entry.label))
+        if self.sketch is not None:
+            self.sketch.add(amount)
+
+    def merge(self, other: "SeriesStats", factor: float = 1.0) -> None:
+        """Fold in ``other`` with its values multiplied by ``factor``."""
+        if self.top is not None and other.top is not None:
+            self.top.merge(other.top.scaled(factor) if factor != 1.0 else other.top)
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch.scaled(factor) if factor != 1.0 else other.sketch)
+
+    def describe(self, aggregate: SummarySeriesAggregate, quantiles: Sequence[float]) -> SummarySeriesAggregate:
+        if self.top is not None:
+            aggregate.top_contributors = [
+                SummarySeriesContributor(model=model, label=label, headline_amount=round(amount, 2))
+                for amount, (model, label) in self.top.items()
+            ]
+        if self.sketch is not None:
+            aggregate.headline_quantiles = [
+                SummaryHeadlineQuantile(quantile=fraction, headline_amount=round(value, 2))
+                for fraction, value in zip(quantiles, self.sketch.quantiles(quantiles))
+            ]
+        return aggregate
+
+
+class StatsAccumulator(ReportAccumulator):
+    """``ReportAccumulator`` that also tracks top-K contributors and/or quantiles per series."""
+
+    def __init__(self, top_k: int = 0, quantiles: Sequence[float] = ()) -> None:
+        super().__init__()
+        self.top_k = top_k
+        self.quantiles = tuple(quantiles)
+        self.stats: Dict[str, SeriesStats] = {}
+
+    def new_stats(self) -> SeriesStats:
+        return SeriesStats(self.top_k, bool(self.quantiles))
+
+    def add(self, entry: SummaryEntry) -> None:
+        super().add(entry)
+        stats = self.stats.get(entry.series)
+        if stats is None:
+            stats = self.stats[entry.series] = self.new_stats()
+        stats.add(entry)
+
+    def series_summary(self) -> List[SummarySeriesAggregate]:
+        return [
+            self.stats[series].describe(accumulator.to_aggregate(), self.quantiles)
+            for series, accumulator in self.series.items()
+        ]
+
+
+def aggregate_entries(entries: Iterable[SummaryEntry]) -> ReportAccumulator:
+    accumulator = ReportAccumulator()
+    for entry in entries:
+        accumulator.add(entry)
+    return accumulator
@@ -0,0 +1,86 @@
+from typing import Callable, Coroutine, Mapping, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.routing import APIRoute
+
+from ..cache import CachedReport, ReportCache, body_digest, canonical_digest
+from ..schemas import MODEL_REGISTRY
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+# Headers that describe the cached report itself and are replayed on hits.
+_REPLAYED_HEADERS = ("x-report-id",)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def cached_response(
+    request: Request, cached: CachedReport, status: str, extra_headers: Optional[Mapping[str, str]] = None
+) -> Response:
+    headers = {**dict(cached.headers), **(extra_headers or {}), "ETag": cached.etag, "X-Cache": status}
+    if _etag_matches(request, cached.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type=cached.media_type, headers=headers)
+
+
+class CachedReportRoute(APIRoute):
+    """Route class that answers repeated report requests from ``app.state.report_cache``.
+
+    Lookups happen before FastAPI parses the body, on a digest of the raw bytes.
+    With ``cache_canonical_keys`` a raw miss is retried on the canonical JSON
+    form, which costs a full stdlib parse and re-encode of the body, so it is
+    off by default. Streaming requests (``stream=true``) bypass the cache.
+    Keys include the active registry spec, so a worker whose registry was reloaded
+    never serves (or shares) reports aggregated under another one.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+        handler = super().get_route_handler()
+
+        async def cached_handler(request: Request) -> Response:
+            cache: Optional[ReportCache] = getattr(request.app.state, "report_cache", None)
+            if cache is None or request.query_params.get("stream", "").lower() in _TRUTHY:
+                return await handler(request)
+
+            spec = MODEL_REGISTRY.spec
+            registry = spec.digest if spec is not None else "builtin"
+            scope = f"{registry}:{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+            body = await request.body()
+            raw_key = body_digest(body, scope)
+            cached = cache.get(raw_key, count_miss=False)
+            if cached is not None:
+                return cached_response(request, cached, "HIT")
+
+            if request.app.state.settings.cache_canonical_keys:
+                key = await run_in_threadpool(canonical_digest, body, scope)
+                if key is None:
+                    return await handler(request)
+            else:
+                key = raw_key
+            cached = cache.get(key)
+            extra_headers = None
+            if cached is None:
+                response = await handler(request)
+                if response.status_code != 200 or not hasattr(response, "body"):
+                    return response
+                replayed = tuple(
+                    (name, response.headers[name]) for name in _REPLAYED_HEADERS if name in response.headers
+                )
+                cached = cache.put(key, bytes(response.body), response.media_type or "application/json", replayed)
+                status = "MISS"
+                if "server-timing" in response.headers:
+                    extra_headers = {"Server-Timing": response.headers["server-timing"]}
+            else:
+                status = "HIT"
+            cache.alias(raw_key, key)
+            return cached_response(request, cached, status, extra_headers)
+
+        return cached_handler
@@ -0,0 +1,23 @@
+from typing import Any, Dict, Mapping, Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_response(
+    model: BaseModel,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> Response:
+    """Serialise an already-validated model straight to JSON bytes.
+
+    Returning a ``Response`` keeps FastAPI from dumping, re-validating and
+    re-encoding the object against the route's ``response_model``.
+    """
+    return Response(
+        content=model.model_dump_json(context=context),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from ..responses import model_response
+from ...history import HistoryIndex
+from ...schemas import (
+    SummaryHistoryPointList,
+    SummaryHistoryRollingList,
+    SummaryHistoryRollupList,
+)
+
+router = APIRouter()
+
+
+def _history(request: Request) -> HistoryIndex:
+    history = request.app.state.history
+    if history is None:
+        raise HTTPException(status_code=404, detail="Report history is not enabled (set SEBIT_SUMMARY_HISTORY).")
+    return history
+
+
+@router.get(
+    "/history/points",
+    response_model=SummaryHistoryPointList,
+    summary="Headline history for matching (series, model, label) keys",
+)
+def history_points(
+    request: Request,
+    series: Optional[str] = None,
+    model: Optional[str] = None,
+    label: Optional[str] = None,
+    as_of_from: Optional[datetime] = None,
+    as_of_to: Optional[datetime] = None,
+    limit: int = Query(default=10_000, ge=1, le=1_000_000),
+) -> Response:
+    points = _history(request).points(series, model, label, as_of_from, as_of_to, limit)
+    return model_response(SummaryHistoryPointList(points=points))
+
+
+@router.get(
+    "/history/latest",
+    response_model=SummaryHistoryPointList,
+    summary="Latest headline at or before a point in time",
+)
+def history_latest(
+    request: Request,
+    series: Optional[str] = None,
+    model: Optional[str] = None,
+    label: Optional[str] = None,
+    at: Optional[datetime] = None,
+) -> Response:
+    points = _history(request).latest(series, model, label, at)
+    return model_response(SummaryHistoryPointList(points=points))
+
+
+@router.get(
+    "/history/rollups",
+    response_model=SummaryHistoryRollupList,
+    summary="Per-period rollups of a series' headline total",
+)
+def history_rollups(
+    request: Request,
+    series: str,
+    period_from: Optional[str] = None,
+    period_to: Optional[str] = None,
+) -> Response:
+    """Served from rollups maintained on write; ``period_*`` use the configured period keys (e.g. 2025-08)."""
+    rollups = _history(request).rollups(series, period_from, period_to)
+    return model_response(SummaryHistoryRollupList(rollups=rollups))
+
+
+@router.get(
+    "/history/rolling",
+    response_model=SummaryHistoryRollingList,
+    summary="Rolling aggregates of a series' period closing totals",
+)
+def history_rolling(
+    request: Request,
+    series: str,
+    window: int = Query(default=3, ge=1, le=120),
+    period_from: Optional[str] = None,
+    period_to: Optional[str] = None,
+) -> Response:
+    rolling = _history(request).rolling(series, window, period_from, period_to)
+    return model_response(SummaryHistoryRollingList(rolling=rolling))
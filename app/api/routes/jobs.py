@@ -0,0 +1,59 @@
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+
+from ..codec import json_request_body
+from ...jobs import JobQueueFull, ReportJob, ReportJobQueue
+from ...schemas import SummaryJobStatus, SummaryReportRequest
+
+router = APIRouter()
+
+MAX_WAIT_SECONDS = 30.0
+
+
+def _queue(request: Request) -> ReportJobQueue:
+    return request.app.state.jobs
+
+
+def _job_response(job: ReportJob, status_code: int = 200) -> Response:
+    return Response(content=job.encode(), media_type="application/json", status_code=status_code)
+
+
+@router.post(
+    "/jobs",
+    status_code=202,
+    response_model=SummaryJobStatus,
+    summary="Queue a report for asynchronous aggregation",
+    openapi_extra=json_request_body(SummaryReportRequest),
+    responses={429: {"description": "The job queue is full; retry after the Retry-After delay."}},
+)
+async def submit_report_job(request: Request) -> Response:
+    """Accepts the `/summary/report` body and returns a job id at once.
+
+    The body is validated and aggregated on the job worker pool; poll
+    `GET /summary/jobs/{job_id}` (optionally with `wait`) for the report.
+    """
+    body = await request.body()
+    try:
+        job = _queue(request).submit(body)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": str(exc.retry_after)}) from exc
+    response = _job_response(job, status_code=202)
+    response.headers["Location"] = f"{request.url.path}/{job.job_id}"
+    return response
+
+
+@router.get(
+    "/jobs/{job_id}",
+    response_model=SummaryJobStatus,
+    summary="Poll a report job, optionally waiting for it to finish",
+)
+async def get_report_job(
+    job_id: str,
+    request: Request,
+    wait: float = Query(0.0, ge=0.0, le=MAX_WAIT_SECONDS, description="Seconds to wait for the job to finish."),
+) -> Response:
+    queue = _queue(request)
+    job = queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Report job '{job_id}' not found.")
+    await queue.wait(job, wait)
+    return _job_response(job)
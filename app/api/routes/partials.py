@@ -0,0 +1,65 @@
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from ..codec import decode_json_body, json_request_body
+from ..responses import model_response
+from ...partials import build_partial, merge_partials, to_partial
+from ...schemas import SummaryPartialMergeRequest, SummaryPartialReport, SummaryReportDigest, SummaryReportRequest
+from ...services import report_digest
+
+router = APIRouter()
+
+
+@router.post(
+    "/partials",
+    response_model=SummaryPartialReport,
+    summary="Pre-aggregate one shard's model outputs into a mergeable partial",
+    openapi_extra=json_request_body(SummaryReportRequest),
+)
+async def create_partial(request: Request) -> Response:
+    """Takes the `/summary/report` body; the partial's size depends on the number of series, not entries."""
+    body = await request.body()
+    return await run_in_threadpool(_create_partial, body)
+
+
+def _create_partial(body: bytes) -> Response:
+    payload = decode_json_body(SummaryReportRequest, body)
+    if payload.reporting_currency is not None:
+        raise HTTPException(status_code=422, detail="reporting_currency is not supported for partials.")
+    try:
+        partial = build_partial(
+            payload.iter_entries(), payload.report_label, payload.as_of, payload.top_k, payload.quantiles
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return model_response(partial)
+
+
+@router.post(
+    "/partials:merge",
+    response_model=SummaryReportDigest,
+    summary="Combine shard partials into report totals and series aggregates",
+    openapi_extra=json_request_body(SummaryPartialMergeRequest),
+    responses={200: {"description": "The merged digest, or a merged SummaryPartialReport with output=partial."}},
+)
+async def merge_partial_reports(
+    request: Request,
+    output: Literal["report", "partial"] = Query(
+        "report", description="'partial' returns a merged partial for further (tree) reduction."
+    ),
+) -> Response:
+    body = await request.body()
+    return await run_in_threadpool(_merge_partials, body, output)
+
+
+def _merge_partials(body: bytes, output: str) -> Response:
+    merge = decode_json_body(SummaryPartialMergeRequest, body)
+    first = merge.partials[0]
+    report_label = merge.report_label or first.report_label
+    as_of = merge.as_of or first.as_of
+    accumulator = merge_partials(merge.partials, merge.quantiles)
+    if output == "partial":
+        return model_response(to_partial(accumulator, report_label, as_of))
+    return model_response(report_digest(accumulator, report_label, as_of))
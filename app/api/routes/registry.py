@@ -0,0 +1,56 @@
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from ..responses import model_response
+from ...registry import RegistryLoader, RegistrySpecError
+from ...schemas import MODEL_REGISTRY, SummaryModelRegistry, SummaryRegisteredModel
+
+router = APIRouter()
+
+
+def _loader(request: Request) -> Optional[RegistryLoader]:
+    return request.app.state.registry
+
+
+def _registry(loader: Optional[RegistryLoader]) -> SummaryModelRegistry:
+    spec = MODEL_REGISTRY.spec
+    return SummaryModelRegistry(
+        spec_path=loader.path if loader is not None else None,
+        spec_digest=spec.digest if spec is not None else None,
+        loaded_at=loader.loaded_at if loader is not None else None,
+        reload_error=loader.error if loader is not None else None,
+        models=[
+            SummaryRegisteredModel(
+                model=entry.model,
+                series=entry.series,
+                headline_key=entry.headline_key,
+                label_key=entry.label_key,
+                source=entry.source,
+                fields=list(entry.detail_model.model_fields),
+            )
+            for entry in MODEL_REGISTRY.values()
+        ],
+    )
+
+
+@router.get("/registry", response_model=SummaryModelRegistry, summary="List the registered SEBIT models")
+def get_registry(request: Request) -> Response:
+    return model_response(_registry(_loader(request)))
+
+
+@router.post("/registry:reload", response_model=SummaryModelRegistry, summary="Reload the registry spec file now")
+async def reload_registry(request: Request) -> Response:
+    """Installs the spec file without waiting for the next poll.
+
+    An invalid spec is rejected with `422` and the current registry stays active.
+    """
+    loader = _loader(request)
+    if loader is None:
+        raise HTTPException(status_code=404, detail="No registry spec is configured (set SEBIT_SUMMARY_REGISTRY_PATH).")
+    try:
+        await run_in_threadpool(loader.load)
+    except RegistrySpecError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return model_response(_registry(loader))
@@ -0,0 +1,86 @@
+from typing import List
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from ..codec import decode_json_body, json_request_body
+from ..responses import model_response
+from ...rollups import RollupStore, RollupTree
+from ...schemas import SummaryReportRequest, SummaryRollupPage
+
+router = APIRouter()
+
+MAX_DEPTH = 3
+
+
+def _store(request: Request) -> RollupStore:
+    return request.app.state.rollups
+
+
+def _page(tree: RollupTree, path: List[str], depth: int, offset: int, limit: int, status_code: int = 200) -> Response:
+    try:
+        page = tree.page(path, depth, offset, limit)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Rollup node '{'/'.join(path)}' not found.") from exc
+    return model_response(page, status_code=status_code)
+
+
+@router.post(
+    "/rollups",
+    status_code=201,
+    response_model=SummaryRollupPage,
+    summary="Build a series -> model -> label rollup of model outputs",
+    openapi_extra=json_request_body(SummaryReportRequest),
+)
+async def create_rollup(
+    request: Request,
+    depth: int = Query(1, ge=0, le=MAX_DEPTH, description="Levels to expand below the series."),
+    limit: int = Query(100, ge=1, le=10_000, description="Children returned per expanded node."),
+) -> Response:
+    """Aggregates every level in one pass and keeps the tree for paging with `GET /summary/rollups/{rollup_id}`.
+
+    Labels come from each model's label field; `detail_mode=lazy` reads them
+    without building detail models.
+    """
+    body = await request.body()
+    return await run_in_threadpool(_create_rollup, request, body, depth, limit)
+
+
+def _create_rollup(request: Request, body: bytes, depth: int, limit: int) -> Response:
+    payload = decode_json_body(SummaryReportRequest, body)
+    if payload.reporting_currency is not None:
+        raise HTTPException(status_code=422, detail="reporting_currency is not supported for rollups.")
+    try:
+        tree = _store(request).create(payload.iter_entries(), payload.report_label, payload.as_of)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return _page(tree, [], depth, 0, limit, status_code=201)
+
+
+@router.get(
+    "/rollups/{rollup_id}",
+    response_model=SummaryRollupPage,
+    summary="Page through a subtree of a built rollup",
+)
+def get_rollup(
+    rollup_id: str,
+    request: Request,
+    path: List[str] = Query(
+        default=[],
+        description="Series, then model, then label of the node to expand (repeat the parameter per level).",
+    ),
+    depth: int = Query(1, ge=0, le=MAX_DEPTH),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=10_000),
+) -> Response:
+    tree = _store(request).get(rollup_id)
+    if tree is None:
+        raise HTTPException(status_code=404, detail=f"Rollup '{rollup_id}' not found.")
+    return _page(tree, path, depth, offset, limit)
+
+
+@router.delete("/rollups/{rollup_id}", status_code=204, summary="Discard a rollup")
+def delete_rollup(rollup_id: str, request: Request) -> Response:
+    if not _store(request).delete(rollup_id):
+        raise HTTPException(status_code=404, detail=f"Rollup '{rollup_id}' not found.")
+    return Response(status_code=204)
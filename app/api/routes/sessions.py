@@ -0,0 +1,112 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+
+from ..codec import decode_json_body, json_request_body
+from ..responses import model_response
+from ...schedules import SCHEDULE_MODE_CONTEXT, ScheduleMode
+from ...schemas import (
+    SummaryEntry,
+    SummaryReportRequest,
+    SummaryReportResponse,
+    SummarySessionDigest,
+    SummarySessionUpdate,
+)
+from ...sessions import ReportSession, SessionStore
+
+router = APIRouter()
+
+
+def _store(request: Request) -> SessionStore:
+    return request.app.state.sessions
+
+
+def _get_session(request: Request, session_id: str) -> ReportSession:
+    session = _store(request).get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Report session '{session_id}' not found.")
+    return session
+
+
+@router.post(
+    "/sessions",
+    status_code=201,
+    response_model=SummarySessionDigest,
+    summary="Start an incrementally updatable report session",
+    openapi_extra=json_request_body(SummaryReportRequest),
+)
+async def create_report_session(request: Request) -> Response:
+    """Aggregate the outputs once and keep them keyed by (model_name, label) for later updates."""
+    body = await request.body()
+    return await run_in_threadpool(_create_report_session, request, body)
+
+
+def _create_report_session(request: Request, body: bytes) -> Response:
+    payload = decode_json_body(SummaryReportRequest, body)
+    if payload.reporting_currency is not None:
+        raise HTTPException(status_code=422, detail="reporting_currency is not supported for report sessions.")
+    if payload.top_k or payload.quantiles:
+        # Sketches cannot forget values, so they cannot follow replacements and removals.
+        raise HTTPException(status_code=422, detail="top_k and quantiles are not supported for report sessions.")
+    try:
+        session = _store(request).create(payload.iter_entries(), payload.report_label, payload.as_of)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return model_response(session.digest(), status_code=201)
+
+
+@router.get(
+    "/sessions/{session_id}",
+    response_model=SummaryReportResponse,
+    summary="Render the current state of a report session",
+)
+def get_report_session(session_id: str, request: Request, schedule_mode: ScheduleMode = "rows") -> Response:
+    session = _get_session(request, session_id)
+    with session.lock:
+        report = session.report()
+    return model_response(report, context={SCHEDULE_MODE_CONTEXT: schedule_mode})
+
+
+@router.patch(
+    "/sessions/{session_id}",
+    response_model=SummarySessionDigest,
+    summary="Replace, add or remove individual model outputs in a report session",
+    openapi_extra=json_request_body(SummarySessionUpdate),
+)
+async def update_report_session(session_id: str, request: Request) -> Response:
+    """Only the affected series aggregates and the overall total are updated."""
+    body = await request.body()
+    return await run_in_threadpool(_update_report_session, request, session_id, body)
+
+
+def _update_report_session(request: Request, session_id: str, body: bytes) -> Response:
+    session = _get_session(request, session_id)
+    update = decode_json_body(SummarySessionUpdate, body)
+    try:
+        entries = [
+            SummaryEntry.from_model_output(item.model_name, item.payload, currency=item.currency)
+            for item in update.upserts
+        ]
+        # Keyed before the session is touched, so a bad upsert cannot leave it half updated.
+        keys = [ReportSession.key_for(entry) for entry in entries]
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    with session.lock:
+        missing = [key for key in update.removals if (key.model_name, key.label) not in session]
+        if not missing:
+            for key in update.removals:
+                session.remove(key.model_name, key.label)
+            for entry, key in zip(entries, keys):
+                session.upsert(entry, key)
+            digest = session.digest()
+    if missing:
+        names = ", ".join(f"{key.model_name}/{key.label}" for key in missing)
+        raise HTTPException(status_code=404, detail=f"Model outputs not found in session: {names}.")
+    return model_response(digest)
+
+
+@router.delete("/sessions/{session_id}", status_code=204, summary="Discard a report session")
+def delete_report_session(session_id: str, request: Request) -> Response:
+    if not _store(request).delete(session_id):
+        raise HTTPException(status_code=404, detail=f"Report session '{session_id}' not found.")
+    return Response(status_code=204)
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Iterator, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+
+from ..responses import model_response
+from ...schemas import SummaryReportResponse, SummaryStoredHeadlineList, SummaryStoredReportList
+from ...store import ReportSnapshot, ReportStore
+
+router = APIRouter()
+
+
+def _store(request: Request) -> ReportStore:
+    store = request.app.state.report_store
+    if store is None:
+        raise HTTPException(status_code=404, detail="The report store is not enabled (set SEBIT_SUMMARY_STORE_PATH).")
+    return store
+
+
+def _replay(snapshot: ReportSnapshot) -> Iterator[bytes]:
+    try:
+        yield from snapshot.iter_report_json()
+    finally:
+        snapshot.close()
+
+
+@router.get(
+    "/store/reports",
+    response_model=SummaryStoredReportList,
+    summary="List persisted reports",
+)
+def list_stored_reports(
+    request: Request,
+    as_of_from: Optional[datetime] = None,
+    as_of_to: Optional[datetime] = None,
+    report_label: Optional[str] = None,
+) -> Response:
+    """Reports whose ``as_of`` (or storage time when unset) falls inside the range."""
+    reports = _store(request).reports(as_of_from, as_of_to, report_label)
+    return model_response(SummaryStoredReportList(reports=reports))
+
+
+@router.get(
+    "/store/reports/{report_id}",
+    response_model=SummaryReportResponse,
+    summary="Replay a persisted report",
+)
+def get_stored_report(report_id: str, request: Request) -> Response:
+    """Stream the report back from its memory-mapped snapshot, exactly as it was returned."""
+    store = _store(request)
+    record = store.get(report_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Stored report '{report_id}' not found.")
+    return StreamingResponse(_replay(store.open(record)), media_type="application/json")
+
+
+@router.get(
+    "/store/headlines",
+    response_model=SummaryStoredHeadlineList,
+    summary="Query headline amounts across persisted reports",
+)
+def query_stored_headlines(
+    request: Request,
+    model: Optional[str] = None,
+    series: Optional[str] = None,
+    as_of_from: Optional[datetime] = None,
+    as_of_to: Optional[datetime] = None,
+    limit: int = Query(default=10_000, ge=1, le=1_000_000),
+) -> Response:
+    """Scan only the code and headline columns of each matching snapshot; details are never read."""
+    headlines = _store(request).headlines(model, series, as_of_from, as_of_to, limit)
+    return model_response(SummaryStoredHeadlineList(headlines=headlines))
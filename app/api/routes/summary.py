@@ -1,16 +1,174 @@
-from fastapi import APIRouter
+import json
+from datetime import datetime
+from typing import List, Optional
 
-from ...schemas import SummaryReportRequest, SummaryReportResponse
-from ...services import build_summary_report
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from starlette.datastructures import State
+
+from ..caching import CachedReportRoute
+from ..codec import decode_json_body, json_request_body
+from ..responses import model_response
+from ...batch import encode_batch_response
+from ...history import HistoryIndex
+from ...metrics import MetricsRegistry, stage
+from ...schemas import (
+    SummaryBatchResponse,
+    SummaryReportDigest,
+    SummaryReportRequest,
+    SummaryReportResponse,
+)
+from ...services import (
+    NdjsonReportBuilder,
+    build_summary_report,
+    iter_summary_report_json,
+    serialization_context,
+)
+from ...store import ReportStore, encode_report, report_json
 
 router = APIRouter()
+cached_router = APIRouter(route_class=CachedReportRoute)
 
 
-@router.post(
+def _render_summary_report(body: bytes, stream: bool, state: State) -> Response:
+    metrics: MetricsRegistry = state.metrics
+    timer = metrics.timer()
+    # JSON parsing and validation happen in the same pydantic-core pass.
+    with stage(timer, "validate"):
+        payload = decode_json_body(SummaryReportRequest, body)
+
+    try:
+        if stream:
+            chunks = iter_summary_report_json(payload, rates=state.fx_rates)
+        else:
+            report = build_summary_report(payload, timer=timer, rates=state.fx_rates)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    if stream:
+        metrics.record(timer, entries=payload.entry_count(), request_bytes=len(body))
+        headers = {"Server-Timing": timer.server_timing()} if timer and metrics.server_timing else None
+        return StreamingResponse(chunks, media_type="application/json", headers=headers)
+
+    context = serialization_context(payload)
+    store: Optional[ReportStore] = state.report_store
+    with stage(timer, "serialize"):
+        if store is None:
+            content = report.model_dump_json(context=context).encode()
+        else:
+            # The snapshot reuses the details encoded for the response.
+            encoding = encode_report(report, context)
+            content = report_json(report, encoding)
+    headers = {}
+    received_at = None
+    if store is not None:
+        with stage(timer, "store"):
+            record = store.append(report, encoding=encoding)
+        headers["X-Report-Id"] = record.report_id
+        received_at = record.stored_at
+    history: Optional[HistoryIndex] = state.history
+    if history is not None:
+        with stage(timer, "history"):
+            history.record_report(report, received_at)
+    metrics.record(timer, entries=report.total_models, request_bytes=len(body))
+    if timer and metrics.server_timing:
+        headers["Server-Timing"] = timer.server_timing()
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@cached_router.post(
     "/report",
     response_model=SummaryReportResponse,
     summary="Aggregate SEBIT model outputs for reporting",
+    openapi_extra=json_request_body(SummaryReportRequest),
+)
+async def create_summary_report(request: Request, stream: bool = False) -> Response:
+    """Group multiple SEBIT model outputs into a series-based summary payload.
+
+    With ``stream=true`` the header and series summary are sent first and the
+    entries are encoded and flushed incrementally. The raw body is validated
+    straight from bytes (see ``decode_json_body``). When the report store is
+    enabled, buffered reports are persisted and their id returned in ``X-Report-Id``;
+    streamed reports, batches and jobs are not stored.
+    """
+    body = await request.body()
+    return await run_in_threadpool(_render_summary_report, body, stream, request.app.state)
+
+
+@router.post(
+    "/report/stream",
+    response_model=SummaryReportDigest,
+    summary="Aggregate a newline-delimited stream of SEBIT model outputs",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"$ref": "#/components/schemas/SummaryModelOutput"},
+                }
+            },
+        }
+    },
 )
-def create_summary_report(payload: SummaryReportRequest) -> SummaryReportResponse:
-    """Group multiple SEBIT model outputs into a series-based summary payload."""
-    return build_summary_report(payload)
+async def stream_summary_report(
+    request: Request,
+    report_label: Optional[str] = None,
+    as_of: Optional[datetime] = None,
+    top_k: int = Query(0, ge=0, le=1000),
+    quantiles: List[float] = Query(default=[]),
+) -> Response:
+    """Fold one SummaryModelOutput per line into series totals as the body arrives."""
+    if any(not 0.0 <= fraction <= 1.0 for fraction in quantiles):
+        raise HTTPException(status_code=422, detail="quantiles must lie between 0 and 1.")
+    builder = NdjsonReportBuilder(top_k, quantiles)
+    try:
+        async for chunk in request.stream():
+            if chunk:
+                await run_in_threadpool(builder.feed, chunk)
+        builder.close()
+        digest = builder.digest(report_label, as_of)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return model_response(digest)
+
+
+@router.post(
+    "/reports:batch",
+    response_model=SummaryBatchResponse,
+    summary="Aggregate many independent reports in parallel",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/SummaryReportRequest"},
+                    }
+                }
+            },
+        }
+    },
+)
+async def create_summary_reports_batch(request: Request) -> Response:
+    """Build one report per request body on a process pool; results keep the submitted order."""
+    try:
+        documents = await run_in_threadpool(json.loads, await request.body())
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=f"Invalid JSON body: {exc}") from exc
+    if not isinstance(documents, list) or not documents:
+        raise HTTPException(status_code=422, detail="Expected a non-empty JSON array of report requests.")
+    outcomes = await request.app.state.batch_executor.run(documents)
+    return Response(content=encode_batch_response(outcomes), media_type="application/json")
+
+
+@router.get("/cache", summary="Report cache statistics")
+def report_cache_stats(request: Request) -> dict:
+    cache = request.app.state.report_cache
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+router.include_router(cached_router)
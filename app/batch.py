@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from .fx import RateCache
+from .registry import RegistrySpec, activate
+from .schemas import MODEL_REGISTRY, SummaryReportRequest
+from .services import build_summary_report, serialization_context
+
+# (succeeded, encoded report or encoded error list)
+BatchOutcome = Tuple[bool, bytes]
+
+
+def available_cores() -> int:
+    """CPUs this process may use: its affinity, capped by a cgroup v2 CPU quota."""
+    if hasattr(os, "sched_getaffinity"):
+        cores = len(os.sched_getaffinity(0)) or 1
+    else:
+        cores = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as handle:
+            quota, period = handle.read().split()
+    except (OSError, ValueError):
+        return cores
+    if quota == "max":
+        return cores
+    return max(1, min(cores, int(quota) // int(period)))
+
+
+def render_report(
+    document: Any, rates: Optional[RateCache] = None, registry: Optional[RegistrySpec] = None
+) -> BatchOutcome:
+    """Validate, aggregate and encode one report; executed inside pool workers.
+
+    ``document`` is either decoded JSON or the raw request body bytes.
+    ``registry`` is the submitting process's registry spec, activated first
+    because pool workers start with the built-in models only.
+    """
+    if registry is not None:
+        activate(registry)
+    try:
+        if isinstance(document, bytes):
+            payload = SummaryReportRequest.model_validate_json(document)
+        else:
+            payload = SummaryReportRequest.model_validate(document)
+        report = build_summary_report(payload, rates=rates)
+    except ValidationError as exc:
+        return False, exc.json(include_url=False).encode()
+    except ValueError as exc:
+        return False, json.dumps([{"type": "value_error", "loc": [], "msg": str(exc)}]).encode()
+    return True, report.model_dump_json(context=serialization_context(payload)).encode()
+
+
+def encode_batch_response(outcomes: Sequence[BatchOutcome]) -> bytes:
+    results = []
+    for index, (succeeded, body) in enumerate(outcomes):
+        if succeeded:
+            results.append(b'{"index":%d,"status":"ok","report":%s}' % (index, body))
+        else:
+            results.append(b'{"index":%d,"status":"error","errors":%s}' % (index, body))
+    return b'{"results":[' + b",".join(results) + b"]}"
+
+
+class ReportBatchExecutor:
+    """Runs ``render_report`` for many reports on a lazily started process pool.
+
+    Validation and aggregation are CPU-bound, so separate processes let a batch
+    scale with the available cores instead of sharing one interpreter.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, rates: Optional[RateCache] = None) -> None:
+        self.max_workers = max_workers or available_cores()
+        self.rates = rates
+        self._pool: Optional[Executor] = None
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def run(self, documents: Sequence[Any]) -> List[BatchOutcome]:
+        loop = asyncio.get_running_loop()
+        if len(documents) < 2 or self.max_workers < 2:
+            return await loop.run_in_executor(None, lambda: [render_report(item, self.rates) for item in documents])
+        executor = self._executor()
+        registry = MODEL_REGISTRY.spec
+        return list(
+            await asyncio.gather(
+                *(loop.run_in_executor(executor, render_report, item, self.rates, registry) for item in documents)
+            )
+        )
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
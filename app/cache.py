@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+
+def body_digest(body: bytes, scope: str = "") -> str:
+    """Digest of the exact request bytes; cheap enough to check before parsing."""
+    digest = hashlib.sha256(scope.encode())
+    digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def canonical_digest(body: bytes, scope: str = "") -> Optional[str]:
+    """Digest of the JSON document with sorted keys and no insignificant whitespace.
+
+    Returns ``None`` when the body is not valid JSON, or holds strings (such as
+    lone surrogates) that cannot be encoded as UTF-8; such requests are never cached.
+    """
+    try:
+        document = json.loads(body)
+        canonical = json.dumps(document, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+    except (ValueError, UnicodeEncodeError):
+        return None
+    return body_digest(canonical, scope)
+
+
+@dataclass(frozen=True)
+class CachedReport:
+    etag: str
+    body: bytes
+    media_type: str
+    expires_at: Optional[float]
+    # Response headers replayed on every hit (e.g. X-Report-Id).
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+class ReportCache:
+    """LRU cache of pre-encoded report responses bounded by entry count and bytes.
+
+    Entries are stored under a digest of the request body. When that is the
+    canonical digest, digests of the raw bytes are kept as aliases so
+    byte-identical repeats skip JSON parsing.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedReport]" = OrderedDict()
+        self._aliases: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[CachedReport]:
+        with self._lock:
+            key = self._aliases.get(key, key)
+            cached = self._entries.get(key)
+            if cached is not None and cached.expires_at is not None and cached.expires_at <= self._clock():
+                self._remove(key)
+                cached = None
+            if cached is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cached
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        media_type: str = "application/json",
+        headers: Tuple[Tuple[str, str], ...] = (),
+    ) -> CachedReport:
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds else None
+        cached = CachedReport(
+            etag=f'"{key[:32]}"', body=body, media_type=media_type, expires_at=expires_at, headers=headers
+        )
+        if len(body) > self.max_bytes or self.max_entries <= 0:
+            return cached
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = cached
+            self._bytes += len(body)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return cached
+
+    def alias(self, alias: str, key: str) -> None:
+        if alias == key:
+            return
+        with self._lock:
+            if key not in self._entries:
+                return
+            self._aliases[alias] = key
+            self._aliases.move_to_end(alias)
+            # Aliases are tiny but still bounded; stale ones simply miss.
+            while len(self._aliases) > 4 * self.max_entries:
+                self._aliases.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        cached = self._entries.pop(key)
+        self._bytes -= len(cached.body)
+
+
+class FileReportCache:
+    """``ReportCache`` kept in a directory so every worker process on a host shares it.
+
+    Each entry is one file named after its key: a JSON header line (ETag, media
+    type, expiry, replayed headers) followed by the encoded body. Entries are
+    written to a temporary file and moved into place with ``os.replace``, so
+    readers never see a partial entry. A hit touches the file's mtime, and
+    eviction removes the least recently touched files. Point ``path`` at a tmpfs
+    such as ``/dev/shm`` to keep the entries in shared memory.
+
+    Raw-body aliases and the hit/miss/eviction counters are per process.
+    """
+
+    _SUFFIX = ".entry"
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        max_entries: int = 128,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = os.fspath(path)
+        os.makedirs(self.path, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._aliases: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _file(self, key: str) -> str:
+        return os.path.join(self.path, key + self._SUFFIX)
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[CachedReport]:
+        with self._lock:
+            key = self._aliases.get(key, key)
+        path = self._file(key)
+        cached = None
+        try:
+            with open(path, "rb") as handle:
+                header = json.loads(handle.readline())
+                body = handle.read()
+        except (OSError, ValueError):
+            pass
+        else:
+            if header["expires_at"] is not None and header["expires_at"] <= self._clock():
+                self._unlink(path)
+            else:
+                cached = CachedReport(
+                    etag=header["etag"],
+                    body=body,
+                    media_type=header["media_type"],
+                    expires_at=header["expires_at"],
+                    headers=tuple(tuple(item) for item in header["headers"]),
+                )
+        with self._lock:
+            if cached is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cached
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        media_type: str = "application/json",
+        headers: Tuple[Tuple[str, str], ...] = (),
+    ) -> CachedReport:
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds else None
+        cached = CachedReport(
+            etag=f'"{key[:32]}"', body=body, media_type=media_type, expires_at=expires_at, headers=headers
+        )
+        if len(body) > self.max_bytes or self.max_entries <= 0:
+            return cached
+        header = {"etag": cached.etag, "media_type": media_type, "expires_at": expires_at, "headers": headers}
+        path = self._file(key)
+        temporary = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as handle:
+            handle.write(json.dumps(header).encode() + b"\n")
+            handle.write(body)
+        os.replace(temporary, path)
+        self._evict()
+        return cached
+
+    def alias(self, alias: str, key: str) -> None:
+        if alias == key:
+            return
+        with self._lock:
+            self._aliases[alias] = key
+            self._aliases.move_to_end(alias)
+            while len(self._aliases) > 4 * self.max_entries:
+                self._aliases.popitem(last=False)
+
+    def clear(self) -> None:
+        for _, _, path in self._scan():
+            self._unlink(path)
+        with self._lock:
+            self._aliases.clear()
+
+    def stats(self) -> Dict[str, int]:
+        files = self._scan()
+        with self._lock:
+            return {
+                "entries": len(files),
+                "bytes": sum(size for _, size, _ in files),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _scan(self) -> List[Tuple[int, int, str]]:
+        """``(mtime_ns, file size, path)`` of every entry, least recently used first."""
+        files = []
+        with os.scandir(self.path) as listing:
+            for item in listing:
+                if not item.name.endswith(self._SUFFIX):
+                    continue
+                try:
+                    info = item.stat()
+                except OSError:
+                    continue
+                files.append((info.st_mtime_ns, info.st_size, item.path))
+        files.sort()
+        return files
+
+    def _evict(self) -> None:
+        files = self._scan()
+        count, total = len(files), sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            if self._unlink(path):
+                with self._lock:
+                    self.evictions += 1
+            count, total = count - 1, total - size
+
+    @staticmethod
+    def _unlink(path: str) -> bool:
+        try:
+            os.unlink(path)
+        except OSError:  # already removed by another worker
+            return False
+        return True
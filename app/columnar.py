@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import importlib.util
+import math
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from .aggregation import series_aggregate
+from .schemas import SummaryEntry, SummarySeriesAggregate
+
+# Reports with at least this many entries use the columnar engine when numpy is installed.
+COLUMNAR_THRESHOLD = 50_000
+
+
+@lru_cache(maxsize=None)
+def columnar_available() -> bool:
+    # Only look numpy up: importing it costs about 100 ms of cold start and
+    # is paid by the first report that actually reaches the threshold.
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _numpy() -> Any:
+    import numpy
+
+    return numpy
+
+
+class ColumnarAccumulator:
+    """Collects entries as typed columns and reduces them with grouped numpy operations.
+
+    Drop-in replacement for ``ReportAccumulator``: series and models are stored as
+    categorical codes (assigned in first-seen order) next to a float64 headline
+    column, and the aggregates are identical to the pure-Python engine.
+    """
+
+    def __init__(self) -> None:
+        if not columnar_available():
+            raise RuntimeError("The columnar summary engine requires numpy to be installed.")
+        self._series_codes: Dict[str, int] = {}
+        self._model_codes: Dict[str, int] = {}
+        self._series = array("i")
+        self._models = array("i")
+        self._amounts = array("d")
+        self._reduced: Optional[Tuple[float, List[SummarySeriesAggregate]]] = None
+
+    @property
+    def count(self) -> int:
+        return len(self._amounts)
+
+    def add(self, entry: SummaryEntry) -> None:
+        series_code = self._series_codes.get(entry.series)
+        if series_code is None:
+            series_code = self._series_codes[entry.series] = len(self._series_codes)
+        model_code = self._model_codes.get(entry.model)
+        if model_code is None:
+            model_code = self._model_codes[entry.model] = len(self._model_codes)
+        self._series.append(series_code)
+        self._models.append(model_code)
+        self._amounts.append(entry.headline_amount)
+        self._reduced = None
+
+    @property
+    def overall_total(self) -> float:
+        return self._reduce()[0]
+
+    def series_summary(self) -> List[SummarySeriesAggregate]:
+        return self._reduce()[1]
+
+    def _reduce(self) -> Tuple[float, List[SummarySeriesAggregate]]:
+        if self._reduced is not None:
+            return self._reduced
+        if not self._amounts:
+            self._reduced = (0.0, [])
+            return self._reduced
+
+        np = _numpy()
+        series = np.frombuffer(self._series, dtype=np.intc)
+        models = np.frombuffer(self._models, dtype=np.intc)
+        amounts = np.frombuffer(self._amounts, dtype=np.float64)
+
+        counts = np.bincount(series, minlength=len(self._series_codes))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ends = starts + counts
+
+        # lexsort is stable, so ties resolve to the first entry seen, like max()/min().
+        top = np.lexsort((-amounts, series))[starts]
+        bottom = np.lexsort((amounts, series))[starts]
+        grouped = amounts[np.argsort(series, kind="stable")].tolist()
+
+        series_names = list(self._series_codes)
+        model_names = list(self._model_codes)
+        summary = []
+        for code, name in enumerate(series_names):
+            top_index = int(top[code])
+            bottom_index = int(bottom[code])
+            summary.append(
+                series_aggregate(
+                    name,
+                    int(counts[code]),
+                    math.fsum(grouped[starts[code] : ends[code]]),
+                    float(amounts[bottom_index]),
+                    float(amounts[top_index]),
+                    model_names[models[top_index]],
+                    model_names[models[bottom_index]],
+                )
+            )
+
+        self._reduced = (math.fsum(grouped), summary)
+        return self._reduced
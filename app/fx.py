@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import math
+import threading
+from datetime import date, datetime
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence, Tuple, Union
+
+from .aggregation import ReportAccumulator, SeriesStats, StatsAccumulator, series_aggregate
+from .columnar import COLUMNAR_THRESHOLD, columnar_available
+from .schemas import SummaryCurrencyBreakdown, SummaryEntry, SummaryEntryResult, SummarySeriesAggregate
+
+
+class FxRateError(ValueError):
+    pass
+
+
+class RateProvider(Protocol):
+    """Source of exchange rates: units of ``base`` per one unit of ``currency``."""
+
+    base: str
+
+    def rate(self, currency: str, on: Optional[date]) -> Optional[float]:
+        ...
+
+
+class StaticRateProvider:
+    """Rates from an in-memory table, optionally with dated tables.
+
+    ``rates`` applies when no dated table is on or before the requested day.
+    Rates are expressed in units of ``base`` per unit of each currency.
+    """
+
+    def __init__(
+        self,
+        base: str,
+        rates: Optional[Mapping[str, float]] = None,
+        dated: Optional[Mapping[date, Mapping[str, float]]] = None,
+    ) -> None:
+        self.base = base
+        self.rates = dict(rates or {})
+        self._days: List[date] = sorted(dated or {})
+        self._dated = {day: dict(table) for day, table in (dated or {}).items()}
+
+    @classmethod
+    def from_file(cls, path: str) -> "StaticRateProvider":
+        """Load ``{"base": "KRW", "rates": {...}, "dated": {"2025-07-01": {...}}}``."""
+        with open(path) as handle:
+            document = json.load(handle)
+        dated = {date.fromisoformat(day): table for day, table in document.get("dated", {}).items()}
+        return cls(document["base"], document.get("rates"), dated)
+
+    def rate(self, currency: str, on: Optional[date]) -> Optional[float]:
+        if currency == self.base:
+            return 1.0
+        if on is not None and self._days:
+            # Walk back from the latest table on or before ``on``.
+            for day in reversed(self._days):
+                if day <= on and currency in self._dated[day]:
+                    return self._dated[day][currency]
+        return self.rates.get(currency)
+
+
+class RateCache:
+    """Memoises conversion rates per ``(currency, reporting_currency, day)``."""
+
+    def __init__(self, provider: RateProvider) -> None:
+        self.provider = provider
+        self._rates: Dict[Tuple[str, str, Optional[date]], float] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"provider": self.provider}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["provider"])  # type: ignore[misc]
+
+    def rate(self, currency: str, reporting_currency: str, as_of: Optional[datetime] = None) -> float:
+        if currency == reporting_currency:
+            return 1.0
+        day = as_of.date() if as_of is not None else None
+        key = (currency, reporting_currency, day)
+        cached = self._rates.get(key)
+        if cached is not None:
+            return cached
+        source = self.provider.rate(currency, day)
+        target = self.provider.rate(reporting_currency, day)
+        if not source or not target:
+            missing = currency if not source else reporting_currency
+            when = f" as of {day.isoformat()}" if day else ""
+            raise FxRateError(f"No FX rate for {missing} against {self.provider.base}{when}.")
+        with self._lock:
+            self._rates[key] = source / target
+        return source / target
+
+
+def resolve_rates(
+    currencies: Sequence[Optional[str]],
+    reporting_currency: str,
+    rates: Optional[RateCache],
+    as_of: Optional[datetime] = None,
+) -> Dict[Optional[str], float]:
+    """One rate per distinct currency; entries without a currency are taken as reporting currency."""
+    resolved: Dict[Optional[str], float] = {}
+    for currency in currencies:
+        if currency is None or currency == reporting_currency:
+            resolved[currency] = 1.0
+        elif rates is None:
+            raise FxRateError(
+                f"Cannot convert {currency} to {reporting_currency}: no FX rate provider is configured."
+            )
+        else:
+            resolved[currency] = rates.rate(currency, reporting_currency, as_of)
+    return resolved
+
+
+class CurrencyAccumulator:
+    """Aggregates entries per currency, then converts the aggregates.
+
+    The aggregation loop only routes each entry to its currency's
+    ``ReportAccumulator``. Rates are applied afterwards, once per currency
+    and series. Rates are positive, so a converted minimum or maximum is the
+    converted minimum or maximum of one currency. Top-K lists and quantile
+    sketches are rescaled per currency and merged.
+    """
+
+    def __init__(self, top_k: int = 0, quantiles: Sequence[float] = ()) -> None:
+        self.top_k = top_k
+        self.quantiles = tuple(quantiles)
+        self.by_currency: Dict[Optional[str], Union[ReportAccumulator, StatsAccumulator]] = {}
+        self.count = 0
+        self.reporting_currency: Optional[str] = None
+        self.rates: Dict[Optional[str], float] = {}
+        self._series_order: Dict[str, None] = {}
+
+    def add(self, entry: SummaryEntry) -> None:
+        accumulator = self.by_currency.get(entry.currency)
+        if accumulator is None:
+            accumulator = self.by_currency[entry.currency] = (
+                StatsAccumulator(self.top_k, self.quantiles) if self.top_k or self.quantiles else ReportAccumulator()
+            )
+        if entry.series not in accumulator.series:
+            self._series_order[entry.series] = None
+        accumulator.add(entry)
+        self.count += 1
+
+    def convert(self, reporting_currency: str, rates: Optional[RateCache], as_of: Optional[datetime] = None) -> None:
+        self.reporting_currency = reporting_currency
+        self.rates = resolve_rates(list(self.by_currency), reporting_currency, rates, as_of)
+
+    @property
+    def overall_total(self) -> float:
+        return math.fsum(
+            self.rates[currency] * accumulator.overall_total for currency, accumulator in self.by_currency.items()
+        )
+
+    def series_summary(self) -> List[SummarySeriesAggregate]:
+        summary = []
+        for series in self._series_order:
+            parts = [
+                (self.rates[currency], accumulator.series[series])
+                for currency, accumulator in self.by_currency.items()
+                if series in accumulator.series
+            ]
+            rate, first = parts[0]
+            maximum, top_model = rate * first.maximum, first.top_model
+            minimum, bottom_model = rate * first.minimum, first.bottom_model
+            for rate, part in parts[1:]:
+                if rate * part.maximum > maximum:
+                    maximum, top_model = rate * part.maximum, part.top_model
+                if rate * part.minimum < minimum:
+                    minimum, bottom_model = rate * part.minimum, part.bottom_model
+            aggregate = series_aggregate(
+                series,
+                sum(part.count for _, part in parts),
+                math.fsum(rate * part.total.value for rate, part in parts),
+                minimum,
+                maximum,
+                top_model,
+                bottom_model,
+            )
+            if self.top_k or self.quantiles:
+                stats = SeriesStats(self.top_k, bool(self.quantiles))
+                for currency, accumulator in self.by_currency.items():
+                    if series in accumulator.series:
+                        stats.merge(accumulator.stats[series], self.rates[currency])
+                aggregate = stats.describe(aggregate, self.quantiles)
+            summary.append(aggregate)
+        return summary
+
+    def currency_breakdown(self) -> List[SummaryCurrencyBreakdown]:
+        return [
+            SummaryCurrencyBreakdown(
+                currency=currency,
+                rate=self.rates[currency],
+                total_models=accumulator.count,
+                headline_total=round(accumulator.overall_total, 2),
+                series_summary=accumulator.series_summary(),
+            )
+            for currency, accumulator in self.by_currency.items()
+        ]
+
+
+def reporting_amounts(
+    amounts: Sequence[float],
+    currencies: Sequence[Optional[str]],
+    rates: Mapping[Optional[str], float],
+) -> List[float]:
+    """``amounts`` converted at their currency's rate and rounded to cents.
+
+    Amounts are multiplied in one batch per currency, with numpy from
+    ``COLUMNAR_THRESHOLD`` amounts on when it is installed. Rounding stays
+    Python's ``round``, so both paths give identical results.
+    """
+    by_currency: Dict[Optional[str], List[int]] = {}
+    for index, currency in enumerate(currencies):
+        by_currency.setdefault(currency, []).append(index)
+    converted = [0.0] * len(amounts)
+    column = None
+    if len(amounts) >= COLUMNAR_THRESHOLD and columnar_available():
+        import numpy
+
+        column = numpy.asarray(amounts, dtype=numpy.float64)
+    for currency, indexes in by_currency.items():
+        rate = rates[currency]
+        if column is not None:
+            products = (column[indexes] * rate).tolist()
+        else:
+            products = [amounts[index] * rate for index in indexes]
+        for index, product in zip(indexes, products):
+            converted[index] = round(product, 2)
+    return converted
+
+
+def apply_reporting_amounts(
+    results: Sequence[SummaryEntryResult],
+    amounts: Sequence[float],
+    rates: Mapping[Optional[str], float],
+) -> None:
+    """Fill ``reporting_amount`` of built entry results from their unrounded headlines, after aggregation."""
+    converted = reporting_amounts(amounts, [result.currency for result in results], rates)
+    for result, amount in zip(results, converted):
+        result.__dict__["reporting_amount"] = amount
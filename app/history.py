@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from .aggregation import CompensatedSum
+from .schemas import (
+    SummaryHistoryPoint,
+    SummaryHistoryRolling,
+    SummaryHistoryRollup,
+    SummaryReportResponse,
+    registered_label,
+)
+
+if TYPE_CHECKING:
+    from .store import ReportStore
+
+HISTORY_PERIODS = ("day", "week", "month", "quarter")
+
+# (series, model, label)
+HistoryKey = Tuple[str, str, Optional[str]]
+
+
+def utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def period_key(moment: datetime, period: str) -> str:
+    if period == "day":
+        return moment.strftime("%Y-%m-%d")
+    if period == "week":
+        year, week, _ = moment.isocalendar()
+        return f"{year}-W{week:02d}"
+    if period == "month":
+        return moment.strftime("%Y-%m")
+    if period == "quarter":
+        return f"{moment.year}-Q{(moment.month - 1) // 3 + 1}"
+    raise ValueError(f"Unknown history period '{period}'; expected one of {', '.join(HISTORY_PERIODS)}.")
+
+
+class SnapshotTotal:
+    """Series headline total at one ``as_of``; exact under replacement."""
+
+    __slots__ = ("total", "entries")
+
+    def __init__(self) -> None:
+        self.total = CompensatedSum()
+        self.entries = 0
+
+
+class HistoryIndex:
+    """Time-indexed headlines keyed by ``(series, model, label, as_of)``.
+
+    Points per ``(series, model, label)`` are kept sorted by ``as_of`` for range
+    and latest lookups. Each write also updates the series total at that
+    ``as_of`` and rebuilds the rollup of the affected period only, so rollup
+    and rolling queries never touch raw points.
+    """
+
+    def __init__(self, period: str = "month") -> None:
+        period_key(datetime(2000, 1, 1), period)  # validate
+        self.period = period
+        self._lock = threading.RLock()
+        self._times: Dict[HistoryKey, List[datetime]] = {}
+        self._amounts: Dict[HistoryKey, List[float]] = {}
+        self._snapshots: Dict[str, Dict[str, Dict[datetime, SnapshotTotal]]] = defaultdict(dict)
+        self._rollups: Dict[str, Dict[str, SummaryHistoryRollup]] = defaultdict(dict)
+
+    def record_report(self, report: SummaryReportResponse, received_at: Optional[datetime] = None) -> None:
+        """Feed a built report; outputs sharing a ``(model, label)`` are summed.
+
+        Reports without ``as_of`` are recorded at ``received_at`` (default: now).
+        """
+        moment = report.as_of or received_at or datetime.now(timezone.utc)
+        amounts: Dict[HistoryKey, float] = {}
+        for entry in report.entries:
+            key = (entry.series, entry.model, registered_label(entry.model, entry.details))
+            amounts[key] = amounts.get(key, 0.0) + entry.headline_amount
+        self.record((key, moment, amount) for key, amount in amounts.items())
+
+    def record(self, points: Iterable[Tuple[HistoryKey, datetime, float]]) -> None:
+        with self._lock:
+            dirty: Set[Tuple[str, str]] = set()
+            for key, moment, amount in points:
+                moment = utc(moment)
+                period = period_key(moment, self.period)
+                series_snapshots = self._snapshots[key[0]].setdefault(period, {})
+                snapshot = series_snapshots.get(moment)
+                if snapshot is None:
+                    snapshot = series_snapshots[moment] = SnapshotTotal()
+
+                times = self._times.setdefault(key, [])
+                amounts = self._amounts.setdefault(key, [])
+                position = bisect.bisect_left(times, moment)
+                if position < len(times) and times[position] == moment:
+                    snapshot.total.add(-amounts[position])
+                    amounts[position] = amount
+                else:
+                    times.insert(position, moment)
+                    amounts.insert(position, amount)
+                    snapshot.entries += 1
+                snapshot.total.add(amount)
+                dirty.add((key[0], period))
+            for series, period in dirty:
+                self._rollups[series][period] = self._rollup(series, period)
+
+    def _rollup(self, series: str, period: str) -> SummaryHistoryRollup:
+        snapshots = sorted(self._snapshots[series][period].items())
+        totals = [snapshot.total.value for _, snapshot in snapshots]
+        return SummaryHistoryRollup(
+            series=series,
+            period=period,
+            snapshots=len(snapshots),
+            entries=sum(snapshot.entries for _, snapshot in snapshots),
+            opening_total=round(totals[0], 2),
+            closing_total=round(totals[-1], 2),
+            closing_as_of=snapshots[-1][0],
+            mean_total=round(sum(totals) / len(totals), 2),
+            min_total=round(min(totals), 2),
+            max_total=round(max(totals), 2),
+        )
+
+    def _keys(self, series: Optional[str], model: Optional[str], label: Optional[str]) -> List[HistoryKey]:
+        return [
+            key
+            for key in self._times
+            if (series is None or key[0] == series)
+            and (model is None or key[1] == model)
+            and (label is None or key[2] == label)
+        ]
+
+    def points(
+        self,
+        series: Optional[str] = None,
+        model: Optional[str] = None,
+        label: Optional[str] = None,
+        as_of_from: Optional[datetime] = None,
+        as_of_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[SummaryHistoryPoint]:
+        """Range scan, ordered by key and then ``as_of``."""
+        results: List[SummaryHistoryPoint] = []
+        with self._lock:
+            for key in self._keys(series, model, label):
+                times, amounts = self._times[key], self._amounts[key]
+                start = 0 if as_of_from is None else bisect.bisect_left(times, utc(as_of_from))
+                end = len(times) if as_of_to is None else bisect.bisect_right(times, utc(as_of_to))
+                for index in range(start, end):
+                    results.append(self._point(key, times[index], amounts[index]))
+                    if limit is not None and len(results) >= limit:
+                        return results
+        return results
+
+    def latest(
+        self,
+        series: Optional[str] = None,
+        model: Optional[str] = None,
+        label: Optional[str] = None,
+        at: Optional[datetime] = None,
+    ) -> List[SummaryHistoryPoint]:
+        """The most recent point at or before ``at`` for every matching key."""
+        results = []
+        with self._lock:
+            for key in self._keys(series, model, label):
+                times = self._times[key]
+                index = len(times) - 1 if at is None else bisect.bisect_right(times, utc(at)) - 1
+                if index >= 0:
+                    results.append(self._point(key, times[index], self._amounts[key][index]))
+        return results
+
+    def rollups(
+        self, series: str, period_from: Optional[str] = None, period_to: Optional[str] = None
+    ) -> List[SummaryHistoryRollup]:
+        with self._lock:
+            periods = sorted(self._rollups.get(series, {}).items())
+        return [
+            rollup
+            for period, rollup in periods
+            if (period_from is None or period >= period_from) and (period_to is None or period <= period_to)
+        ]
+
+    def rolling(
+        self,
+        series: str,
+        window: int = 3,
+        period_from: Optional[str] = None,
+        period_to: Optional[str] = None,
+    ) -> List[SummaryHistoryRolling]:
+        """Rolling mean/min/max of period closing totals over ``window`` periods."""
+        rollups = self.rollups(series)
+        closings = [rollup.closing_total for rollup in rollups]
+        results = []
+        for index, rollup in enumerate(rollups):
+            if (period_from is not None and rollup.period < period_from) or (
+                period_to is not None and rollup.period > period_to
+            ):
+                continue
+            values = closings[max(0, index - window + 1) : index + 1]
+            results.append(
+                SummaryHistoryRolling(
+                    series=series,
+                    period=rollup.period,
+                    closing_total=rollup.closing_total,
+                    window_periods=len(values),
+                    rolling_mean=round(sum(values) / len(values), 2),
+                    rolling_min=min(values),
+                    rolling_max=max(values),
+                    change=round(closings[index] - closings[index - 1], 2) if index else None,
+                )
+            )
+        return results
+
+    def load_store(self, store: "ReportStore") -> None:
+        """Rebuild the index from every snapshot in a report store."""
+        for record in store.reports():
+            with store.open(record) as snapshot:
+                amounts: Dict[HistoryKey, float] = {}
+                for index in range(snapshot.count):
+                    key = (
+                        snapshot.series[snapshot.series_codes[index]],
+                        snapshot.models[snapshot.model_codes[index]],
+                        snapshot.label(index),
+                    )
+                    amounts[key] = amounts.get(key, 0.0) + snapshot.headlines[index]
+            moment = record.as_of or record.stored_at
+            self.record((key, moment, amount) for key, amount in amounts.items())
+
+    @staticmethod
+    def _point(key: HistoryKey, moment: datetime, amount: float) -> SummaryHistoryPoint:
+        return SummaryHistoryPoint(series=key[0], model=key[1], label=key[2], as_of=moment, headline_amount=amount)
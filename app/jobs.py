@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import CancelledError, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from .batch import BatchOutcome, available_cores, render_report
+from .fx import RateCache
+from .schemas import MODEL_REGISTRY, JobStatus, SummaryJobStatus
+
+
+class JobQueueFull(Exception):
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Report job queue is full; retry in {retry_after}s.")
+        self.retry_after = retry_after
+
+
+class ReportJob:
+    __slots__ = ("job_id", "submitted_at", "finished_at", "future", "outcome", "waiters")
+
+    def __init__(self, job_id: str, future: "Future[BatchOutcome]") -> None:
+        self.job_id = job_id
+        self.submitted_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.future = future
+        self.outcome: Optional[BatchOutcome] = None
+        # Called once ``outcome`` is set (see ``ReportJobQueue.wait``).
+        self.waiters: List[Callable[[], None]] = []
+
+    @property
+    def status(self) -> JobStatus:
+        if self.outcome is not None:
+            return "succeeded" if self.outcome[0] else "failed"
+        return "running" if self.future.running() else "queued"
+
+    def to_status(self) -> SummaryJobStatus:
+        return SummaryJobStatus(
+            job_id=self.job_id,
+            status=self.status,
+            submitted_at=self.submitted_at,
+            finished_at=self.finished_at,
+        )
+
+    def encode(self) -> bytes:
+        """Status JSON with the already encoded report or errors spliced in."""
+        header = self.to_status().model_dump_json(exclude={"report", "errors"}).encode()
+        if self.outcome is None:
+            return header
+        succeeded, body = self.outcome
+        return header[:-1] + (b',"report":%s}' if succeeded else b',"errors":%s}') % body
+
+
+class ReportJobQueue:
+    """Bounded queue of report jobs aggregated off the request path.
+
+    At most ``capacity`` jobs are queued or running at once; further
+    submissions raise ``JobQueueFull`` with a ``Retry-After`` estimate instead
+    of waiting. Jobs run ``render_report`` on their own pool (a process pool
+    with two or more workers), so bursts never occupy the server's threadpool.
+    Finished jobs are kept for polling until ``retain`` newer ones finish.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        max_workers: Optional[int] = None,
+        retain: int = 1024,
+        rates: Optional[RateCache] = None,
+    ) -> None:
+        self.capacity = capacity
+        self.max_workers = max_workers or available_cores()
+        self.retain = retain
+        self.rates = rates
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, ReportJob] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._pending = 0
+        self._turnaround = 0.0
+        self._pool: Optional[Executor] = None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self.max_workers < 2:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-job")
+            else:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+        return self._pool
+
+    def retry_after(self) -> int:
+        # With the queue full a job waits about ``capacity`` service slots, so
+        # one slot frees roughly every turnaround / capacity seconds.
+        return max(1, math.ceil(self._turnaround / max(self.capacity, 1)))
+
+    def submit(self, body: bytes) -> ReportJob:
+        with self._lock:
+            if self._pending >= self.capacity:
+                raise JobQueueFull(self.retry_after())
+            self._pending += 1
+            try:
+                future = self._executor().submit(render_report, body, self.rates, MODEL_REGISTRY.spec)
+            except BaseException:
+                self._pending -= 1
+                raise
+            job = ReportJob(uuid.uuid4().hex, future)
+            self._jobs[job.job_id] = job
+        started = time.monotonic()
+        future.add_done_callback(lambda done: self._finish(job, done, time.monotonic() - started))
+        return job
+
+    def _finish(self, job: ReportJob, future: "Future[BatchOutcome]", elapsed: float) -> None:
+        try:
+            outcome = future.result()
+        except CancelledError:
+            outcome = _job_error("Report job was cancelled at shutdown.")
+        except Exception as exc:  # e.g. a crashed worker process
+            outcome = _job_error(f"Report job failed: {exc}")
+        with self._lock:
+            job.outcome = outcome
+            job.finished_at = datetime.now(timezone.utc)
+            self._pending -= 1
+            self._turnaround = elapsed if not self._turnaround else 0.8 * self._turnaround + 0.2 * elapsed
+            self._finished[job.job_id] = None
+            while len(self._finished) > self.retain:
+                expired, _ = self._finished.popitem(last=False)
+                self._jobs.pop(expired, None)
+            waiters, job.waiters = job.waiters, []
+        for waiter in waiters:
+            waiter()
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        return self._jobs.get(job_id)
+
+    async def wait(self, job: ReportJob, timeout: float) -> None:
+        """Long-poll: return once ``job`` finishes or ``timeout`` seconds pass."""
+        if timeout <= 0:
+            return
+        done = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def wake() -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(done.set)
+
+        with self._lock:
+            if job.outcome is not None:
+                return
+            job.waiters.append(wake)
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                if wake in job.waiters:
+                    job.waiters.remove(wake)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+def _job_error(message: str) -> BatchOutcome:
+    return False, json.dumps([{"type": "job_error", "loc": [], "msg": message}]).encode()
@@ -1,21 +1,155 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+
+from .api.codec import add_request_body_schemas
+from .api.routes.history import router as history_router
+from .api.routes.jobs import router as jobs_router
+from .api.routes.partials import router as partials_router
+from .api.routes.registry import router as registry_router
+from .api.routes.rollups import router as rollups_router
+from .api.routes.sessions import router as sessions_router
+from .api.routes.store import router as store_router
 from .api.routes.summary import router as summary_router
+from .batch import ReportBatchExecutor
+from .cache import FileReportCache, ReportCache
+from .fx import RateCache, StaticRateProvider
+from .history import HistoryIndex
+from .jobs import ReportJobQueue
+from .metrics import MetricsRegistry
+from .registry import RegistryLoader, RegistrySpecError
+from .rollups import RollupStore
+from .schemas import build_deferred_models
+from .sessions import SessionStore
+from .store import ReportStore
+from .settings import Settings
+
+
+logger = logging.getLogger(__name__)
+
 
+async def poll_registry(loader: RegistryLoader, interval: float) -> None:
+    """Reload the registry spec whenever its file changes."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            if await asyncio.to_thread(loader.refresh):
+                logger.info("Reloaded model registry from %s", loader.path)
+        except RegistrySpecError as exc:
+            logger.warning("Keeping the current model registry: %s", exc)
 
-def create_app() -> FastAPI:
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    settings = app.state.settings
+    poller = None
+    if app.state.registry is not None and settings.registry_poll_seconds > 0:
+        poller = asyncio.create_task(poll_registry(app.state.registry, settings.registry_poll_seconds))
+    yield
+    if poller is not None:
+        poller.cancel()
+    app.state.batch_executor.shutdown()
+    app.state.jobs.shutdown()
+    if app.state.report_store is not None:
+        app.state.report_store.close()
+
+
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    settings = settings or Settings.from_env()
     app = FastAPI(
         title="SEBIT Summary API",
         version="0.1.0",
         description="Aggregates SEBIT model outputs into financial reporting payloads.",
+        lifespan=lifespan,
     )
 
+    app.state.settings = settings
+    if not settings.fast_startup:
+        build_deferred_models()
+    app.state.report_cache = None
+    if settings.cache_enabled:
+        limits = dict(
+            max_entries=settings.cache_max_entries,
+            max_bytes=settings.cache_max_bytes,
+            ttl_seconds=settings.cache_ttl_seconds,
+        )
+        app.state.report_cache = (
+            FileReportCache(settings.cache_dir, **limits) if settings.cache_dir else ReportCache(**limits)
+        )
+    app.state.registry = None
+    if settings.registry_path:
+        cache = app.state.report_cache
+        # Cached reports were aggregated under the previous registry.
+        app.state.registry = RegistryLoader(settings.registry_path, on_change=cache.clear if cache is not None else None)
+        app.state.registry.load()
+    app.state.sessions = SessionStore(max_sessions=settings.session_max_count)
+    app.state.rollups = RollupStore(max_rollups=settings.rollup_max_count)
+    app.state.fx_rates = (
+        RateCache(StaticRateProvider.from_file(settings.fx_rates_path)) if settings.fx_rates_path else None
+    )
+    app.state.batch_executor = ReportBatchExecutor(
+        max_workers=settings.batch_workers or None, rates=app.state.fx_rates
+    )
+    app.state.jobs = ReportJobQueue(
+        capacity=settings.job_queue_size,
+        max_workers=settings.job_workers or None,
+        retain=settings.job_retention,
+        rates=app.state.fx_rates,
+    )
+    app.state.report_store = ReportStore(settings.store_path) if settings.store_path else None
+    app.state.history = HistoryIndex(settings.history_period) if settings.history_enabled else None
+    if app.state.history is not None and app.state.report_store is not None:
+        app.state.history.load_store(app.state.report_store)
+    app.state.metrics = MetricsRegistry(enabled=settings.metrics_enabled, server_timing=settings.server_timing)
+
     app.include_router(summary_router, prefix="/summary", tags=["Reporting"])
+    app.include_router(sessions_router, prefix="/summary", tags=["Report Sessions"])
+    app.include_router(partials_router, prefix="/summary", tags=["Report Partials"])
+    app.include_router(rollups_router, prefix="/summary", tags=["Report Rollups"])
+    app.include_router(jobs_router, prefix="/summary", tags=["Report Jobs"])
+    app.include_router(registry_router, prefix="/summary", tags=["Model Registry"])
+    app.include_router(store_router, prefix="/summary", tags=["Report Store"])
+    app.include_router(history_router, prefix="/summary", tags=["Report History"])
+
+    default_openapi = app.openapi
+
+    def openapi() -> dict:
+        if app.openapi_schema is None:
+            app.openapi_schema = add_request_body_schemas(default_openapi())
+        return app.openapi_schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
 
     @app.get("/health", tags=["Health"])
     def health_check() -> dict[str, str]:
         return {"status": "ok"}
 
+    @app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+    def metrics(request: Request) -> PlainTextResponse:
+        """Stage histograms, job queue depth and cache counters in the Prometheus text format."""
+        extra = {
+            "sebit_summary_jobs_pending": ("gauge", "Report jobs queued or running.", request.app.state.jobs.pending),
+        }
+        cache = request.app.state.report_cache
+        if cache is not None:
+            stats = cache.stats()
+            extra.update(
+                {
+                    "sebit_summary_report_cache_hits_total": ("counter", "Report cache hits.", stats["hits"]),
+                    "sebit_summary_report_cache_misses_total": ("counter", "Report cache misses.", stats["misses"]),
+                    "sebit_summary_report_cache_evictions_total": ("counter", "Report cache evictions.", stats["evictions"]),
+                    "sebit_summary_report_cache_entries": ("gauge", "Reports held in the cache.", stats["entries"]),
+                    "sebit_summary_report_cache_bytes": ("gauge", "Bytes held in the report cache.", stats["bytes"]),
+                }
+            )
+        return PlainTextResponse(
+            request.app.state.metrics.render(extra), media_type="text/plain; version=0.0.4"
+        )
+
     return app
 
 
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+ENTRY_COUNT_BUCKETS: Tuple[float, ...] = (1, 10, 50, 100, 500, 1_000, 5_000, 10_000, 100_000, 1_000_000)
+PAYLOAD_BYTES_BUCKETS: Tuple[float, ...] = tuple(float(1024 * 4**power) for power in range(11))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus exposition model."""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # Per-bucket counts, then the +Inf overflow, sum and count.
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 3)
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                bucket_labels = _format_labels(self.label_names, labels, f'le="{_format_number(bound)}"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {int(cumulative)}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_number(series[-2])}")
+            lines.append(f"{self.name}_count{label_text} {int(series[-1])}")
+        return lines
+
+
+class StageTimer:
+    """Accumulates per-stage durations for one request."""
+
+    __slots__ = ("stages", "models")
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, float] = {}
+        self.models: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def server_timing(self) -> str:
+        return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in self.stages.items())
+
+
+_NO_STAGE = nullcontext()
+
+
+def stage(timer: Optional[StageTimer], name: str) -> ContextManager[None]:
+    """Time a block on ``timer``; a shared no-op context when instrumentation is off."""
+    return _NO_STAGE if timer is None else timer.stage(name)
+
+
+def timed_chunks(chunks: Iterable[Sequence[Any]], timer: StageTimer) -> Iterator[Any]:
+    """Yield the entries of ``chunks``, charging the time spent producing each chunk to ``resolve``.
+
+    A chunk's time is split evenly across its entries and charged to their models.
+    """
+    iterator = iter(chunks)
+    clock = time.perf_counter
+    models = timer.models
+    while True:
+        started = clock()
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        elapsed = clock() - started
+        timer.add("resolve", elapsed)
+        if chunk:
+            share = elapsed / len(chunk)
+            for entry in chunk:
+                models[entry.model] = models.get(entry.model, 0.0) + share
+        yield from chunk
+
+
+class MetricsRegistry:
+    """Hot-path histograms for the report pipeline, rendered as Prometheus text."""
+
+    def __init__(self, enabled: bool = False, server_timing: bool = False) -> None:
+        self.enabled = enabled
+        self.server_timing = server_timing
+        self.stage_seconds = Histogram(
+            "sebit_summary_stage_seconds",
+            "Time spent per report pipeline stage.",
+            ("stage",),
+        )
+        self.model_resolve_seconds = Histogram(
+            "sebit_summary_model_resolve_seconds",
+            "Time spent converting one report's outputs of a model into entries.",
+            ("model",),
+        )
+        self.report_entries = Histogram(
+            "sebit_summary_report_entries",
+            "Entries per report request.",
+            buckets=ENTRY_COUNT_BUCKETS,
+        )
+        self.request_bytes = Histogram(
+            "sebit_summary_request_bytes",
+            "Size of report request bodies in bytes.",
+            buckets=PAYLOAD_BYTES_BUCKETS,
+        )
+
+    def timer(self) -> Optional[StageTimer]:
+        """A fresh timer per request, or ``None`` when nothing would consume it."""
+        return StageTimer() if self.enabled or self.server_timing else None
+
+    def record(
+        self,
+        timer: Optional[StageTimer],
+        entries: Optional[int] = None,
+        request_bytes: Optional[int] = None,
+    ) -> None:
+        if not self.enabled or timer is None:
+            return
+        for name, seconds in timer.stages.items():
+            self.stage_seconds.observe(seconds, name)
+        for model, seconds in timer.models.items():
+            self.model_resolve_seconds.observe(seconds, model)
+        if entries is not None:
+            self.report_entries.observe(entries)
+        if request_bytes is not None:
+            self.request_bytes.observe(request_bytes)
+
+    def render(self, extra: Optional[Dict[str, Tuple[str, str, float]]] = None) -> str:
+        """Prometheus text; ``extra`` maps metric name to (type, help, value)."""
+        lines: List[str] = []
+        if self.enabled:
+            for histogram in (self.stage_seconds, self.model_resolve_seconds, self.report_entries, self.request_bytes):
+                lines.extend(histogram.render())
+        for name, (kind, documentation, value) in (extra or {}).items():
+            lines.extend([f"# HELP {name} {documentation}", f"# TYPE {name} {kind}", f"{name} {_format_number(value)}"])
+        return "\n".join(lines) + "\n"
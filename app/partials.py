@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Iterable, Optional, Sequence, Union
+
+from .aggregation import ReportAccumulator, SeriesAccumulator, SeriesStats, StatsAccumulator
+from .schemas import (
+    SummaryEntry,
+    SummaryPartialReport,
+    SummaryPartialSeries,
+    SummaryPartialSketch,
+    SummarySeriesContributor,
+)
+from .services import DEFAULT_REPORT_LABEL
+from .sketches import KllSketch, TopK
+
+Accumulator = Union[ReportAccumulator, StatsAccumulator]
+
+
+def build_partial(
+    entries: Iterable[SummaryEntry],
+    report_label: Optional[str] = None,
+    as_of: Optional[datetime] = None,
+    top_k: int = 0,
+    quantiles: Sequence[float] = (),
+) -> SummaryPartialReport:
+    """Pre-aggregate one shard's entries into a partial that ``merge_partials`` can combine."""
+    accumulator: Accumulator = StatsAccumulator(top_k, quantiles) if top_k or quantiles else ReportAccumulator()
+    for entry in entries:
+        accumulator.add(entry)
+    return to_partial(accumulator, report_label, as_of)
+
+
+def to_partial(
+    accumulator: Accumulator, report_label: Optional[str] = None, as_of: Optional[datetime] = None
+) -> SummaryPartialReport:
+    stats = accumulator.stats if isinstance(accumulator, StatsAccumulator) else {}
+    return SummaryPartialReport(
+        report_label=report_label or DEFAULT_REPORT_LABEL,
+        as_of=as_of,
+        total_models=accumulator.count,
+        total_partials=accumulator.total.partials,
+        top_k=getattr(accumulator, "top_k", 0),
+        quantiles=list(getattr(accumulator, "quantiles", ())),
+        series=[_series_partial(series, stats.get(name)) for name, series in accumulator.series.items()],
+    )
+
+
+def _series_partial(series: SeriesAccumulator, stats: Optional[SeriesStats]) -> SummaryPartialSeries:
+    top = stats.top if stats is not None else None
+    sketch = stats.sketch if stats is not None else None
+    return SummaryPartialSeries(
+        series=series.series,
+        count=series.count,
+        total_partials=series.total.partials,
+        minimum=series.minimum,
+        maximum=series.maximum,
+        top_model=series.top_model,
+        bottom_model=series.bottom_model,
+        top_contributors=None
+        if top is None
+        else [
+            SummarySeriesContributor(model=model, label=label, headline_amount=amount)
+            for amount, (model, label) in top.items()
+        ],
+        sketch=None if sketch is None else SummaryPartialSketch(**sketch.to_state()),
+    )
+
+
+def merge_partials(
+    partials: Sequence[SummaryPartialReport], quantiles: Optional[Sequence[float]] = None
+) -> Accumulator:
+    """Combine partials into one accumulator, as if all their entries were added in order.
+
+    Totals are exact. Series keep first-seen order, and ties for the top or
+    bottom model keep the earlier partial. Top contributors are kept only
+    when every partial has them, and are cut to the smallest ``top_k``.
+    Quantiles are kept only when every partial carries a sketch.
+    """
+    top_k = min(partial.top_k for partial in partials)
+    sketched = all(partial.quantiles for partial in partials)
+    fractions = tuple(quantiles if quantiles is not None else partials[0].quantiles) if sketched else ()
+    accumulator: Accumulator = StatsAccumulator(top_k, fractions) if top_k or fractions else ReportAccumulator()
+    for partial in partials:
+        for value in partial.total_partials:
+            accumulator.total.add(value)
+        accumulator.count += partial.total_models
+        for item in partial.series:
+            series = accumulator.series.get(item.series)
+            if series is None:
+                series = accumulator.series[item.series] = SeriesAccumulator(item.series)
+            series.merge(_series_accumulator(item))
+            if isinstance(accumulator, StatsAccumulator):
+                stats = accumulator.stats.get(item.series)
+                if stats is None:
+                    stats = accumulator.stats[item.series] = accumulator.new_stats()
+                stats.merge(_series_stats(item, top_k, bool(fractions)))
+    return accumulator
+
+
+def _series_accumulator(item: SummaryPartialSeries) -> SeriesAccumulator:
+    series = SeriesAccumulator(item.series)
+    series.count = item.count
+    for value in item.total_partials:
+        series.total.add(value)
+    series.minimum, series.maximum = item.minimum, item.maximum
+    series.top_model, series.bottom_model = item.top_model, item.bottom_model
+    return series
+
+
+def _series_stats(item: SummaryPartialSeries, top_k: int, sketched: bool) -> SeriesStats:
+    stats = SeriesStats()
+    if top_k and item.top_contributors is not None:
+        stats.top = TopK.from_state(
+            top_k, [(entry.headline_amount, (entry.model, entry.label)) for entry in item.top_contributors]
+        )
+    if sketched and item.sketch is not None:
+        stats.sketch = KllSketch.from_state(item.sketch.model_dump())
+    return stats
@@ -0,0 +1,233 @@
+"""Declarative model registry: SEBIT models added or changed by a JSON spec file.
+
+    {"models": {
+        "SEBIT-NEW": {
+            "series": "Advanced Analytics",
+            "headline_key": "final_value",
+            "label_key": "asset_label",
+            "fields": {"asset_label": "str", "final_value": "float", "note": "str?"}
+        },
+        "SEBIT-DDA": {"series": "Asset Revaluation"}
+    }}
+
+A new model needs ``series``, ``headline_key``, ``label_key`` and ``fields``;
+its detail class is generated with ``pydantic.create_model``. A built-in model
+may override any of the four keys; without ``fields`` it keeps its own
+detail class. Field types are listed in ``FIELD_TYPES``, and a trailing ``?``
+makes a field optional.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_args
+
+from pydantic import BaseModel, create_model
+
+from .schemas import BUILTIN_MODELS, MODEL_REGISTRY, ModelRegistryEntry
+
+FIELD_TYPES: Dict[str, Any] = {
+    "str": str,
+    "float": float,
+    "int": int,
+    "bool": bool,
+    "list[float]": List[float],
+    "list[str]": List[str],
+    "object": Dict[str, Any],
+    "any": Any,
+}
+HEADLINE_TYPES = {"float", "int"}
+MODEL_KEYS = {"series", "headline_key", "label_key", "fields"}
+
+# Generated detail classes by (model, fields), so reloading a spec only builds
+# validators for the models whose fields changed.
+_DETAIL_MODELS: Dict[Tuple[str, str], Type[BaseModel]] = {}
+
+
+class RegistrySpecError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class RegistrySpec:
+    """A parsed registry spec; ``digest`` identifies its content."""
+
+    models: Dict[str, Dict[str, Any]]
+    digest: str
+
+    @classmethod
+    def parse(cls, document: Any) -> "RegistrySpec":
+        if not isinstance(document, dict) or set(document) - {"models"}:
+            raise RegistrySpecError('A registry spec is an object with a single "models" key.')
+        models = document.get("models") or {}
+        if not isinstance(models, dict):
+            raise RegistrySpecError('"models" must map model names to their spec.')
+        for name, model_spec in models.items():
+            _check_model(name, model_spec)
+        canonical = json.dumps(models, sort_keys=True, separators=(",", ":"))
+        return cls(models=models, digest=hashlib.sha256(canonical.encode()).hexdigest()[:16])
+
+    @classmethod
+    def from_file(cls, path: str) -> "RegistrySpec":
+        try:
+            with open(path, "rb") as handle:
+                document = json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise RegistrySpecError(f"Cannot read registry spec '{path}': {exc}") from exc
+        return cls.parse(document)
+
+
+def _check_model(name: str, model_spec: Any) -> None:
+    if not isinstance(model_spec, dict):
+        raise RegistrySpecError(f"Model '{name}': the spec must be an object.")
+    unknown = set(model_spec) - MODEL_KEYS
+    if unknown:
+        raise RegistrySpecError(f"Model '{name}': unknown keys {sorted(unknown)}.")
+    base = BUILTIN_MODELS.get(name)
+    if base is None:
+        missing = MODEL_KEYS - set(model_spec)
+        if missing:
+            raise RegistrySpecError(f"Model '{name}': missing {sorted(missing)}.")
+    for key in ("series", "headline_key", "label_key"):
+        if key in model_spec and not (isinstance(model_spec[key], str) and model_spec[key]):
+            raise RegistrySpecError(f"Model '{name}': {key} must be a non-empty string.")
+    headline_key = model_spec.get("headline_key") or base.headline_key
+    label_key = model_spec.get("label_key") or base.label_key
+    fields = model_spec.get("fields")
+    if fields is None:
+        declared = base.detail_model.model_fields
+        for key in (headline_key, label_key):
+            if key not in declared:
+                raise RegistrySpecError(f"Model '{name}': '{key}' is not a field of {base.detail_model.__name__}.")
+        label_field = declared[label_key]
+        if not label_field.is_required() or type(None) in get_args(label_field.annotation):
+            raise RegistrySpecError(f"Model '{name}': label_key '{label_key}' must be a required field.")
+        return
+    if not isinstance(fields, dict) or not fields:
+        raise RegistrySpecError(f"Model '{name}': 'fields' must map field names to types.")
+    for field, type_name in fields.items():
+        if not isinstance(type_name, str) or type_name.rstrip("?") not in FIELD_TYPES:
+            raise RegistrySpecError(
+                f"Model '{name}': field '{field}' has type {type_name!r}; use one of {sorted(FIELD_TYPES)}."
+            )
+    if fields.get(headline_key, "").rstrip("?") not in HEADLINE_TYPES:
+        raise RegistrySpecError(f"Model '{name}': headline_key '{headline_key}' must be a float or int field.")
+    if label_key not in fields:
+        raise RegistrySpecError(f"Model '{name}': label_key '{label_key}' is not a detail field.")
+    if fields[label_key].endswith("?"):
+        # Sessions key outputs by (model, label), so every output needs one.
+        raise RegistrySpecError(f"Model '{name}': label_key '{label_key}' must be a required field.")
+
+
+def _class_name(model: str) -> str:
+    return "".join(part.capitalize() for part in re.split(r"[^0-9A-Za-z]+", model) if part) + "Details"
+
+
+def detail_model(model: str, fields: Dict[str, str]) -> Type[BaseModel]:
+    """The generated detail class for ``fields``, built once per distinct field set."""
+    key = (model, json.dumps(fields, sort_keys=True))
+    cached = _DETAIL_MODELS.get(key)
+    if cached is not None:
+        return cached
+    definitions: Dict[str, Any] = {}
+    for field, type_name in fields.items():
+        annotation = FIELD_TYPES[type_name.rstrip("?")]
+        definitions[field] = (Optional[annotation], None) if type_name.endswith("?") else (annotation, ...)
+    try:
+        generated = create_model(_class_name(model), **definitions)
+    except Exception as exc:  # e.g. a field name that shadows a BaseModel attribute
+        raise RegistrySpecError(f"Model '{model}': {exc}") from exc
+    return _DETAIL_MODELS.setdefault(key, generated)
+
+
+def build_entries(spec: RegistrySpec) -> Dict[str, ModelRegistryEntry]:
+    """The built-in models with the spec's models added or applied on top."""
+    entries = dict(BUILTIN_MODELS)
+    for name, model_spec in spec.models.items():
+        base = BUILTIN_MODELS.get(name)
+        fields = model_spec.get("fields")
+        entries[name] = ModelRegistryEntry(
+            model=name,
+            series=model_spec.get("series") or base.series,
+            detail_model=detail_model(name, fields) if fields else base.detail_model,
+            headline_key=model_spec.get("headline_key") or base.headline_key,
+            label_key=model_spec.get("label_key") or base.label_key,
+            source="spec",
+        )
+    return entries
+
+
+def install(spec: Optional[RegistrySpec]) -> None:
+    """Make ``spec`` (``None`` for the built-in models alone) the active registry."""
+    entries = build_entries(spec) if spec is not None else BUILTIN_MODELS
+    MODEL_REGISTRY.replace(entries, spec)
+
+
+def activate(spec: Optional[RegistrySpec]) -> None:
+    """``install`` unless ``spec`` is already active; cheap enough to call per task."""
+    current = MODEL_REGISTRY.spec
+    if (current and current.digest) != (spec and spec.digest):
+        install(spec)
+
+
+class RegistryLoader:
+    """Keeps the active registry in step with a spec file.
+
+    ``refresh`` reloads only when the file's modification time changed, so
+    it can be polled. A spec that fails to load leaves the active registry
+    as it was. Reloads are serialised; requests never wait on them.
+    ``on_change`` runs after each reload that changed the registry.
+    """
+
+    def __init__(self, path: str, on_change: Optional[Callable[[], None]] = None) -> None:
+        self.path = path
+        self.on_change = on_change
+        self.loaded_at: Optional[datetime] = None
+        # Why the last load failed; cleared by the next successful one.
+        self.error: Optional[str] = None
+        self._mtime_ns: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> bool:
+        """Install the spec file now; returns whether the active registry changed.
+
+        Raises ``RegistrySpecError`` when the file is missing or invalid.
+        """
+        with self._lock:
+            return self._load()
+
+    def refresh(self) -> bool:
+        with self._lock:
+            try:
+                mtime_ns = os.stat(self.path).st_mtime_ns
+            except OSError:
+                return False
+            if mtime_ns == self._mtime_ns:
+                return False
+            return self._load()
+
+    def _load(self) -> bool:
+        try:
+            # Recorded even if loading fails, so a broken file is not retried until it changes.
+            self._mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError:
+            pass
+        try:
+            spec = RegistrySpec.from_file(self.path)
+            changed = (MODEL_REGISTRY.spec and MODEL_REGISTRY.spec.digest) != spec.digest
+            if changed:
+                install(spec)
+                if self.on_change is not None:
+                    self.on_change()
+        except RegistrySpecError as exc:
+            self.error = str(exc)
+            raise
+        self.error = None
+        self.loaded_at = datetime.now(timezone.utc)
+        return changed
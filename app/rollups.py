@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Sequence
+
+from .aggregation import SeriesAccumulator
+from .schemas import (
+    RollupLevel,
+    SummaryEntry,
+    SummaryRollupNode,
+    SummaryRollupPage,
+    SummarySeriesAggregate,
+)
+from .services import DEFAULT_REPORT_LABEL
+
+ROLLUP_LEVELS: Sequence[RollupLevel] = ("series", "model", "label")
+
+
+class RollupCell:
+    """One node of the series -> model -> label cube; children keep first-seen order."""
+
+    __slots__ = ("key", "stats", "children", "aggregate")
+
+    def __init__(self, key: Optional[str]) -> None:
+        self.key = key
+        self.stats = SeriesAccumulator(key or "")
+        self.children: Dict[Optional[str], RollupCell] = {}
+        self.aggregate: Optional[SummarySeriesAggregate] = None
+
+    def child(self, key: Optional[str]) -> "RollupCell":
+        cell = self.children.get(key)
+        if cell is None:
+            cell = self.children[key] = RollupCell(key)
+        return cell
+
+    def freeze(self) -> None:
+        self.aggregate = self.stats.to_aggregate()
+        self.stats = None  # type: ignore[assignment]
+        for cell in self.children.values():
+            cell.freeze()
+
+
+class RollupTree:
+    """Series -> model -> label aggregates of one report, built in a single pass.
+
+    Every cell carries the ``SummarySeriesAggregate`` statistics. They are
+    computed once when the tree is built, so pages and subtrees are served by
+    walking and slicing the tree, never by aggregating again. Labels come
+    from each registry entry's ``label_key``; outputs without one are grouped
+    under a ``None`` label.
+    """
+
+    def __init__(self, rollup_id: str, report_label: Optional[str] = None, as_of: Optional[datetime] = None) -> None:
+        self.rollup_id = rollup_id
+        self.report_label = report_label or DEFAULT_REPORT_LABEL
+        self.as_of = as_of
+        self.root = RollupCell(None)
+
+    def build(self, entries: Iterable[SummaryEntry]) -> "RollupTree":
+        root = self.root
+        for entry in entries:
+            model, amount = entry.model, entry.headline_amount
+            series = root.child(entry.series)
+            output = series.child(model)
+            leaf = output.child(entry.label)
+            for cell in (root, series, output, leaf):
+                cell.stats.add(model, amount)
+        root.freeze()
+        return self
+
+    def _cell(self, path: Sequence[str]) -> Optional[RollupCell]:
+        cell = self.root
+        for depth, key in enumerate(path):
+            # Unlabelled outputs are addressed with an empty label segment.
+            child = cell.children.get(None if depth == 2 and key == "" else key)
+            if child is None:
+                return None
+            cell = child
+        return cell
+
+    def page(self, path: Sequence[str] = (), depth: int = 1, offset: int = 0, limit: int = 100) -> SummaryRollupPage:
+        """Children of the cell at ``path``, each expanded ``depth - 1`` further levels.
+
+        Only the first level is paged with ``offset``; nested levels are cut at
+        ``limit`` children (their ``child_count`` still gives the full count).
+        Raises ``KeyError`` when ``path`` does not exist.
+        """
+        if len(path) > len(ROLLUP_LEVELS):
+            raise KeyError("/".join(path))
+        cell = self._cell(path)
+        if cell is None:
+            raise KeyError("/".join(path))
+        children = list(cell.children.values())[offset : offset + limit] if depth else []
+        root = self.root.aggregate
+        return SummaryRollupPage(
+            rollup_id=self.rollup_id,
+            report_label=self.report_label,
+            as_of=self.as_of,
+            total_models=root.model_count,
+            overall_headline_total=root.headline_total,
+            path=list(path),
+            node=_node(cell, len(path) - 1, 0, limit) if path else None,
+            offset=offset,
+            limit=limit,
+            total_children=len(cell.children),
+            children=[_node(child, len(path), depth - 1, limit) for child in children],
+        )
+
+
+def _node(cell: RollupCell, level: int, depth: int, limit: int) -> SummaryRollupNode:
+    aggregate = cell.aggregate
+    children = None
+    if depth > 0 and cell.children:
+        children = [_node(child, level + 1, depth - 1, limit) for child in list(cell.children.values())[:limit]]
+    return SummaryRollupNode(
+        level=ROLLUP_LEVELS[level],
+        key=cell.key,
+        model_count=aggregate.model_count,
+        headline_total=aggregate.headline_total,
+        headline_average=aggregate.headline_average,
+        headline_min=aggregate.headline_min,
+        headline_max=aggregate.headline_max,
+        top_model=aggregate.top_model,
+        bottom_model=aggregate.bottom_model,
+        child_count=len(cell.children),
+        children=children,
+    )
+
+
+class RollupStore:
+    """Bounded in-memory registry of built rollup trees (least recently used dropped first)."""
+
+    def __init__(self, max_rollups: int = 64) -> None:
+        self.max_rollups = max_rollups
+        self._rollups: "OrderedDict[str, RollupTree]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        entries: Iterable[SummaryEntry],
+        report_label: Optional[str] = None,
+        as_of: Optional[datetime] = None,
+    ) -> RollupTree:
+        tree = RollupTree(uuid.uuid4().hex, report_label, as_of).build(entries)
+        with self._lock:
+            self._rollups[tree.rollup_id] = tree
+            while len(self._rollups) > self.max_rollups:
+                self._rollups.popitem(last=False)
+        return tree
+
+    def get(self, rollup_id: str) -> Optional[RollupTree]:
+        with self._lock:
+            tree = self._rollups.get(rollup_id)
+            if tree is not None:
+                self._rollups.move_to_end(rollup_id)
+            return tree
+
+    def delete(self, rollup_id: str) -> bool:
+        with self._lock:
+            return self._rollups.pop(rollup_id, None) is not None
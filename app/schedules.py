@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Literal, Mapping, Optional, Sequence, Tuple
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import PydanticCustomError, core_schema
+
+ScheduleMode = Literal["rows", "columns", "summary", "omit"]
+
+# Serialisation context key used to pick the schedule output format.
+SCHEDULE_MODE_CONTEXT = "schedule_mode"
+
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+
+def _pack_column(values: Sequence[Any]) -> Sequence[Any]:
+    """Store homogeneous numeric columns as typed arrays; anything else stays a list."""
+    kinds = set(map(type, values))
+    if kinds == {float}:
+        return array("d", values)
+    if kinds == {int} and _INT64_MIN <= min(values) and max(values) <= _INT64_MAX:
+        return array("q", values)
+    return list(values)
+
+
+class ScheduleTable:
+    """Column-oriented period schedule: one array per field instead of a dict per row.
+
+    Built from the first row's keys; schedules whose rows do not share the same
+    keys are kept as the original rows. Iterating yields row dicts, so the table
+    still reads like the ``List[Dict[str, Any]]`` it replaces.
+    """
+
+    __slots__ = ("columns", "values", "_rows", "_length")
+
+    def __init__(
+        self,
+        columns: Tuple[str, ...] = (),
+        values: Tuple[Sequence[Any], ...] = (),
+        rows: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        self.columns = columns
+        self.values = values
+        self._rows = rows
+        self._length = len(rows) if rows is not None else (len(values[0]) if values else 0)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Mapping[str, Any]]) -> "ScheduleTable":
+        if not rows:
+            return cls()
+        columns = tuple(rows[0])
+        # Equal sizes plus every key present means every row has the same keys.
+        if set(map(len, rows)) != {len(columns)}:
+            return cls(rows=[dict(row) for row in rows])
+        try:
+            if len(columns) == 1:
+                transposed = [[row[columns[0]] for row in rows]]
+            else:
+                transposed = list(zip(*map(itemgetter(*columns), rows)))
+        except KeyError:
+            return cls(rows=[dict(row) for row in rows])
+        return cls(columns, tuple(map(_pack_column, transposed)))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self._rows is not None:
+            return iter(self._rows)
+        columns = [column.tolist() if isinstance(column, array) else column for column in self.values]
+        return map(dict, map(zip, repeat(self.columns), zip(*columns)))
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if self._rows is not None:
+            return self._rows[index]
+        return {name: column[index] for name, column in zip(self.columns, self.values)}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ScheduleTable):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ScheduleTable(periods={len(self)}, columns={list(self.columns)})"
+
+    def column_map(self) -> Dict[str, List[Any]]:
+        if self._rows is not None:
+            return _columns_of(self._rows)
+        return {name: list(column) for name, column in zip(self.columns, self.values)}
+
+    def summary(self) -> Dict[str, Any]:
+        totals = {
+            name: math.fsum(column)
+            for name, column in zip(self.columns, self.values)
+            if isinstance(column, array) and column.typecode == "d"
+        }
+        return {
+            "periods": len(self),
+            "fields": list(self.columns) if self._rows is None else list(_columns_of(self._rows)),
+            "first": self[0] if len(self) else None,
+            "last": self[len(self) - 1] if len(self) else None,
+            "totals": totals,
+        }
+
+    @classmethod
+    def _validate(cls, value: Any) -> "ScheduleTable":
+        if isinstance(value, ScheduleTable):
+            return value
+        if isinstance(value, (list, tuple)) and (
+            all(type(row) is dict for row in value) or all(isinstance(row, Mapping) for row in value)
+        ):
+            return cls.from_rows(value)
+        raise PydanticCustomError("schedule_type", "Schedule must be a list of period objects")
+
+    def _serialize(self, info: core_schema.SerializationInfo) -> Any:
+        mode = (info.context or {}).get(SCHEDULE_MODE_CONTEXT, "rows")
+        if mode == "omit":
+            return None
+        if mode == "summary":
+            return self.summary()
+        if mode == "columns":
+            return self.column_map()
+        return list(self)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value, info: value._serialize(info), info_arg=True
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "array", "items": {"type": "object", "additionalProperties": True}}
+
+
+def _columns_of(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    names: Dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+    return {name: [row.get(name) for row in rows] for name in names}
@@ -1,10 +1,96 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Type, Union
+from operator import itemgetter
+from typing import (
+    AbstractSet,
+    Annotated,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    PlainValidator,
+    SerializeAsAny,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+    model_validator,
+)
+
+from .schedules import ScheduleMode, ScheduleTable
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# How much of each model output is validated and returned: everything ("full"),
+# the headline with details validated only when accessed ("lazy"), or the
+# headline alone ("none"). Entry details are only written out in "full" mode.
+DetailMode = Literal["full", "lazy", "none"]
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+RollupLevel = Literal["series", "model", "label"]
+# Where a registry entry comes from: the classes below, or a registry spec file.
+ModelSource = Literal["builtin", "spec"]
+
+_validate_headline = TypeAdapter(float).validate_python
+_validate_headlines = TypeAdapter(List[float]).validate_python
+
+
+class DeferredModel(BaseModel):
+    """Base of every schema here: validators and serializers are built on first use.
+
+    Building all of them eagerly (the detail union is inlined into every entry
+    schema) is most of this module's import time. ``create_app`` builds them
+    up front through ``build_deferred_models`` unless fast startup is enabled.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+def build_deferred_models() -> None:
+    """Build every deferred schema now instead of on its first use."""
+    pending = list(DeferredModel.__subclasses__())
+    while pending:
+        model_cls = pending.pop()
+        pending.extend(model_cls.__subclasses__())
+        if not model_cls.__pydantic_complete__:
+            model_cls.model_rebuild()
+
+
+def construct_validated(model_cls: Type[ModelT], values: Dict[str, Any]) -> ModelT:
+    """Build a model from values that are already validated, running no validators.
+
+    Same result as ``model_cls.model_construct(**values)`` when every field is
+    supplied, without its per-call Python overhead (it matters per entry).
+    """
+    instance = object.__new__(model_cls)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    private = model_cls.__private_attributes__
+    object.__setattr__(
+        instance,
+        "__pydantic_private__",
+        {name: attr.get_default() for name, attr in private.items()} if private else None,
+    )
+    return instance
 
 
 # -----------------------------------------------------------------------------
@@ -12,23 +98,23 @@ from pydantic import BaseModel, Field, model_validator
 # -----------------------------------------------------------------------------
 
 
-class DdaDetails(BaseModel):
+class DdaDetails(DeferredModel):
     asset_label: str
-    schedule: List[Dict[str, Any]] = Field(default_factory=list)
+    schedule: ScheduleTable = Field(default_factory=ScheduleTable)
     total_depreciation: float
     total_revaluation_gain_loss: float
     total_unrecognised_revaluation: float
 
 
-class LamDetails(BaseModel):
+class LamDetails(DeferredModel):
     lease_label: str
-    schedule: List[Dict[str, Any]] = Field(default_factory=list)
+    schedule: ScheduleTable = Field(default_factory=ScheduleTable)
     total_revaluation_gain_loss: float
     total_interest_expense: float
     total_termination_adjustment: float
 
 
-class RvmDetails(BaseModel):
+class RvmDetails(DeferredModel):
     resource_label: str
     daily_average_extraction: float
     standard_extraction_value: float
@@ -39,7 +125,7 @@ class RvmDetails(BaseModel):
     final_revaluation_value: float
 
 
-class CeemDetails(BaseModel):
+class CeemDetails(DeferredModel):
     expense_label: str
     daily_average_usage_units: float
     standard_usage_value_non_quantitative: float
@@ -53,7 +139,7 @@ class CeemDetails(BaseModel):
     final_revaluation_value: float
 
 
-class BdmDetails(BaseModel):
+class BdmDetails(DeferredModel):
     bond_label: str
     daily_estimated_usage: float
     estimated_value_ps: float
@@ -63,7 +149,7 @@ class BdmDetails(BaseModel):
     interest_type: str
 
 
-class BelmDetails(BaseModel):
+class BelmDetails(DeferredModel):
     debtor_label: str
     daily_estimated_repayment: float
     expected_repayment_at_evaluation: float
@@ -73,7 +159,7 @@ class BelmDetails(BaseModel):
     final_bad_debt_ratio: float
 
 
-class CprmDetails(BaseModel):
+class CprmDetails(DeferredModel):
     exposure_id: str
     assumed_bad_debt_occurrence_rate: float
     convertible_bond_rate: float
@@ -87,14 +173,14 @@ class CprmDetails(BaseModel):
     final_adjusted_convertible_bond_rate: float
 
 
-class CocimQuarterAdjustment(BaseModel):
+class CocimQuarterAdjustment(DeferredModel):
     quarter_index: int
     adjustment_value: float
     pre_compound_balance: float
     post_compound_balance: float
 
 
-class CocimDetails(BaseModel):
+class CocimDetails(DeferredModel):
     portfolio_label: str
     account_ratio: float
     initial_compound_measurement: float
@@ -105,7 +191,7 @@ class CocimDetails(BaseModel):
     final_adjusted_balance: float
 
 
-class FarexDetails(BaseModel):
+class FarexDetails(DeferredModel):
     contract_id: str
     last_year_trade_ratio: float
     current_year_trade_ratio: float
@@ -116,17 +202,17 @@ class FarexDetails(BaseModel):
     revaluation_amount: float
 
 
-class TctBeamDetails(BaseModel):
+class TctBeamDetails(DeferredModel):
     model_label: str
     evaluation_years: int
     cumulative_fixed_cost: float
     cumulative_variable_cost: float
     cumulative_operating_profit: float
     break_even_year_index: Optional[int]
-    schedule: List[Dict[str, Any]] = Field(default_factory=list)
+    schedule: ScheduleTable = Field(default_factory=ScheduleTable)
 
 
-class CpmrvDetails(BaseModel):
+class CpmrvDetails(DeferredModel):
     asset_label: str
     last_year_average_performance: float
     current_year_log_ratio: float
@@ -136,7 +222,7 @@ class CpmrvDetails(BaseModel):
     adjusted_crypto_value: float
 
 
-class DcbpraDetails(BaseModel):
+class DcbpraDetails(DeferredModel):
     asset_label: str
     growth_percentage_factor: float
     real_growth_adjustment: float
@@ -150,7 +236,7 @@ class DcbpraDetails(BaseModel):
     adjusted_expected_return: float
 
 
-class PsrasDetails(BaseModel):
+class PsrasDetails(DeferredModel):
     portfolio_label: str
     assumed_revenue_recognition_rate: float
     new_subscriber_average_payment: float
@@ -161,7 +247,7 @@ class PsrasDetails(BaseModel):
     final_recognised_revenue: float
 
 
-class LsmrvDetails(BaseModel):
+class LsmrvDetails(DeferredModel):
     evaluation_label: str
     probability_distribution_a: float
     probability_distribution_b: float
@@ -195,97 +281,279 @@ class ModelRegistryEntry:
     series: str
     detail_model: Type[BaseModel]
     headline_key: str
+    label_key: str
+    source: ModelSource = "builtin"
+
+    @cached_property
+    def validate_details(self) -> Callable[[Any], BaseModel]:
+        """The detail class's compiled validator, bound once per registry entry."""
+        return self.detail_model.__pydantic_validator__.validate_python
 
+    def to_entry(self, data: Dict[str, Any], currency: Optional[str] = None) -> "SummaryEntry":
+        """Convert a raw model output into a finished entry in a single validation pass."""
+        details = self.validate_details(data)
+        headline_value = getattr(details, self.headline_key, None)
+        if headline_value is None:
+            raise ValueError(f"Model '{self.model}' output missing headline key '{self.headline_key}'.")
+        return construct_validated(
+            SummaryEntry,
+            {
+                "series": self.series,
+                "model": self.model,
+                "headline_amount": float(headline_value),
+                "currency": currency,
+                "details": details,
+            },
+        )
 
-MODEL_REGISTRY: Dict[str, ModelRegistryEntry] = {
+    def to_headline_entry(
+        self, data: Dict[str, Any], currency: Optional[str] = None, keep_payload: bool = True
+    ) -> "HeadlineEntry":
+        """Convert a raw model output using only its headline value.
+
+        With ``keep_payload`` the details are validated on first access of
+        ``entry.details``; otherwise they are dropped and ``details`` is ``None``.
+        """
+        return self.headline_entry(self.headline(data), data, currency, keep_payload)
+
+    def headline(self, data: Dict[str, Any]) -> float:
+        headline_value = data.get(self.headline_key)
+        if headline_value is None:
+            raise ValueError(f"Model '{self.model}' output missing headline key '{self.headline_key}'.")
+        return _validate_headline(headline_value)
+
+    def extract_headlines(self, payloads: Sequence[Dict[str, Any]]) -> List[float]:
+        """Headline values of many outputs of this model, validated in a single call."""
+        try:
+            return _validate_headlines(list(map(itemgetter(self.headline_key), payloads)))
+        except (KeyError, TypeError, ValidationError):
+            # Go through them one by one to raise the first bad output's own error.
+            return [self.headline(data) for data in payloads]
+
+    def headline_entry(
+        self, headline: float, data: Dict[str, Any], currency: Optional[str] = None, keep_payload: bool = True
+    ) -> "HeadlineEntry":
+        """``to_headline_entry`` with the headline value already extracted."""
+        return HeadlineEntry(self.series, self.model, headline, currency, data if keep_payload else None)
+
+
+BUILTIN_MODELS: Dict[str, ModelRegistryEntry] = {
     "SEBIT-DDA": ModelRegistryEntry(
         model="SEBIT-DDA",
         series="Asset & Depreciation",
         detail_model=DdaDetails,
         headline_key="total_revaluation_gain_loss",
+        label_key="asset_label",
     ),
     "SEBIT-LAM": ModelRegistryEntry(
         model="SEBIT-LAM",
         series="Asset & Depreciation",
         detail_model=LamDetails,
         headline_key="total_revaluation_gain_loss",
+        label_key="lease_label",
     ),
     "SEBIT-RVM": ModelRegistryEntry(
         model="SEBIT-RVM",
         series="Asset & Depreciation",
         detail_model=RvmDetails,
         headline_key="final_revaluation_value",
+        label_key="resource_label",
     ),
     "SEBIT-CEEM": ModelRegistryEntry(
         model="SEBIT-CEEM",
         series="Expense & Profitability",
         detail_model=CeemDetails,
         headline_key="final_revaluation_value",
+        label_key="expense_label",
     ),
     "SEBIT-BDM": ModelRegistryEntry(
         model="SEBIT-BDM",
         series="Expense & Profitability",
         detail_model=BdmDetails,
         headline_key="final_book_value",
+        label_key="bond_label",
     ),
     "SEBIT-BELM": ModelRegistryEntry(
         model="SEBIT-BELM",
         series="Expense & Profitability",
         detail_model=BelmDetails,
         headline_key="final_bad_debt_ratio",
+        label_key="debtor_label",
     ),
     "SEBIT-CPRM": ModelRegistryEntry(
         model="SEBIT-CPRM",
         series="Capital & Risk Derivatives",
         detail_model=CprmDetails,
         headline_key="final_convertible_bond_amount",
+        label_key="exposure_id",
     ),
     "SEBIT-C-OCIM": ModelRegistryEntry(
         model="SEBIT-C-OCIM",
         series="Capital & Risk Derivatives",
         detail_model=CocimDetails,
         headline_key="final_adjusted_balance",
+        label_key="portfolio_label",
     ),
     "SEBIT-FAREX": ModelRegistryEntry(
         model="SEBIT-FAREX",
         series="Capital & Risk Derivatives",
         detail_model=FarexDetails,
         headline_key="revaluation_amount",
+        label_key="contract_id",
     ),
     "SEBIT-TCT-BEAM": ModelRegistryEntry(
         model="SEBIT-TCT-BEAM",
         series="Advanced Analytics",
         detail_model=TctBeamDetails,
         headline_key="cumulative_operating_profit",
+        label_key="model_label",
     ),
     "SEBIT-CPMRV": ModelRegistryEntry(
         model="SEBIT-CPMRV",
         series="Advanced Analytics",
         detail_model=CpmrvDetails,
         headline_key="adjusted_crypto_value",
+        label_key="asset_label",
     ),
     "SEBIT-DCBPRA": ModelRegistryEntry(
         model="SEBIT-DCBPRA",
         series="Advanced Analytics",
         detail_model=DcbpraDetails,
         headline_key="adjusted_expected_return",
+        label_key="asset_label",
     ),
     "SEBIT-PSRAS": ModelRegistryEntry(
         model="SEBIT-PSRAS",
         series="Insurance & Service Revenue",
         detail_model=PsrasDetails,
         headline_key="final_recognised_revenue",
+        label_key="portfolio_label",
     ),
     "SEBIT-LSMRV": ModelRegistryEntry(
         model="SEBIT-LSMRV",
         series="Probability Revaluation",
         detail_model=LsmrvDetails,
         headline_key="final_adjustment_amount",
+        label_key="evaluation_label",
     ),
 }
 
 
-class SummaryEntry(BaseModel):
+class ModelRegistry(Mapping[str, ModelRegistryEntry]):
+    """The registered models by name: the built-in ones plus any from a registry spec.
+
+    ``replace`` swaps the whole set in one attribute assignment, so readers
+    take no lock and always see either the previous or the new registry.
+    ``spec`` is the spec the current set was built from (``None`` for the
+    built-in models alone); see ``app.registry``.
+    """
+
+    def __init__(self, entries: Mapping[str, ModelRegistryEntry]) -> None:
+        self.replace(entries, None)
+
+    def replace(self, entries: Mapping[str, ModelRegistryEntry], spec: Any) -> None:
+        spec_classes = frozenset(
+            entry.detail_model for entry in entries.values() if entry.detail_model not in _DETAIL_KIND_BY_CLASS
+        )
+        self._state: Tuple[Dict[str, ModelRegistryEntry], AbstractSet[type], Any] = (dict(entries), spec_classes, spec)
+
+    @property
+    def spec(self) -> Any:
+        return self._state[2]
+
+    def is_spec_model(self, detail_model: type) -> bool:
+        return detail_model in self._state[1]
+
+    def extract_headlines(self, model: str, payloads: Sequence[Dict[str, Any]]) -> List[float]:
+        """Headline values of many outputs of ``model`` (see ``ModelRegistryEntry.extract_headlines``)."""
+        entry = self._state[0].get(model)
+        if entry is None:
+            raise ValueError(f"Model '{model}' is not registered for summary aggregation.")
+        return entry.extract_headlines(payloads)
+
+    def __getitem__(self, model: str) -> ModelRegistryEntry:
+        return self._state[0][model]
+
+    def get(self, model: Any, default: Any = None) -> Any:
+        return self._state[0].get(model, default)
+
+    def __contains__(self, model: object) -> bool:
+        return model in self._state[0]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._state[0])
+
+    def __len__(self) -> int:
+        return len(self._state[0])
+
+
+# Detail classes of the built-in models, mapped to their discriminator tag.
+_DETAIL_KIND_BY_CLASS: Dict[Type[BaseModel], str] = {
+    entry.detail_model: name for name, entry in BUILTIN_MODELS.items()
+}
+
+MODEL_REGISTRY = ModelRegistry(BUILTIN_MODELS)
+
+
+def registered_label(model: str, details: Any) -> Optional[str]:
+    """Value of the registered ``label_key`` in a detail model or raw payload dict."""
+    registry_entry = MODEL_REGISTRY.get(model)
+    if registry_entry is None or details is None:
+        return None
+    if isinstance(details, dict):
+        value = details.get(registry_entry.label_key)
+    else:
+        value = getattr(details, registry_entry.label_key, None)
+    return None if value is None else str(value)
+
+
+# Tag used for entries whose model is not in the registry; those fall back to
+# the smart-union path and are matched against every built-in detail class in turn.
+UNREGISTERED_DETAIL_KIND = "unregistered"
+# Tag for models whose detail class was generated from the registry spec.
+SPEC_DETAIL_KIND = "spec"
+
+
+def _detail_kind(value: Any) -> str:
+    if isinstance(value, dict):
+        kind = value.get("kind")
+        entry = MODEL_REGISTRY.get(kind) if isinstance(kind, str) else None
+        if entry is None:
+            return UNREGISTERED_DETAIL_KIND
+        return _DETAIL_KIND_BY_CLASS.get(entry.detail_model, SPEC_DETAIL_KIND)
+    kind = _DETAIL_KIND_BY_CLASS.get(type(value))
+    if kind is not None:
+        return kind
+    return SPEC_DETAIL_KIND if MODEL_REGISTRY.is_spec_model(type(value)) else UNREGISTERED_DETAIL_KIND
+
+
+def _validate_spec_details(value: Any) -> BaseModel:
+    if isinstance(value, BaseModel):
+        return value
+    entry = MODEL_REGISTRY.get(value.get("kind"))
+    if entry is None:  # the registry was reloaded while this entry was being validated
+        raise ValueError(f"Model '{value.get('kind')}' is not registered for summary aggregation.")
+    return entry.validate_details(value)
+
+
+# Discriminated counterpart of ``ModelDetailUnion``: the ``kind`` tag (taken from
+# the entry's ``model`` when absent) selects exactly one detail class, or the
+# registry's generated class for models declared in the registry spec.
+DiscriminatedModelDetail = Annotated[
+    Union[
+        tuple(
+            Annotated[entry.detail_model, Tag(name)] for name, entry in BUILTIN_MODELS.items()
+        )
+        + (
+            Annotated[ModelDetailUnion, Tag(UNREGISTERED_DETAIL_KIND)],
+            Annotated[Any, PlainValidator(_validate_spec_details), Tag(SPEC_DETAIL_KIND)],
+        )
+    ],
+    Discriminator(_detail_kind),
+]
+
+
+class SummaryEntry(DeferredModel):
     series: str = Field(..., description="Model family label (e.g., Asset & Depreciation).")
     model: str = Field(..., description="Specific model identifier (e.g., SEBIT-DDA).")
     headline_amount: float = Field(
@@ -296,39 +564,101 @@ class SummaryEntry(BaseModel):
         default=None,
         description="Currency code associated with the headline amount.",
     )
-    details: ModelDetailUnion = Field(
+    details: DiscriminatedModelDetail = Field(
         ...,
         description="Structured detail payload for the given SEBIT model.",
     )
 
+    @model_validator(mode="before")
     @classmethod
-    def from_model_output(cls, model_name: str, data: Dict[str, Any], currency: Optional[str] = None) -> "SummaryEntry":
+    def _tag_details(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            details = data.get("details")
+            if isinstance(details, dict):
+                model = data.get("model")
+                kind = details.get("kind")
+                if kind is None:
+                    if model in MODEL_REGISTRY:
+                        data = {**data, "details": {**details, "kind": model}}
+                elif kind != model:
+                    raise ValueError(f"details.kind '{kind}' does not match model '{model}'.")
+        return data
+
+    @property
+    def label(self) -> Optional[str]:
+        """Asset/contract label taken from the registered ``label_key`` of the details."""
+        return registered_label(self.model, self.details)
+
+    @classmethod
+    def from_model_output(
+        cls,
+        model_name: str,
+        data: Dict[str, Any],
+        currency: Optional[str] = None,
+        detail_mode: DetailMode = "full",
+    ) -> Union["SummaryEntry", "HeadlineEntry"]:
         entry = MODEL_REGISTRY.get(model_name)
         if entry is None:
             raise ValueError(f"Model '{model_name}' is not registered for summary aggregation.")
+        if detail_mode == "full":
+            return entry.to_entry(data, currency)
+        return entry.to_headline_entry(data, currency, keep_payload=detail_mode == "lazy")
 
-        detail_instance = entry.detail_model(**data)
-        headline_value = data.get(entry.headline_key)
-        if headline_value is None:
-            raise ValueError(
-                f"Model '{model_name}' output missing headline key '{entry.headline_key}'."
-            )
-
-        return cls(
-            series=entry.series,
-            model=entry.model,
-            headline_amount=float(headline_value),
-            currency=currency,
-            details=detail_instance,
-        )
 
+class HeadlineEntry:
+    """A model output converted from its headline value alone (``detail_mode`` lazy or none).
+
+    Reads like a ``SummaryEntry``. A kept payload is validated into ``details``
+    on first access; without one, ``details`` and ``label`` are ``None``.
+    """
+
+    __slots__ = ("series", "model", "headline_amount", "currency", "_payload", "_details")
+
+    def __init__(
+        self,
+        series: str,
+        model: str,
+        headline_amount: float,
+        currency: Optional[str],
+        payload: Optional[Dict[str, Any]],
+    ) -> None:
+        self.series = series
+        self.model = model
+        self.headline_amount = headline_amount
+        self.currency = currency
+        self._payload = payload
+        self._details: Any = None
 
-class SummarySeriesHighlight(BaseModel):
+    @property
+    def details(self) -> Any:
+        if self._payload is not None:
+            self._details = MODEL_REGISTRY[self.model].validate_details(self._payload)
+            self._payload = None
+        return self._details
+
+    @property
+    def label(self) -> Optional[str]:
+        # Read from the raw payload when it is still there, so no validation is needed.
+        return registered_label(self.model, self._payload if self._payload is not None else self._details)
+
+
+class SummarySeriesHighlight(DeferredModel):
+    model: str
+    headline_amount: float
+
+
+class SummarySeriesContributor(DeferredModel):
     model: str
+    label: Optional[str]
     headline_amount: float
 
 
-class SummarySeriesAggregate(BaseModel):
+class SummaryHeadlineQuantile(DeferredModel):
+    quantile: float
+    headline_amount: float
+
+
+class SummarySeriesAggregate(DeferredModel):
     series: str
     model_count: int
     headline_total: float
@@ -337,17 +667,32 @@ class SummarySeriesAggregate(BaseModel):
     headline_max: float
     top_model: SummarySeriesHighlight
     bottom_model: SummarySeriesHighlight
+    top_contributors: Optional[List[SummarySeriesContributor]] = Field(
+        default=None,
+        description="The series' largest headlines, largest first, when the request sets top_k.",
+    )
+    headline_quantiles: Optional[List[SummaryHeadlineQuantile]] = Field(
+        default=None,
+        description="Headline quantiles from a KLL sketch, when the request sets quantiles.",
+    )
 
 
-class SummaryEntryResult(BaseModel):
+class SummaryEntryResult(DeferredModel):
     series: str
     model: str
     headline_amount: float
     currency: Optional[str]
-    details: Dict[str, Any]
+    # Serialised by runtime type so already-validated detail models can be
+    # written out directly instead of being dumped to a dict first. ``None``
+    # when the request's ``detail_mode`` leaves details out.
+    details: Optional[SerializeAsAny[Dict[str, Any]]] = None
+    reporting_amount: Optional[float] = Field(
+        default=None,
+        description="Headline converted to the request's reporting_currency, when one is set.",
+    )
 
 
-class SummaryModelOutput(BaseModel):
+class SummaryModelOutput(DeferredModel):
     model_name: str = Field(..., description="Registered SEBIT model identifier (e.g., SEBIT-DDA).")
     payload: Dict[str, Any] = Field(
         ...,
@@ -375,7 +720,31 @@ class SummaryModelOutput(BaseModel):
     }
 
 
-class SummaryReportRequest(BaseModel):
+# Model outputs converted per ``headline_entries`` call in the headline-only detail modes.
+HEADLINE_BATCH_SIZE = 1024
+
+
+def headline_entries(outputs: Sequence[SummaryModelOutput], keep_payload: bool = True) -> List[HeadlineEntry]:
+    """Headline-only entries for ``outputs``, in order.
+
+    The outputs are grouped by model so that each model's headline values are
+    extracted with one ``extract_headlines`` call instead of one per output.
+    """
+    by_model: Dict[str, List[int]] = {}
+    for index, item in enumerate(outputs):
+        by_model.setdefault(item.model_name, []).append(index)
+    entries: List[Any] = [None] * len(outputs)
+    for model, indexes in by_model.items():
+        registry_entry = MODEL_REGISTRY.get(model)
+        if registry_entry is None:
+            raise ValueError(f"Model '{model}' is not registered for summary aggregation.")
+        payloads = [outputs[index].payload for index in indexes]
+        for index, headline, data in zip(indexes, registry_entry.extract_headlines(payloads), payloads):
+            entries[index] = registry_entry.headline_entry(headline, data, outputs[index].currency, keep_payload)
+    return entries
+
+
+class SummaryReportRequest(DeferredModel):
     report_label: Optional[str] = Field(
         default="SEBIT Summary Report",
         description="Friendly label for the generated report.",
@@ -393,6 +762,43 @@ class SummaryReportRequest(BaseModel):
         min_length=1,
         description="Raw SEBIT model outputs that will be converted into entries automatically.",
     )
+    schedule_mode: ScheduleMode = Field(
+        default="rows",
+        description=(
+            "How DDA/LAM/TCT-BEAM schedules appear in entry details: one object per period "
+            "('rows'), one array per field ('columns'), a short 'summary', or 'omit'."
+        ),
+    )
+    reporting_currency: Optional[str] = Field(
+        default=None,
+        description=(
+            "Convert headlines to this currency before aggregating. series_summary and the overall "
+            "total are then in this currency, and currency_breakdown keeps the native aggregates. "
+            "Entries without a currency are taken to be in the reporting currency."
+        ),
+    )
+    top_k: int = Field(
+        default=0,
+        ge=0,
+        le=1000,
+        description="Include each series' top_k largest headlines, with their model and label.",
+    )
+    quantiles: List[Annotated[float, Field(ge=0.0, le=1.0)]] = Field(
+        default_factory=list,
+        description=(
+            "Headline quantiles to report per series, e.g. [0.5, 0.9, 0.99]. Exact for series of up to "
+            "about 200 outputs; beyond that, estimated within roughly 1% rank error using bounded memory."
+        ),
+    )
+    detail_mode: DetailMode = Field(
+        default="full",
+        description=(
+            "'full' validates and returns every entry's details. 'lazy' and 'none' only read "
+            "each output's headline value and return entries without details, which is much "
+            "cheaper for callers that only need totals and series_summary; 'lazy' still "
+            "validates details if they are needed later (e.g. when a session report is rendered)."
+        ),
+    )
 
     @model_validator(mode="after")
     def _validate_sources(self) -> "SummaryReportRequest":
@@ -400,14 +806,32 @@ class SummaryReportRequest(BaseModel):
             raise ValueError("Either 'entries' or 'model_outputs' must be provided.")
         return self
 
-    def resolve_entries(self) -> List[SummaryEntry]:
+    def entry_count(self) -> int:
+        return len(self.entries or self.model_outputs or [])
+
+    def resolve_entries(self) -> List[Union[SummaryEntry, HeadlineEntry]]:
         if self.entries:
             return self.entries
+        return list(self.iter_entries())
+
+    def iter_entries(self) -> Iterator[Union[SummaryEntry, HeadlineEntry]]:
+        for chunk in self.iter_entry_chunks():
+            yield from chunk
+
+    def iter_entry_chunks(self) -> Iterator[Sequence[Union[SummaryEntry, HeadlineEntry]]]:
+        """``iter_entries`` in the batches they are converted in: one entry each in the full detail mode."""
+        if self.entries:
+            yield self.entries
+            return
         assert self.model_outputs, "model_outputs should be available when entries is None"
-        return [
-            SummaryEntry.from_model_output(item.model_name, item.payload, currency=item.currency)
-            for item in self.model_outputs
-        ]
+        outputs = self.model_outputs
+        if self.detail_mode != "full":
+            keep_payload = self.detail_mode == "lazy"
+            for start in range(0, len(outputs), HEADLINE_BATCH_SIZE):
+                yield headline_entries(outputs[start : start + HEADLINE_BATCH_SIZE], keep_payload)
+            return
+        for item in outputs:
+            yield (SummaryEntry.from_model_output(item.model_name, item.payload, currency=item.currency),)
 
     model_config = {
         "json_schema_extra": {
@@ -446,12 +870,28 @@ class SummaryReportRequest(BaseModel):
     }
 
 
-class SummaryReportResponse(BaseModel):
+class SummaryCurrencyBreakdown(DeferredModel):
+    currency: Optional[str]
+    rate: float = Field(..., description="Units of the reporting currency per unit of this currency.")
+    total_models: int
+    headline_total: float
+    series_summary: List[SummarySeriesAggregate]
+
+
+class SummaryReportDigest(DeferredModel):
     report_label: str
     as_of: Optional[datetime]
     total_models: int
     overall_headline_total: float
     series_summary: List[SummarySeriesAggregate]
+    reporting_currency: Optional[str] = None
+    currency_breakdown: Optional[List[SummaryCurrencyBreakdown]] = Field(
+        default=None,
+        description="Native-currency aggregates behind the converted totals, when reporting_currency is set.",
+    )
+
+
+class SummaryReportResponse(SummaryReportDigest):
     entries: List[SummaryEntryResult]
 
     model_config = {
@@ -518,3 +958,228 @@ class SummaryReportResponse(BaseModel):
         }
     }
 
+
+class SummaryOutputKey(DeferredModel):
+    model_name: str = Field(..., description="Registered SEBIT model identifier.")
+    label: str = Field(..., description="Value of the model's label field (e.g., asset_label).")
+
+
+class SummarySessionUpdate(DeferredModel):
+    upserts: List[SummaryModelOutput] = Field(
+        default_factory=list,
+        description="Model outputs to add, or to replace when (model_name, label) already exists.",
+    )
+    removals: List[SummaryOutputKey] = Field(
+        default_factory=list,
+        description="Model outputs to drop from the session.",
+    )
+
+
+class SummarySessionDigest(SummaryReportDigest):
+    session_id: str
+
+
+class SummaryPartialSketch(DeferredModel):
+    k: int = Field(..., ge=8, le=65_536)
+    count: int = Field(..., ge=0)
+    levels: List[List[float]] = Field(
+        ...,
+        min_length=1,
+        max_length=64,
+        description="KLL compactor levels; items at level h weigh 2**h.",
+    )
+
+
+class SummaryPartialSeries(DeferredModel):
+    series: str
+    count: int
+    total_partials: List[float] = Field(
+        ...,
+        description="Non-overlapping partial sums whose exact sum is the series total.",
+    )
+    minimum: float
+    maximum: float
+    top_model: str
+    bottom_model: str
+    top_contributors: Optional[List[SummarySeriesContributor]] = Field(
+        default=None,
+        description="Unrounded top_k candidates, when the partial was built with top_k.",
+    )
+    sketch: Optional[SummaryPartialSketch] = Field(
+        default=None,
+        description="Quantile sketch, when the partial was built with quantiles.",
+    )
+
+
+class SummaryPartialReport(DeferredModel):
+    """Serialisable pre-aggregate of one shard's model outputs; partials merge exactly."""
+
+    report_label: str
+    as_of: Optional[datetime]
+    total_models: int
+    total_partials: List[float]
+    top_k: int = 0
+    quantiles: List[float] = Field(default_factory=list)
+    series: List[SummaryPartialSeries]
+
+
+class SummaryPartialMergeRequest(DeferredModel):
+    report_label: Optional[str] = Field(default=None, description="Defaults to the first partial's label.")
+    as_of: Optional[datetime] = Field(default=None, description="Defaults to the first partial's as_of.")
+    quantiles: Optional[List[Annotated[float, Field(ge=0.0, le=1.0)]]] = Field(
+        default=None,
+        description="Quantiles to read from the merged sketches; defaults to the first partial's.",
+    )
+    partials: List[SummaryPartialReport] = Field(..., min_length=1)
+
+
+class SummaryRollupNode(DeferredModel):
+    level: RollupLevel
+    key: Optional[str] = Field(..., description="Series, model name or output label (null for unlabelled outputs).")
+    model_count: int
+    headline_total: float
+    headline_average: float
+    headline_min: float
+    headline_max: float
+    top_model: SummarySeriesHighlight
+    bottom_model: SummarySeriesHighlight
+    child_count: int = Field(..., description="Number of children one level down, whether or not they are included.")
+    children: Optional[List[SummaryRollupNode]] = Field(
+        default=None,
+        description="Child nodes, when within the requested depth.",
+    )
+
+
+class SummaryRollupPage(DeferredModel):
+    rollup_id: str
+    report_label: str
+    as_of: Optional[datetime]
+    total_models: int
+    overall_headline_total: float
+    path: List[str] = Field(..., description="Keys from the series down to the node whose children are listed.")
+    node: Optional[SummaryRollupNode] = Field(default=None, description="The node at path (null at the top).")
+    offset: int
+    limit: int
+    total_children: int
+    children: List[SummaryRollupNode]
+
+
+class SummaryBatchResult(DeferredModel):
+    index: int = Field(..., description="Position of the report in the submitted batch.")
+    status: Literal["ok", "error"]
+    report: Optional[SummaryReportResponse] = None
+    errors: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Validation or conversion errors when status is 'error'.",
+    )
+
+
+class SummaryBatchResponse(DeferredModel):
+    results: List[SummaryBatchResult]
+
+
+class SummaryJobStatus(DeferredModel):
+    job_id: str
+    status: JobStatus
+    submitted_at: datetime
+    finished_at: Optional[datetime] = None
+    report: Optional[SummaryReportResponse] = Field(default=None, description="Set once status is 'succeeded'.")
+    errors: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Validation or conversion errors when status is 'failed'.",
+    )
+
+
+class SummaryRegisteredModel(DeferredModel):
+    model: str
+    series: str
+    headline_key: str
+    label_key: str
+    source: ModelSource
+    fields: List[str] = Field(..., description="Detail fields accepted in the model's output payload.")
+
+
+class SummaryModelRegistry(DeferredModel):
+    spec_path: Optional[str] = Field(default=None, description="Registry spec file, when one is configured.")
+    spec_digest: Optional[str] = Field(default=None, description="Content digest of the active spec.")
+    loaded_at: Optional[datetime] = None
+    reload_error: Optional[str] = Field(
+        default=None,
+        description="Why the last reload failed; the previous registry stays active until the file is fixed.",
+    )
+    models: List[SummaryRegisteredModel]
+
+
+class SummaryStoredReport(DeferredModel):
+    report_id: str
+    report_label: str
+    as_of: Optional[datetime]
+    stored_at: datetime
+    total_models: int
+    overall_headline_total: float
+    snapshot: str = Field(..., description="Snapshot file name inside the report store.")
+
+    # Index lines must read back: a non-finite total is written as "Infinity"/"NaN", not null.
+    model_config = ConfigDict(ser_json_inf_nan="strings")
+
+
+class SummaryStoredReportList(DeferredModel):
+    reports: List[SummaryStoredReport]
+
+
+class SummaryStoredHeadline(DeferredModel):
+    report_id: str
+    as_of: Optional[datetime]
+    series: str
+    model: str
+    label: Optional[str]
+    headline_amount: float
+    currency: Optional[str]
+
+
+class SummaryStoredHeadlineList(DeferredModel):
+    headlines: List[SummaryStoredHeadline]
+
+
+class SummaryHistoryPoint(DeferredModel):
+    series: str
+    model: str
+    label: Optional[str]
+    as_of: datetime
+    headline_amount: float
+
+
+class SummaryHistoryPointList(DeferredModel):
+    points: List[SummaryHistoryPoint]
+
+
+class SummaryHistoryRollup(DeferredModel):
+    series: str
+    period: str = Field(..., description="Period key, e.g. 2025-08, 2025-Q3, 2025-W33 or 2025-08-15.")
+    snapshots: int = Field(..., description="Distinct as_of timestamps recorded in the period.")
+    entries: int
+    opening_total: float = Field(..., description="Series headline total at the period's first as_of.")
+    closing_total: float = Field(..., description="Series headline total at the period's last as_of.")
+    closing_as_of: datetime
+    mean_total: float
+    min_total: float
+    max_total: float
+
+
+class SummaryHistoryRollupList(DeferredModel):
+    rollups: List[SummaryHistoryRollup]
+
+
+class SummaryHistoryRolling(DeferredModel):
+    series: str
+    period: str
+    closing_total: float
+    window_periods: int = Field(..., description="Periods in the window (fewer at the start of the history).")
+    rolling_mean: float
+    rolling_min: float
+    rolling_max: float
+    change: Optional[float] = Field(default=None, description="Closing total minus the previous period's.")
+
+
+class SummaryHistoryRollingList(DeferredModel):
+    rolling: List[SummaryHistoryRolling]
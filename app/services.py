@@ -1,74 +1,254 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Dict, List
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Union
 
+from .aggregation import ReportAccumulator, StatsAccumulator
+from .columnar import COLUMNAR_THRESHOLD, ColumnarAccumulator, columnar_available
+from .fx import CurrencyAccumulator, RateCache, apply_reporting_amounts
+from .metrics import StageTimer, stage, timed_chunks
+from .schedules import SCHEDULE_MODE_CONTEXT
 from .schemas import (
     SummaryEntry,
     SummaryEntryResult,
+    SummaryModelOutput,
+    SummaryReportDigest,
     SummaryReportRequest,
     SummaryReportResponse,
-    SummarySeriesAggregate,
-    SummarySeriesHighlight,
+    construct_validated,
 )
 
+DEFAULT_REPORT_LABEL = "SEBIT Summary Report"
 
-def build_summary_report(payload: SummaryReportRequest) -> SummaryReportResponse:
-    entries: List[SummaryEntry] = payload.resolve_entries()
-    total_models = len(entries)
-    overall_total = sum(entry.headline_amount for entry in entries)
+# Encoded entries are flushed once this many bytes are pending.
+STREAM_CHUNK_BYTES = 64 * 1024
 
-    grouped: Dict[str, List[SummaryEntry]] = defaultdict(list)
-    for entry in entries:
-        grouped[entry.series].append(entry)
-
-    series_summary: List[SummarySeriesAggregate] = []
-    for series, series_entries in grouped.items():
-        headline_values = [item.headline_amount for item in series_entries]
-        headline_total = sum(headline_values)
-        model_count = len(series_entries)
-        headline_average = headline_total / model_count if model_count else 0.0
-        headline_min = min(headline_values) if headline_values else 0.0
-        headline_max = max(headline_values) if headline_values else 0.0
-
-        top_entry = max(series_entries, key=lambda item: item.headline_amount)
-        bottom_entry = min(series_entries, key=lambda item: item.headline_amount)
-
-        series_summary.append(
-            SummarySeriesAggregate(
-                series=series,
-                model_count=model_count,
-                headline_total=round(headline_total, 2),
-                headline_average=round(headline_average, 2),
-                headline_min=round(headline_min, 2),
-                headline_max=round(headline_max, 2),
-                top_model=SummarySeriesHighlight(
-                    model=top_entry.model,
-                    headline_amount=round(top_entry.headline_amount, 2),
-                ),
-                bottom_model=SummarySeriesHighlight(
-                    model=bottom_entry.model,
-                    headline_amount=round(bottom_entry.headline_amount, 2),
-                ),
-            )
-        )
-
-    response_entries = [
-        SummaryEntryResult(
-            series=entry.series,
-            model=entry.model,
-            headline_amount=round(entry.headline_amount, 2),
-            currency=entry.currency,
-            details=entry.details.model_dump(),
-        )
-        for entry in entries
-    ]
-
-    return SummaryReportResponse(
-        report_label=payload.report_label or "SEBIT Summary Report",
+
+SummaryEngine = Literal["auto", "python", "columnar"]
+
+
+def build_summary_report(
+    payload: SummaryReportRequest,
+    engine: SummaryEngine = "auto",
+    timer: Optional[StageTimer] = None,
+    rates: Optional[RateCache] = None,
+) -> SummaryReportResponse:
+    entries = payload.iter_entries() if timer is None else timed_chunks(payload.iter_entry_chunks(), timer)
+    return summarize_entries(
+        entries,
+        report_label=payload.report_label,
         as_of=payload.as_of,
-        total_models=total_models,
-        overall_headline_total=round(overall_total, 2),
-        series_summary=series_summary,
-        entries=response_entries,
+        engine=engine,
+        size_hint=payload.entry_count(),
+        timer=timer,
+        include_details=payload.detail_mode == "full",
+        reporting_currency=payload.reporting_currency,
+        rates=rates,
+        top_k=payload.top_k,
+        quantiles=payload.quantiles,
+    )
+
+
+def serialization_context(payload: SummaryReportRequest) -> Dict[str, Any]:
+    """Context for ``model_dump_json`` carrying the request's output options."""
+    return {SCHEDULE_MODE_CONTEXT: payload.schedule_mode}
+
+
+def create_accumulator(
+    engine: SummaryEngine = "auto",
+    size_hint: Optional[int] = None,
+    reporting_currency: Optional[str] = None,
+    top_k: int = 0,
+    quantiles: Sequence[float] = (),
+) -> Union[ReportAccumulator, ColumnarAccumulator, CurrencyAccumulator]:
+    if reporting_currency is not None:
+        return CurrencyAccumulator(top_k, quantiles)
+    if top_k or quantiles:
+        return StatsAccumulator(top_k, quantiles)
+    if engine == "columnar" or (
+        engine == "auto"
+        and size_hint is not None
+        and size_hint >= COLUMNAR_THRESHOLD
+        and columnar_available()
+    ):
+        return ColumnarAccumulator()
+    return ReportAccumulator()
+
+
+def summarize_entries(
+    entries: Iterable[SummaryEntry],
+    report_label: Optional[str] = None,
+    as_of: Optional[datetime] = None,
+    engine: SummaryEngine = "auto",
+    size_hint: Optional[int] = None,
+    timer: Optional[StageTimer] = None,
+    include_details: bool = True,
+    reporting_currency: Optional[str] = None,
+    rates: Optional[RateCache] = None,
+    top_k: int = 0,
+    quantiles: Sequence[float] = (),
+) -> SummaryReportResponse:
+    """Aggregate entries in a single pass; ``entries`` may be any iterable or generator.
+
+    With a ``timer`` the pass is recorded as ``aggregate``, less the ``resolve``
+    time charged while producing ``entries`` (see ``timed_chunks``). With a
+    ``reporting_currency`` the aggregates are converted after the pass (``fx``).
+    ``top_k`` and ``quantiles`` add per-series contributors and quantiles.
+    """
+    if size_hint is None and hasattr(entries, "__len__"):
+        size_hint = len(entries)  # type: ignore[arg-type]
+    if timer is not None:
+        started = time.perf_counter()
+    accumulator = create_accumulator(engine, size_hint, reporting_currency, top_k, quantiles)
+    response_entries: List[SummaryEntryResult] = []
+    amounts: Optional[List[float]] = [] if reporting_currency is not None else None
+    for entry in entries:
+        accumulator.add(entry)
+        response_entries.append(entry_result(entry, include_details))
+        if amounts is not None:
+            amounts.append(entry.headline_amount)
+    if timer is not None:
+        timer.add("aggregate", time.perf_counter() - started - timer.stages.get("resolve", 0.0))
+
+    if isinstance(accumulator, CurrencyAccumulator):
+        with stage(timer, "fx"):
+            accumulator.convert(reporting_currency, rates, as_of)
+            apply_reporting_amounts(response_entries, amounts, accumulator.rates)
+    # Everything below was built from validated inputs, so skip re-validation.
+    with stage(timer, "digest"):
+        digest = report_digest(accumulator, report_label, as_of)
+    return SummaryReportResponse.model_construct(**dict(digest), entries=response_entries)
+
+
+def report_digest(
+    accumulator: Union[ReportAccumulator, ColumnarAccumulator, CurrencyAccumulator],
+    report_label: Optional[str] = None,
+    as_of: Optional[datetime] = None,
+) -> SummaryReportDigest:
+    converted = isinstance(accumulator, CurrencyAccumulator)
+    return SummaryReportDigest(
+        report_label=report_label or DEFAULT_REPORT_LABEL,
+        as_of=as_of,
+        total_models=accumulator.count,
+        overall_headline_total=round(accumulator.overall_total, 2),
+        series_summary=accumulator.series_summary(),
+        reporting_currency=accumulator.reporting_currency if converted else None,
+        currency_breakdown=accumulator.currency_breakdown() if converted else None,
+    )
+
+
+def entry_result(entry: SummaryEntry, include_details: bool = True) -> SummaryEntryResult:
+    """Wrap an entry for output, keeping its validated detail model as ``details``."""
+    return construct_validated(
+        SummaryEntryResult,
+        {
+            "series": entry.series,
+            "model": entry.model,
+            "headline_amount": round(entry.headline_amount, 2),
+            "currency": entry.currency,
+            "details": entry.details if include_details else None,
+            "reporting_amount": None,
+        },
     )
+
+
+def iter_summary_report_json(
+    payload: SummaryReportRequest,
+    engine: SummaryEngine = "auto",
+    rates: Optional[RateCache] = None,
+) -> Iterator[bytes]:
+    """Return an iterator over a ``SummaryReportResponse`` JSON document.
+
+    Aggregation (and FX conversion) happens before this returns, so errors
+    surface before anything is sent. The header and ``series_summary`` are
+    yielded first; entries are then encoded one at a time and flushed in
+    chunks, so the full response is never held.
+    """
+    entries = payload.resolve_entries()
+    accumulator = create_accumulator(
+        engine, len(entries), payload.reporting_currency, payload.top_k, payload.quantiles
+    )
+    for entry in entries:
+        accumulator.add(entry)
+    converted = isinstance(accumulator, CurrencyAccumulator)
+    if converted:
+        accumulator.convert(payload.reporting_currency, rates, payload.as_of)
+    header = report_digest(accumulator, payload.report_label, payload.as_of).model_dump_json()
+    return _iter_report_chunks(payload, entries, header, accumulator.rates if converted else None)
+
+
+def _iter_report_chunks(
+    payload: SummaryReportRequest,
+    entries: List[SummaryEntry],
+    header: str,
+    rates: Optional[Dict[Optional[str], float]],
+) -> Iterator[bytes]:
+    yield header[:-1].encode() + b',"entries":['
+
+    context = serialization_context(payload)
+    include_details = payload.detail_mode == "full"
+    pending: List[bytes] = []
+    pending_bytes = 0
+    for index, entry in enumerate(entries):
+        result = entry_result(entry, include_details)
+        if rates is not None:
+            apply_reporting_amounts((result,), (entry.headline_amount,), rates)
+        encoded = result.model_dump_json(context=context).encode()
+        pending.append(b"," + encoded if index else encoded)
+        pending_bytes += len(encoded)
+        if pending_bytes >= STREAM_CHUNK_BYTES:
+            yield b"".join(pending)
+            pending.clear()
+            pending_bytes = 0
+    pending.append(b"]}")
+    yield b"".join(pending)
+
+
+class NdjsonRecordError(ValueError):
+    def __init__(self, line: int, reason: object) -> None:
+        super().__init__(f"Line {line}: {reason}")
+        self.line = line
+
+
+class NdjsonReportBuilder:
+    """Folds newline-delimited ``SummaryModelOutput`` records into running aggregates.
+
+    Only the current partial line and the per-series accumulators are kept, so
+    memory stays bounded regardless of how many records are streamed in
+    (top-K lists and quantile sketches are bounded too).
+    """
+
+    def __init__(self, top_k: int = 0, quantiles: Sequence[float] = ()) -> None:
+        self.accumulator = StatsAccumulator(top_k, quantiles) if top_k or quantiles else ReportAccumulator()
+        self._buffer = b""
+        self._line = 0
+
+    def feed(self, chunk: bytes) -> None:
+        lines = (self._buffer + chunk).split(b"\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            self._fold(line)
+
+    def close(self) -> None:
+        if self._buffer:
+            self._fold(self._buffer)
+            self._buffer = b""
+
+    def digest(
+        self, report_label: Optional[str] = None, as_of: Optional[datetime] = None
+    ) -> SummaryReportDigest:
+        if not self.accumulator.count:
+            raise ValueError("The NDJSON stream did not contain any model outputs.")
+        return report_digest(self.accumulator, report_label, as_of)
+
+    def _fold(self, line: bytes) -> None:
+        self._line += 1
+        if not line.strip():
+            return
+        try:
+            item = SummaryModelOutput.model_validate_json(line)
+            entry = SummaryEntry.from_model_output(item.model_name, item.payload, currency=item.currency)
+        except ValueError as exc:
+            raise NdjsonRecordError(self._line, exc) from exc
+        self.accumulator.add(entry)
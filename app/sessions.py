@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import heapq
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .aggregation import CompensatedSum, series_aggregate
+from .schemas import (
+    MODEL_REGISTRY,
+    SummaryEntry,
+    SummaryReportResponse,
+    SummarySeriesAggregate,
+    SummarySessionDigest,
+)
+from .services import DEFAULT_REPORT_LABEL, entry_result
+
+OutputKey = Tuple[str, str]
+
+
+class SeriesIndex:
+    """Per-series aggregate that supports removal in O(log n).
+
+    Totals use a compensated sum (subtracting a removed amount is exact) and the
+    top/bottom models come from lazily pruned heaps. Entries are ordered by their
+    session position so ties resolve like a full rebuild would.
+    """
+
+    def __init__(self, series: str) -> None:
+        self.series = series
+        self.total = CompensatedSum()
+        self._live: Dict[OutputKey, Tuple[float, int, str]] = {}
+        self._max_heap: List[Tuple[float, int, OutputKey]] = []
+        self._min_heap: List[Tuple[float, int, OutputKey]] = []
+        self._positions: List[Tuple[int, OutputKey]] = []
+
+    @property
+    def count(self) -> int:
+        return len(self._live)
+
+    @property
+    def first_position(self) -> int:
+        heap = self._positions
+        while heap and self._live.get(heap[0][1], (None, None))[1] != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0]
+
+    def add(self, key: OutputKey, position: int, model: str, amount: float) -> None:
+        self._live[key] = (amount, position, model)
+        self.total.add(amount)
+        heapq.heappush(self._max_heap, (-amount, position, key))
+        heapq.heappush(self._min_heap, (amount, position, key))
+        heapq.heappush(self._positions, (position, key))
+
+    def remove(self, key: OutputKey) -> None:
+        amount, _, _ = self._live.pop(key)
+        self.total.add(-amount)
+        if len(self._max_heap) > 2 * len(self._live) + 32:
+            self._compact()
+
+    def to_aggregate(self) -> SummarySeriesAggregate:
+        top_amount, _, top_model = self._peek(self._max_heap, -1.0)
+        bottom_amount, _, bottom_model = self._peek(self._min_heap, 1.0)
+        return series_aggregate(
+            self.series,
+            self.count,
+            self.total.value,
+            bottom_amount,
+            top_amount,
+            top_model,
+            bottom_model,
+        )
+
+    def _peek(self, heap: List[Tuple[float, int, OutputKey]], sign: float) -> Tuple[float, int, str]:
+        while True:
+            signed_amount, position, key = heap[0]
+            live = self._live.get(key)
+            if live is not None and live[0] == sign * signed_amount and live[1] == position:
+                return live
+            heapq.heappop(heap)
+
+    def _compact(self) -> None:
+        self._max_heap = [(-amount, position, key) for key, (amount, position, _) in self._live.items()]
+        self._min_heap = [(amount, position, key) for key, (amount, position, _) in self._live.items()]
+        self._positions = [(position, key) for key, (_, position, _) in self._live.items()]
+        for heap in (self._max_heap, self._min_heap, self._positions):
+            heapq.heapify(heap)
+
+
+class ReportSession:
+    """Stateful report whose model outputs can be replaced or removed individually.
+
+    Outputs are keyed by ``(model, label)``; replacing one keeps its original
+    position, and only its series aggregate and the overall total are touched.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        report_label: Optional[str] = None,
+        as_of: Optional[datetime] = None,
+    ) -> None:
+        self.session_id = session_id
+        self.report_label = report_label or DEFAULT_REPORT_LABEL
+        self.as_of = as_of
+        self.lock = threading.Lock()
+        self.total = CompensatedSum()
+        self._entries: Dict[OutputKey, SummaryEntry] = {}
+        self._positions: Dict[OutputKey, int] = {}
+        self._next_position = 0
+        self._series: Dict[str, SeriesIndex] = {}
+
+    @staticmethod
+    def key_for(entry: SummaryEntry) -> OutputKey:
+        # Validates a lazily converted output now, so a session never holds details that fail later.
+        details = entry.details
+        if details is None and entry.model in MODEL_REGISTRY:
+            raise ValueError(
+                f"Model '{entry.model}' output was converted without details (detail_mode='none'), "
+                "so it has no label to be tracked by in a session."
+            )
+        label = entry.label
+        if label is None:
+            raise ValueError(f"Model '{entry.model}' has no registered label and cannot be tracked in a session.")
+        return entry.model, label
+
+    def upsert(self, entry: SummaryEntry, key: Optional[OutputKey] = None) -> OutputKey:
+        """Add or replace ``entry``; pass ``key`` when it was already taken with ``key_for``."""
+        key = key or self.key_for(entry)
+        position = self._positions.get(key)
+        if position is None:
+            position = self._positions[key] = self._next_position
+            self._next_position += 1
+        else:
+            self._discard(key)
+
+        index = self._series.get(entry.series)
+        if index is None:
+            index = self._series[entry.series] = SeriesIndex(entry.series)
+        index.add(key, position, entry.model, entry.headline_amount)
+        self.total.add(entry.headline_amount)
+        self._entries[key] = entry
+        return key
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def remove(self, model: str, label: str) -> bool:
+        key = (model, label)
+        if key not in self._entries:
+            return False
+        self._discard(key)
+        del self._positions[key]
+        return True
+
+    def digest(self) -> SummarySessionDigest:
+        series = sorted(self._series.values(), key=lambda index: index.first_position)
+        return SummarySessionDigest(
+            session_id=self.session_id,
+            report_label=self.report_label,
+            as_of=self.as_of,
+            total_models=len(self._entries),
+            overall_headline_total=round(self.total.value, 2),
+            series_summary=[index.to_aggregate() for index in series],
+        )
+
+    def report(self) -> SummaryReportResponse:
+        digest = self.digest()
+        entries = sorted(self._entries.items(), key=lambda item: self._positions[item[0]])
+        return SummaryReportResponse.model_construct(
+            **{name: value for name, value in digest if name != "session_id"},
+            entries=[entry_result(entry) for _, entry in entries],
+        )
+
+    def _discard(self, key: OutputKey) -> None:
+        entry = self._entries.pop(key)
+        index = self._series[entry.series]
+        index.remove(key)
+        if not index.count:
+            del self._series[entry.series]
+        self.total.add(-entry.headline_amount)
+
+
+class SessionStore:
+    """Bounded in-memory registry of report sessions (least recently used dropped first)."""
+
+    def __init__(self, max_sessions: int = 256) -> None:
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, ReportSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(
+        self,
+        entries: Iterable[SummaryEntry],
+        report_label: Optional[str] = None,
+        as_of: Optional[datetime] = None,
+    ) -> ReportSession:
+        session = ReportSession(uuid.uuid4().hex, report_label, as_of)
+        for entry in entries:
+            session.upsert(entry)
+        with self._lock:
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id: str) -> Optional[ReportSession]:
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+ENV_PREFIX = "SEBIT_SUMMARY_"
+
+
+def _flag(value: Optional[str], default: bool) -> bool:
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    if value is None or value.strip() == "":
+        return None
+    return float(value)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Service configuration, read from ``SEBIT_SUMMARY_*`` environment variables."""
+
+    cache_max_entries: int = 128
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_ttl_seconds: Optional[float] = None
+    # Keep the report cache in this directory (e.g. on /dev/shm) so every worker
+    # process shares it; unset keeps a per-process in-memory cache.
+    cache_dir: Optional[str] = None
+    # Also match requests that differ only in key order or whitespace, at the
+    # cost of parsing and re-encoding every body whose raw bytes miss.
+    cache_canonical_keys: bool = False
+    session_max_count: int = 256
+    # Built drill-down rollup trees kept for paging (least recently used dropped first).
+    rollup_max_count: int = 64
+    # Process pool size for batch reports; 0 uses every available core.
+    batch_workers: int = 0
+    # Asynchronous report jobs: queued-or-running limit before 429, worker
+    # count (0 uses every available core) and finished jobs kept for polling.
+    job_queue_size: int = 64
+    job_workers: int = 0
+    job_retention: int = 1024
+    # Stage histograms served on /metrics; per-entry timing is skipped while off.
+    metrics_enabled: bool = False
+    # Attach a Server-Timing header with the stage durations to report responses.
+    server_timing: bool = False
+    # Directory for persisted report snapshots; unset disables the report store.
+    store_path: Optional[str] = None
+    # Time-series index over report as_of values, rolled up per history_period
+    # (day, week, month or quarter). Rebuilt from the report store on startup.
+    history_enabled: bool = False
+    history_period: str = "month"
+    # JSON rate table ({"base": ..., "rates": {...}, "dated": {...}}) used for reporting_currency.
+    fx_rates_path: Optional[str] = None
+    # JSON spec of models added to or changed in the registry (see app/registry.py),
+    # reloaded when the file changes (checked every registry_poll_seconds; 0 disables).
+    registry_path: Optional[str] = None
+    registry_poll_seconds: float = 5.0
+    # Build request/response schemas on their first use instead of in
+    # create_app: a faster cold start for a slower first report.
+    fast_startup: bool = False
+
+    @property
+    def cache_enabled(self) -> bool:
+        return self.cache_max_entries > 0 and self.cache_max_bytes > 0
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        env = os.environ if environ is None else environ
+        defaults = cls()
+        return cls(
+            cache_max_entries=int(env.get(f"{ENV_PREFIX}CACHE_MAX_ENTRIES", defaults.cache_max_entries)),
+            cache_max_bytes=int(env.get(f"{ENV_PREFIX}CACHE_MAX_BYTES", defaults.cache_max_bytes)),
+            cache_ttl_seconds=_optional_float(env.get(f"{ENV_PREFIX}CACHE_TTL_SECONDS")),
+            cache_dir=env.get(f"{ENV_PREFIX}CACHE_DIR") or None,
+            cache_canonical_keys=_flag(env.get(f"{ENV_PREFIX}CACHE_CANONICAL_KEYS"), defaults.cache_canonical_keys),
+            session_max_count=int(env.get(f"{ENV_PREFIX}SESSION_MAX_COUNT", defaults.session_max_count)),
+            rollup_max_count=int(env.get(f"{ENV_PREFIX}ROLLUP_MAX_COUNT", defaults.rollup_max_count)),
+            batch_workers=int(env.get(f"{ENV_PREFIX}BATCH_WORKERS", defaults.batch_workers)),
+            job_queue_size=int(env.get(f"{ENV_PREFIX}JOB_QUEUE_SIZE", defaults.job_queue_size)),
+            job_workers=int(env.get(f"{ENV_PREFIX}JOB_WORKERS", defaults.job_workers)),
+            job_retention=int(env.get(f"{ENV_PREFIX}JOB_RETENTION", defaults.job_retention)),
+            metrics_enabled=_flag(env.get(f"{ENV_PREFIX}METRICS"), defaults.metrics_enabled),
+            server_timing=_flag(env.get(f"{ENV_PREFIX}SERVER_TIMING"), defaults.server_timing),
+            store_path=env.get(f"{ENV_PREFIX}STORE_PATH") or None,
+            history_enabled=_flag(env.get(f"{ENV_PREFIX}HISTORY"), defaults.history_enabled),
+            history_period=env.get(f"{ENV_PREFIX}HISTORY_PERIOD", defaults.history_period),
+            fx_rates_path=env.get(f"{ENV_PREFIX}FX_RATES_PATH") or None,
+            registry_path=env.get(f"{ENV_PREFIX}REGISTRY_PATH") or None,
+            registry_poll_seconds=float(env.get(f"{ENV_PREFIX}REGISTRY_POLL_SECONDS", defaults.registry_poll_seconds)),
+            fast_startup=_flag(env.get(f"{ENV_PREFIX}FAST_STARTUP"), defaults.fast_startup),
+        )
@@ -0,0 +1,178 @@
+"""Bounded-memory, mergeable summaries of headline streams.
+
+``TopK`` keeps the k largest values in a min-heap; ``KllSketch`` is the
+Karnin-Lang-Liberty quantile sketch. Both take one value at a time, merge
+with other instances (partial reports, worker shards), and can be rescaled by
+a positive factor, which is how converted currencies are combined.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+from typing import Any, Dict, Generic, List, Sequence, Tuple, TypeVar
+
+ItemT = TypeVar("ItemT")
+
+KLL_DEFAULT_K = 200
+_KLL_SHRINK = 2.0 / 3.0
+
+
+class TopK(Generic[ItemT]):
+    """The ``k`` largest values seen, each with an item; the first seen wins ties.
+
+    ``offer`` is O(1) for values that do not make the cut and O(log k) otherwise.
+    """
+
+    __slots__ = ("k", "_heap", "_seen")
+
+    def __init__(self, k: int) -> None:
+        self.k = k
+        self._heap: List[Tuple[float, int, ItemT]] = []
+        self._seen = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def accepts(self, value: float) -> bool:
+        return len(self._heap) < self.k or (self.k > 0 and value > self._heap[0][0])
+
+    def push(self, value: float, item: ItemT) -> None:
+        """Add a value that ``accepts`` approved."""
+        self._seen += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, (value, -self._seen, item))
+        else:
+            heapq.heapreplace(self._heap, (value, -self._seen, item))
+
+    def offer(self, value: float, item: ItemT) -> None:
+        if self.accepts(value):
+            self.push(value, item)
+
+    def items(self) -> List[Tuple[float, ItemT]]:
+        """Largest first; ties keep arrival order."""
+        return [(value, item) for value, _, item in sorted(self._heap, reverse=True)]
+
+    def merge(self, other: "TopK[ItemT]") -> None:
+        for value, item in other.items():
+            self.offer(value, item)
+
+    def scaled(self, factor: float) -> "TopK[ItemT]":
+        scaled: TopK[ItemT] = TopK(self.k)
+        scaled._heap = [(value * factor, order, item) for value, order, item in self._heap]
+        scaled._seen = self._seen
+        return scaled
+
+    def to_state(self) -> List[Tuple[float, ItemT]]:
+        return self.items()
+
+    @classmethod
+    def from_state(cls, k: int, items: Sequence[Tuple[float, ItemT]]) -> "TopK[ItemT]":
+        top: TopK[ItemT] = cls(k)
+        for value, item in items:
+            top.offer(value, item)
+        return top
+
+
+class KllSketch:
+    """KLL quantile sketch: O(k) memory, rank error of about 1.65 / k.
+
+    Level ``h`` holds items of weight ``2**h``. A full level is sorted and
+    every other item is promoted to the next level, starting at a random
+    offset. While fewer than about ``k`` items have been seen nothing is
+    compacted and quantiles are exact. The offsets come from a fixed seed,
+    so equal input gives equal results.
+    """
+
+    __slots__ = ("k", "count", "_levels", "_size", "_capacity", "_random")
+
+    def __init__(self, k: int = KLL_DEFAULT_K, seed: int = 0) -> None:
+        self.k = k
+        self.count = 0
+        self._levels: List[List[float]] = []
+        self._size = 0
+        self._capacity = 0
+        self._random = random.Random(seed)
+        self._grow()
+
+    def _level_capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return int(math.ceil(_KLL_SHRINK**depth * self.k)) + 1
+
+    def _grow(self) -> None:
+        self._levels.append([])
+        self._capacity = sum(self._level_capacity(level) for level in range(len(self._levels)))
+
+    def add(self, value: float) -> None:
+        self._levels[0].append(value)
+        self._size += 1
+        self.count += 1
+        if self._size >= self._capacity:
+            self._compress()
+
+    def _compress(self) -> None:
+        for level in range(len(self._levels)):
+            items = self._levels[level]
+            if len(items) < self._level_capacity(level):
+                continue
+            if level + 1 == len(self._levels):
+                self._grow()
+            items.sort()
+            start = self._random.random() < 0.5
+            # Keep an odd leftover in place so no weight is lost.
+            paired = len(items) - len(items) % 2
+            self._levels[level + 1].extend(items[start:paired:2])
+            del items[:paired]
+            self._size = sum(len(level_items) for level_items in self._levels)
+            if self._size < self._capacity:
+                break
+
+    def merge(self, other: "KllSketch") -> None:
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self.count += other.count
+        self._size = sum(len(items) for items in self._levels)
+        while self._size >= self._capacity:
+            self._compress()
+
+    def scaled(self, factor: float) -> "KllSketch":
+        """The sketch of every value multiplied by ``factor`` (> 0)."""
+        scaled = KllSketch(self.k)
+        scaled._levels = [[value * factor for value in items] for items in self._levels]
+        scaled.count, scaled._size, scaled._capacity = self.count, self._size, self._capacity
+        return scaled
+
+    def quantiles(self, fractions: Sequence[float]) -> List[float]:
+        """Lower nearest-rank quantiles: the smallest value whose cumulative weight reaches ``q * count``."""
+        if not self.count:
+            return [math.nan for _ in fractions]
+        weighted = sorted(
+            (value, 1 << level) for level, items in enumerate(self._levels) for value in items
+        )
+        total = sum(weight for _, weight in weighted)
+        results = []
+        for fraction in fractions:
+            target = max(1.0, fraction * total)
+            cumulative = 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target - 1e-9:
+                    break
+            results.append(value)
+        return results
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"k": self.k, "count": self.count, "levels": [list(items) for items in self._levels]}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "KllSketch":
+        sketch = cls(state["k"])
+        while len(sketch._levels) < len(state["levels"]):
+            sketch._grow()
+        sketch._levels = [list(items) for items in state["levels"]]
+        sketch.count = state["count"]
+        sketch._size = sum(len(items) for items in sketch._levels)
+        return sketch
@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+import sys
+import threading
+import uuid
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from .schemas import (
+    SummaryReportResponse,
+    SummaryStoredHeadline,
+    SummaryStoredReport,
+    registered_label,
+)
+from .services import STREAM_CHUNK_BYTES
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"SEBITRS1"
+SNAPSHOT_SUFFIX = ".snapshot"
+INDEX_FILE = "index.jsonl"
+
+# Sections start on 8-byte boundaries so the int64/float64 columns are aligned.
+_ALIGNMENT = 8
+_HEADER_SIZE = struct.Struct("<I")
+
+_dump_value = TypeAdapter(Any).dump_json
+# Same float encoding as the response models: non-finite values become ``null``.
+_dump_float = TypeAdapter(float).dump_json
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % _ALIGNMENT)
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+class ReportEncoding(NamedTuple):
+    """A report's JSON pieces, encoded once for both its response and its snapshot."""
+
+    digest: bytes
+    details: List[bytes]
+
+
+def encode_report(report: SummaryReportResponse, context: Optional[Dict[str, Any]] = None) -> ReportEncoding:
+    return ReportEncoding(
+        digest=report.model_dump_json(exclude={"entries"}).encode(),
+        details=[_dump_value(entry.details, context=context) for entry in report.entries],
+    )
+
+
+def report_json(report: SummaryReportResponse, encoding: ReportEncoding) -> bytes:
+    """``report`` as JSON, assembled from ``encoding`` the same way its snapshot is replayed."""
+    rows = (
+        (
+            _dump_string(entry.series),
+            _dump_string(entry.model),
+            entry.headline_amount,
+            _dump_string(entry.currency),
+            details,
+            math.nan if entry.reporting_amount is None else entry.reporting_amount,
+        )
+        for entry, details in zip(report.entries, encoding.details)
+    )
+    return b"".join(_iter_report_json(encoding.digest, rows))
+
+
+def _dump_string(value: Optional[str]) -> bytes:
+    return json.dumps(value).encode()
+
+
+def _iter_report_json(digest: bytes, rows: Iterable[Tuple[bytes, bytes, float, bytes, bytes, float]]) -> Iterator[bytes]:
+    """Chunks of a ``SummaryReportResponse`` document; ``rows`` hold each entry's pre-encoded parts."""
+    yield digest[:-1] + b',"entries":['
+    pending: List[bytes] = []
+    pending_bytes = 0
+    for index, (series, model, headline, currency, details, reporting_amount) in enumerate(rows):
+        encoded = (
+            b'%s{"series":%s,"model":%s,"headline_amount":%s,"currency":%s,"details":%s,"reporting_amount":%s}'
+            % (
+                b"," if index else b"",
+                series,
+                model,
+                _dump_float(headline),
+                currency,
+                details,
+                b"null" if math.isnan(reporting_amount) else _dump_float(reporting_amount),
+            )
+        )
+        pending.append(encoded)
+        pending_bytes += len(encoded)
+        if pending_bytes >= STREAM_CHUNK_BYTES:
+            yield b"".join(pending)
+            pending.clear()
+            pending_bytes = 0
+    pending.append(b"]}")
+    yield b"".join(pending)
+
+
+def encode_snapshot(report: SummaryReportResponse, encoding: ReportEncoding) -> List[bytes]:
+    """The contents of ``report``'s columnar snapshot file, in order.
+
+    Layout: magic, header length, JSON header (digest, string tables, section
+    offsets), then aligned sections: int32 series/model/currency codes, float64
+    headlines and reporting amounts (NaN when unconverted), and int64 offsets
+    into JSON blobs of labels and details.
+    """
+    codes: Dict[str, Dict[Optional[str], int]] = {"series": {}, "models": {}, "currencies": {}}
+
+    def code(table: str, value: Optional[str]) -> int:
+        values = codes[table]
+        found = values.get(value)
+        if found is None:
+            found = values[value] = len(values)
+        return found
+
+    series_codes, model_codes, currency_codes = array("i"), array("i"), array("i")
+    headlines, reporting_amounts = array("d"), array("d")
+    label_offsets, detail_offsets = array("q", [0]), array("q", [0])
+    labels: List[bytes] = []
+    label_size = detail_size = 0
+    for entry, encoded_details in zip(report.entries, encoding.details):
+        series_codes.append(code("series", entry.series))
+        model_codes.append(code("models", entry.model))
+        currency_codes.append(code("currencies", entry.currency))
+        headlines.append(entry.headline_amount)
+        reporting_amounts.append(math.nan if entry.reporting_amount is None else entry.reporting_amount)
+        encoded_label = _dump_value(registered_label(entry.model, entry.details))
+        labels.append(encoded_label)
+        label_size += len(encoded_label)
+        detail_size += len(encoded_details)
+        label_offsets.append(label_size)
+        detail_offsets.append(detail_size)
+
+    sections: List[Tuple[str, bytes]] = [
+        ("series", series_codes.tobytes()),
+        ("models", model_codes.tobytes()),
+        ("currencies", currency_codes.tobytes()),
+        ("headlines", headlines.tobytes()),
+        ("reporting_amounts", reporting_amounts.tobytes()),
+        ("label_offsets", label_offsets.tobytes()),
+        ("detail_offsets", detail_offsets.tobytes()),
+        ("labels", b"".join(labels)),
+        ("details", b"".join(encoding.details)),
+    ]
+    layout: Dict[str, Tuple[int, int]] = {}
+    position = 0
+    for name, data in sections:
+        layout[name] = (position, len(data))
+        position += len(data) + len(_padding(len(data)))
+
+    header = json.dumps(
+        {
+            "byteorder": sys.byteorder,
+            "count": len(headlines),
+            "digest": json.loads(encoding.digest),
+            "series": list(codes["series"]),
+            "models": list(codes["models"]),
+            "currencies": list(codes["currencies"]),
+            "sections": layout,
+        }
+    ).encode()
+    preamble = SNAPSHOT_MAGIC + _HEADER_SIZE.pack(len(header)) + header
+    parts = [preamble, _padding(len(preamble))]
+    for _, data in sections:
+        parts.append(data)
+        parts.append(_padding(len(data)))
+    return parts
+
+
+def write_snapshot(path: str, parts: Iterable[bytes]) -> None:
+    """Write a snapshot file atomically: to a temporary file, synced, then renamed."""
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        for data in parts:
+            handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temporary, path)
+
+
+class ReportSnapshot:
+    """Read-only, memory-mapped view of one snapshot file.
+
+    Columns are ``memoryview`` casts over the mapping, so scanning headlines or
+    replaying a report only touches the pages that are read.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._handle = open(path, "rb")
+        self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[memoryview] = []
+        try:
+            view = self._track(memoryview(self._map))
+            if bytes(view[: len(SNAPSHOT_MAGIC)]) != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a report snapshot.")
+            start = len(SNAPSHOT_MAGIC)
+            (header_size,) = _HEADER_SIZE.unpack_from(view, start)
+            start += _HEADER_SIZE.size
+            header = json.loads(bytes(view[start : start + header_size]))
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine.")
+            start += header_size
+            self._data_start = start + len(_padding(start))
+            self._view = view
+            self.header = header
+            self.count: int = header["count"]
+            self.series: List[str] = header["series"]
+            self.models: List[str] = header["models"]
+            self.currencies: List[Optional[str]] = header["currencies"]
+            self.series_codes = self._section("series", "i")
+            self.model_codes = self._section("models", "i")
+            self.currency_codes = self._section("currencies", "i")
+            self.headlines = self._section("headlines", "d")
+            self.reporting_amounts = self._section("reporting_amounts", "d")
+            self.label_offsets = self._section("label_offsets", "q")
+            self.detail_offsets = self._section("detail_offsets", "q")
+            self.label_blob = self._section("labels", "B")
+            self.detail_blob = self._section("details", "B")
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ReportSnapshot":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _track(self, view: memoryview) -> memoryview:
+        self._views.append(view)
+        return view
+
+    def _section(self, name: str, typecode: str) -> memoryview:
+        offset, size = self.header["sections"][name]
+        start = self._data_start + offset
+        raw = self._track(self._view[start : start + size])
+        return raw if typecode == "B" else self._track(raw.cast(typecode))
+
+    def close(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._map.close()
+        self._handle.close()
+
+    def label(self, index: int) -> Optional[str]:
+        return json.loads(bytes(self.label_blob[self.label_offsets[index] : self.label_offsets[index + 1]]))
+
+    def details_json(self, index: int) -> bytes:
+        return bytes(self.detail_blob[self.detail_offsets[index] : self.detail_offsets[index + 1]])
+
+    def matching(self, model: Optional[str] = None, series: Optional[str] = None) -> Iterator[int]:
+        """Indices of entries with the given model and/or series, found by scanning the code columns."""
+        model_code = self.models.index(model) if model in self.models else None
+        series_code = self.series.index(series) if series in self.series else None
+        if (model is not None and model_code is None) or (series is not None and series_code is None):
+            return iter(())
+        if model_code is not None and series_code is not None:
+            return (
+                index
+                for index, (entry_model, entry_series) in enumerate(zip(self.model_codes, self.series_codes))
+                if entry_model == model_code and entry_series == series_code
+            )
+        if model_code is not None:
+            return (index for index, entry_model in enumerate(self.model_codes) if entry_model == model_code)
+        if series_code is not None:
+            return (index for index, entry_series in enumerate(self.series_codes) if entry_series == series_code)
+        return iter(range(self.count))
+
+    def iter_report_json(self) -> Iterator[bytes]:
+        """Yield the stored ``SummaryReportResponse`` as JSON in chunks."""
+        digest = json.dumps(self.header["digest"], separators=(",", ":")).encode()
+        series = [_dump_string(name) for name in self.series]
+        models = [_dump_string(name) for name in self.models]
+        currencies = [_dump_string(name) for name in self.currencies]
+        rows = (
+            (
+                series[self.series_codes[index]],
+                models[self.model_codes[index]],
+                self.headlines[index],
+                currencies[self.currency_codes[index]],
+                self.details_json(index),
+                self.reporting_amounts[index],
+            )
+            for index in range(self.count)
+        )
+        yield from _iter_report_json(digest, rows)
+
+
+class ReportStore:
+    """Append-only directory of report snapshots plus a JSON-lines index.
+
+    Each report is written once to its own snapshot file and never modified;
+    the index is only appended to, and is re-read incrementally so several
+    processes can share one store directory. Snapshots are written and synced
+    by a background thread; a report is indexed once its snapshot is durable.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._index_path = os.path.join(root, INDEX_FILE)
+        self._reports: Dict[str, SummaryStoredReport] = {}
+        self._index_offset = 0
+        self._lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-store")
+        self._pending: List[Future] = []
+        self._refresh()
+
+    def _refresh(self) -> None:
+        with self._lock:
+            try:
+                with open(self._index_path, "rb") as handle:
+                    handle.seek(self._index_offset)
+                    data = handle.read()
+            except FileNotFoundError:
+                return
+            # A trailing partial line belongs to a write still in progress.
+            complete = data[: data.rfind(b"\n") + 1]
+            for line in complete.splitlines():
+                if line.strip():
+                    record = SummaryStoredReport.model_validate_json(line)
+                    self._reports[record.report_id] = record
+            self._index_offset += len(complete)
+
+    def append(
+        self,
+        report: SummaryReportResponse,
+        context: Optional[Dict[str, Any]] = None,
+        encoding: Optional[ReportEncoding] = None,
+    ) -> SummaryStoredReport:
+        """Queue ``report`` for writing and return its record straight away.
+
+        Pass the ``encoding`` its response was built from to reuse the encoded
+        details. Reads through this store wait for the queued writes.
+        """
+        report_id = uuid.uuid4().hex
+        parts = encode_snapshot(report, encoding or encode_report(report, context))
+        record = SummaryStoredReport(
+            report_id=report_id,
+            report_label=report.report_label,
+            as_of=report.as_of,
+            stored_at=datetime.now(timezone.utc),
+            total_models=report.total_models,
+            overall_headline_total=report.overall_headline_total,
+            snapshot=f"{report_id}{SNAPSHOT_SUFFIX}",
+        )
+        future = self._writer.submit(self._write, record, parts)
+        with self._lock:
+            self._pending = [pending for pending in self._pending if not pending.done()]
+            self._pending.append(future)
+        return record
+
+    def _write(self, record: SummaryStoredReport, parts: List[bytes]) -> None:
+        try:
+            write_snapshot(os.path.join(self.root, record.snapshot), parts)
+            line = record.model_dump_json().encode() + b"\n"
+            with self._lock:
+                # O_APPEND keeps concurrent writers' lines whole.
+                descriptor = os.open(self._index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(descriptor, line)
+                finally:
+                    os.close(descriptor)
+        except OSError:
+            logger.exception("Could not store report %s", record.report_id)
+
+    def flush(self) -> None:
+        """Wait until every report appended so far is written and indexed."""
+        with self._lock:
+            pending = list(self._pending)
+        wait(pending)
+        self._refresh()
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=True)
+
+    def get(self, report_id: str) -> Optional[SummaryStoredReport]:
+        self.flush()
+        return self._reports.get(report_id)
+
+    def open(self, record: SummaryStoredReport) -> ReportSnapshot:
+        return ReportSnapshot(os.path.join(self.root, record.snapshot))
+
+    def reports(
+        self,
+        as_of_from: Optional[datetime] = None,
+        as_of_to: Optional[datetime] = None,
+        report_label: Optional[str] = None,
+    ) -> List[SummaryStoredReport]:
+        """Stored reports whose ``as_of`` (or storage time) lies in ``[as_of_from, as_of_to]``."""
+        self.flush()
+        start, end = _utc(as_of_from), _utc(as_of_to)
+        selected = []
+        for record in list(self._reports.values()):
+            moment = _utc(record.as_of or record.stored_at)
+            if start is not None and moment < start:
+                continue
+            if end is not None and moment > end:
+                continue
+            if report_label is not None and record.report_label != report_label:
+                continue
+            selected.append(record)
+        return selected
+
+    def headlines(
+        self,
+        model: Optional[str] = None,
+        series: Optional[str] = None,
+        as_of_from: Optional[datetime] = None,
+        as_of_to: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[SummaryStoredHeadline]:
+        results: List[SummaryStoredHeadline] = []
+        for record in self.reports(as_of_from, as_of_to):
+            with self.open(record) as snapshot:
+                for index in snapshot.matching(model, series):
+                    results.append(
+                        SummaryStoredHeadline(
+                            report_id=record.report_id,
+                            as_of=record.as_of,
+                            series=snapshot.series[snapshot.series_codes[index]],
+                            model=snapshot.models[snapshot.model_codes[index]],
+                            label=snapshot.label(index),
+                            headline_amount=snapshot.headlines[index],
+                            currency=snapshot.currencies[snapshot.currency_codes[index]],
+                        )
+                    )
+                    if limit is not None and len(results) >= limit:
+                        return results
+        return results
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from fastapi import FastAPI
+
+from .schemas import MODEL_REGISTRY, SummaryReportRequest
+from .services import build_summary_report, serialization_context
+
+
+def warm_up(app: FastAPI) -> None:
+    """Build what is otherwise created on first use.
+
+    Called in the gunicorn master before it forks (see ``gunicorn.conf.py``):
+    the OpenAPI schema, the bound detail validators and one small report
+    through the request path then live in memory the workers share through
+    copy-on-write, instead of being rebuilt by each worker on its first
+    request.
+    """
+    app.openapi()
+    for entry in MODEL_REGISTRY.values():
+        entry.validate_details
+    payload = SummaryReportRequest.model_validate(
+        {
+            "detail_mode": "none",
+            "model_outputs": [
+                {"model_name": name, "payload": {entry.headline_key: 0.0}} for name, entry in MODEL_REGISTRY.items()
+            ],
+        }
+    )
+    build_summary_report(payload).model_dump_json(context=serialization_context(payload))
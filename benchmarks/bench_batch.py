@@ -0,0 +1,43 @@
+"""Wall-clock time of a report batch as the process pool grows.
+
+Run with ``python -m benchmarks.bench_batch [--reports N] [--entries M]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from app.batch import ReportBatchExecutor, available_cores
+
+from .payloads import report_request
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reports", type=int, default=32)
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--schedule-rows", type=int, default=12)
+    args = parser.parse_args()
+
+    documents = [
+        report_request(args.entries, schedule_rows=args.schedule_rows, seed=seed) for seed in range(args.reports)
+    ]
+    workers = 1
+    print(f"{args.reports} reports x {args.entries} entries")
+    while True:
+        executor = ReportBatchExecutor(max_workers=workers)
+        asyncio.run(executor.run(documents[: workers * 2]))  # start and warm the pool
+        start = time.perf_counter()
+        asyncio.run(executor.run(documents))
+        elapsed = time.perf_counter() - start
+        executor.shutdown()
+        print(f"{workers:>3} workers  {elapsed:8.3f} s")
+        if workers >= available_cores():
+            break
+        workers = min(workers * 2, available_cores())
+
+
+if __name__ == "__main__":
+    main()
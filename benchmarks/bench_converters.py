@@ -0,0 +1,45 @@
+"""Per-model cost of turning a raw SEBIT output into a ``SummaryEntry``.
+
+Compares the previous conversion (kwargs unpacking, headline read from the raw
+dict, re-validating ``SummaryEntry``) with the registry's precompiled
+``to_entry``. Run with ``python -m benchmarks.bench_converters``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Any, Dict
+
+from app.schemas import MODEL_REGISTRY, ModelRegistryEntry, SummaryEntry
+
+from .payloads import model_payload
+from .timing import measure
+
+
+def legacy_from_model_output(entry: ModelRegistryEntry, data: Dict[str, Any]) -> SummaryEntry:
+    detail_instance = entry.detail_model(**data)
+    return SummaryEntry(
+        series=entry.series,
+        model=entry.model,
+        headline_amount=float(data[entry.headline_key]),
+        currency="KRW",
+        details=detail_instance,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--schedule-rows", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'model':<16} {'legacy us':>10} {'to_entry us':>12} {'speed-up':>9}")
+    for name, entry in MODEL_REGISTRY.items():
+        data = model_payload(name, schedule_rows=args.schedule_rows)
+        legacy = measure(lambda: legacy_from_model_output(entry, data), number=args.number)["best"]
+        compiled = measure(lambda: entry.to_entry(data, "KRW"), number=args.number)["best"]
+        print(f"{name:<16} {legacy * 1e6:10.2f} {compiled * 1e6:12.2f} {legacy / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
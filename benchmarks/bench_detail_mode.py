@@ -0,0 +1,41 @@
+"""Per-entry cost of building and encoding a report for each ``detail_mode``.
+
+Request validation is timed separately because it parses every payload in all
+modes; ``build + encode`` is where ``lazy``/``none`` skip the detail models.
+Run with ``python -m benchmarks.bench_detail_mode``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from app.schemas import SummaryReportRequest
+from app.services import build_summary_report, serialization_context
+
+from .payloads import report_request
+from .timing import format_row, measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=10_000)
+    parser.add_argument("--schedule-rows", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    document = report_request(args.entries, schedule_rows=args.schedule_rows)
+    for mode in ("full", "lazy", "none"):
+        body = json.dumps({**document, "detail_mode": mode}).encode()
+        payload = SummaryReportRequest.model_validate_json(body)
+        context = serialization_context(payload)
+
+        def build_and_encode() -> bytes:
+            return build_summary_report(payload).model_dump_json(context=context)
+
+        print(format_row(f"{mode}: validate request", measure(lambda: SummaryReportRequest.model_validate_json(body), args.repeat), per=args.entries))
+        print(format_row(f"{mode}: build + encode", measure(build_and_encode, args.repeat), per=args.entries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare discriminated vs smart-union validation of pre-built summary entries.
+
+Run with ``python -m benchmarks.bench_detail_union [--entries N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import List, Optional
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas import ModelDetailUnion, SummaryEntry
+
+from .payloads import summary_entries
+from .timing import format_row, measure
+
+
+class SmartUnionSummaryEntry(BaseModel):
+    """``SummaryEntry`` as it was before the discriminated detail union."""
+
+    series: str
+    model: str
+    headline_amount: float
+    currency: Optional[str] = None
+    details: ModelDetailUnion
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--schedule-rows", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = summary_entries(args.entries, schedule_rows=args.schedule_rows)
+    discriminated = TypeAdapter(List[SummaryEntry])
+    smart = TypeAdapter(List[SmartUnionSummaryEntry])
+
+    print(f"{args.entries} entries, {args.schedule_rows} schedule rows each (per entry)")
+    for label, adapter in (("discriminated (model tag)", discriminated), ("smart union", smart)):
+        timings = measure(lambda: adapter.validate_python(raw), repeat=args.repeat)
+        print(format_row(label, timings, per=args.entries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare the pure-Python and numpy columnar aggregation engines.
+
+Run with ``python -m benchmarks.bench_engines [--entries N]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from app.aggregation import ReportAccumulator
+from app.columnar import ColumnarAccumulator
+from app.schemas import MODEL_REGISTRY, SummaryEntry
+
+from .timing import format_row, measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    registry = list(MODEL_REGISTRY.values())
+    entries = []
+    for _ in range(args.entries):
+        registry_entry = rng.choice(registry)
+        entries.append(
+            SummaryEntry.model_construct(
+                series=registry_entry.series,
+                model=registry_entry.model,
+                headline_amount=round(rng.uniform(-1e9, 1e10), 2),
+                currency="KRW",
+            )
+        )
+
+    def run(factory):
+        accumulator = factory()
+        for entry in entries:
+            accumulator.add(entry)
+        return accumulator.series_summary()
+
+    print(f"{args.entries} entries (per entry)")
+    for label, factory in (("python", ReportAccumulator), ("columnar", ColumnarAccumulator)):
+        print(format_row(label, measure(lambda: run(factory), repeat=args.repeat), per=args.entries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Request decoding and response encoding: stdlib ``json`` versus pydantic-core.
+
+Decoding compares ``json.loads`` followed by ``model_validate``, which is what
+FastAPI does for a body parameter, with ``model_validate_json`` on the raw bytes.
+Encoding compares ``json.dumps`` of a ``model_dump(mode="json")`` dict with
+``model_dump_json``. Peak allocations are reported next to the timings.
+Run with ``python -m benchmarks.bench_json_codec``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from typing import Callable
+
+from app.schemas import SummaryReportRequest
+from app.services import build_summary_report, serialization_context
+
+from .payloads import report_request
+from .timing import format_row, measure
+
+
+def peak_mib(func: Callable[[], object]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated entry counts")
+    parser.add_argument("--schedule-rows", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for size in (int(item) for item in args.sizes.split(",")):
+        body = json.dumps(report_request(size, schedule_rows=args.schedule_rows)).encode()
+        payload = SummaryReportRequest.model_validate_json(body)
+        report = build_summary_report(payload)
+        context = serialization_context(payload)
+        print(f"{size} entries, {len(body) / 2**20:.1f} MiB request")
+
+        cases = {
+            "decode: json.loads + validate": lambda: SummaryReportRequest.model_validate(json.loads(body)),
+            "decode: model_validate_json": lambda: SummaryReportRequest.model_validate_json(body),
+            "encode: json.dumps(model_dump)": lambda: json.dumps(report.model_dump(mode="json", context=context)).encode(),
+            "encode: model_dump_json": lambda: report.model_dump_json(context=context),
+        }
+        for label, func in cases.items():
+            timings = measure(func, args.repeat)
+            print(f"  {format_row(label, timings, per=size)} /entry   peak {peak_mib(func):8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
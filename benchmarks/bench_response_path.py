@@ -0,0 +1,56 @@
+"""Measure the per-entry cost of the response path.
+
+Compares returning the report model through FastAPI's ``response_model``
+handling (dump, re-validate, encode) with writing pre-validated objects
+straight to JSON bytes. Run with ``python -m benchmarks.bench_response_path``.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.schemas import SummaryEntryResult, SummaryReportRequest, SummaryReportResponse
+from app.services import build_summary_report
+
+from .payloads import report_request
+from .timing import format_row, measure
+
+
+def legacy_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/summary/report", response_model=SummaryReportResponse)
+    def create_summary_report(payload: SummaryReportRequest) -> SummaryReportResponse:
+        report = build_summary_report(payload)
+        return SummaryReportResponse(
+            **{name: value for name, value in report if name != "entries"},
+            entries=[
+                SummaryEntryResult(**{**dict(entry), "details": entry.details.model_dump()})
+                for entry in report.entries
+            ],
+        )
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--schedule-rows", type=int, default=24)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = report_request(args.entries, schedule_rows=args.schedule_rows)
+    print(f"{args.entries} entries, {args.schedule_rows} schedule rows (per entry, end to end)")
+    for label, app in (("response_model re-validation", legacy_app()), ("pre-validated JSON bytes", create_app())):
+        client = TestClient(app)
+        timings = measure(lambda: client.post("/summary/report", json=body).content, repeat=args.repeat)
+        print(format_row(label, timings, per=args.entries))
+
+
+if __name__ == "__main__":
+    main()
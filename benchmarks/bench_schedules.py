@@ -0,0 +1,67 @@
+"""Peak memory of validated DDA/LAM/TCT-BEAM schedules: dict-per-row vs columnar.
+
+Run with ``python -m benchmarks.bench_schedules [--entries N] [--schedule-rows R]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Dict, List
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+from app.schedules import SCHEDULE_MODE_CONTEXT
+from app.schemas import DdaDetails
+
+from .payloads import model_payload
+from .timing import format_row, measure
+
+
+class RowScheduleDdaDetails(BaseModel):
+    """``DdaDetails`` with the previous ``List[Dict[str, Any]]`` schedule."""
+
+    asset_label: str
+    schedule: List[Dict[str, Any]] = Field(default_factory=list)
+    total_depreciation: float
+    total_revaluation_gain_loss: float
+    total_unrecognised_revaluation: float
+
+
+def _retained_bytes(adapter: TypeAdapter, payloads: List[Dict[str, Any]]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    validated = adapter.validate_python(payloads)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del validated
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--schedule-rows", type=int, default=360)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payloads = [model_payload("SEBIT-DDA", index, args.schedule_rows) for index in range(args.entries)]
+    print(f"{args.entries} DDA outputs x {args.schedule_rows} schedule rows")
+    for label, model in (("dict per row", RowScheduleDdaDetails), ("columnar ScheduleTable", DdaDetails)):
+        adapter = TypeAdapter(List[model])
+        retained = _retained_bytes(adapter, payloads)
+        validated = adapter.validate_python(payloads)
+        dump = TypeAdapter(List[model]).dump_json
+        print(f"{label:<32} retained {retained / 1e6:8.2f} MB")
+        print(format_row("  validate", measure(lambda: adapter.validate_python(payloads), args.repeat), args.entries))
+        print(format_row("  dump_json", measure(lambda: dump(validated), args.repeat), args.entries))
+        if model is DdaDetails:
+            for mode in ("columns", "summary"):
+                context = {SCHEDULE_MODE_CONTEXT: mode}
+                timings = measure(lambda: dump(validated, context=context), args.repeat)
+                print(format_row(f"  dump_json ({mode})", timings, args.entries))
+
+
+if __name__ == "__main__":
+    main()
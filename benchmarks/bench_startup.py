@@ -0,0 +1,101 @@
+"""Cold-start cost: importing the app and serving its first requests.
+
+Each run starts a fresh interpreter, times ``import app.main`` (which also
+runs ``create_app``), then the first ``/health`` and the first and second
+``/summary/report`` through the ASGI app. Both startup modes are measured:
+the default, which builds every schema in ``create_app``, and
+``SEBIT_SUMMARY_FAST_STARTUP=true``, which leaves them to first use. Run with
+``python -m benchmarks.bench_startup``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from .payloads import report_request
+
+MODES = {"default": "false", "fast": "true"}
+
+
+def _child() -> None:
+    import asyncio
+
+    import httpx
+
+    body = sys.stdin.buffer.read()
+    started = time.perf_counter()
+    from app.main import app
+
+    timings = {"import": time.perf_counter() - started}
+
+    async def requests() -> None:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            for name, method, path in (
+                ("health", "GET", "/health"),
+                ("first_report", "POST", "/summary/report"),
+                ("second_report", "POST", "/summary/report"),
+            ):
+                request_started = time.perf_counter()
+                response = await client.request(
+                    method, path, content=body if method == "POST" else None,
+                    headers={"Content-Type": "application/json"},
+                )
+                if response.status_code != 200:
+                    raise RuntimeError(f"{path} answered {response.status_code}")
+                timings[name] = time.perf_counter() - request_started
+
+    asyncio.run(requests())
+    timings["first_response"] = time.perf_counter() - started - timings["second_report"]
+    json.dump(timings, sys.stdout)
+
+
+def run(mode: str, body: bytes) -> Dict[str, float]:
+    env = {
+        **os.environ,
+        "SEBIT_SUMMARY_FAST_STARTUP": MODES[mode],
+        # Every report is aggregated, so the second one shows the warm cost.
+        "SEBIT_SUMMARY_CACHE_MAX_ENTRIES": "0",
+    }
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+        input=body,
+        env=env,
+        capture_output=True,
+        check=True,
+    ).stdout
+    timings = json.loads(output)
+    timings["process"] = time.perf_counter() - started
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=50)
+    parser.add_argument("--schedule-rows", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=7, help="Fresh interpreters per mode (medians are printed).")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        _child()
+        return
+
+    body = json.dumps(report_request(args.entries, schedule_rows=args.schedule_rows)).encode()
+    print(f"{args.entries} entries per report, median of {args.repeat} runs (ms)")
+    columns = ("import", "health", "first_report", "second_report", "first_response", "process")
+    print(f"{'mode':<8}" + "".join(f"{column:>16}" for column in columns))
+    for mode in MODES:
+        runs: List[Dict[str, float]] = [run(mode, body) for _ in range(args.repeat)]
+        medians = [statistics.median(timings[column] for timings in runs) for column in columns]
+        print(f"{mode:<8}" + "".join(f"{value * 1e3:16.1f}" for value in medians))
+
+
+if __name__ == "__main__":
+    main()
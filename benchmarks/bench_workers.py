@@ -0,0 +1,111 @@
+"""Throughput of ``/summary/report`` under gunicorn with 1..N workers.
+
+Starts ``gunicorn -c gunicorn.conf.py app.main:app`` once per worker count,
+with the report cache off so every request is aggregated, and drives it from
+client processes over HTTP. Run with ``python -m benchmarks.bench_workers``.
+Client processes share the machine with the server, so leave cores for them
+(``--clients``) when reading the scaling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+from app.batch import available_cores
+
+from .payloads import report_request
+from .suite import percentile
+
+
+def _wait_until_ready(port: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/health")
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"gunicorn did not become ready on port {port}")
+
+
+def _client(port: int, body: bytes, duration: float) -> List[float]:
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    headers = {"Content-Type": "application/json"}
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        connection.request("POST", "/summary/report", body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"unexpected status {response.status}")
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def run(workers: int, port: int, body: bytes, clients: int, duration: float) -> Tuple[float, float, float]:
+    env = {
+        **os.environ,
+        "PORT": str(port),
+        "WEB_CONCURRENCY": str(workers),
+        "SEBIT_SUMMARY_CACHE_MAX_ENTRIES": "0",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_until_ready(port)
+        with multiprocessing.get_context("spawn").Pool(clients) as pool:
+            results = pool.starmap(_client, [(port, body, duration)] * clients)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+    latencies = [latency for result in results for latency in result]
+    return len(latencies) / duration, percentile(latencies, 0.5), percentile(latencies, 0.99)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", default=None, help="Comma-separated worker counts (default: 1..cores).")
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--schedule-rows", type=int, default=12)
+    parser.add_argument("--clients", type=int, default=None, help="Client processes (default: 2 x max workers).")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    counts = (
+        [int(item) for item in args.workers.split(",") if item]
+        if args.workers
+        else list(range(1, available_cores() + 1))
+    )
+    clients = args.clients or 2 * max(counts)
+    body = json.dumps(report_request(args.entries, schedule_rows=args.schedule_rows)).encode()
+    print(f"{available_cores()} cores, {args.entries} entries per report, {clients} clients")
+    baseline = None
+    for count in counts:
+        throughput, p50, p99 = run(count, args.port, body, clients, args.duration)
+        baseline = baseline or throughput
+        print(
+            f"{count:>3} workers   {throughput:9.1f} req/s   x{throughput / baseline:5.2f}"
+            f"   p50 {p50 * 1e3:8.2f} ms   p99 {p99 * 1e3:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
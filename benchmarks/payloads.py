@@ -0,0 +1,308 @@
+"""Synthetic SEBIT model outputs for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.schemas import BUILTIN_MODELS, MODEL_REGISTRY
+
+
+def _schedule(rng: random.Random, rows: int) -> List[Dict[str, Any]]:
+    balance = rng.uniform(1e6, 1e9)
+    schedule = []
+    for period in range(1, rows + 1):
+        charge = round(balance * rng.uniform(0.01, 0.05), 2)
+        balance = round(balance - charge, 2)
+        schedule.append(
+            {
+                "period": period,
+                "opening_balance": round(balance + charge, 2),
+                "charge": charge,
+                "revaluation": round(rng.uniform(-5e4, 5e4), 2),
+                "closing_balance": balance,
+            }
+        )
+    return schedule
+
+
+def _amount(rng: random.Random, low: float = -1e7, high: float = 1e10) -> float:
+    return round(rng.uniform(low, high), 2)
+
+
+def _ratio(rng: random.Random) -> float:
+    return round(rng.uniform(-1.0, 1.0), 6)
+
+
+def _dda(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "asset_label": f"facility-line-{index}",
+        "schedule": _schedule(rng, rows),
+        "total_depreciation": _amount(rng, 0),
+        "total_revaluation_gain_loss": _amount(rng),
+        "total_unrecognised_revaluation": _amount(rng),
+    }
+
+
+def _lam(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "lease_label": f"lease-{index}",
+        "schedule": _schedule(rng, rows),
+        "total_revaluation_gain_loss": _amount(rng),
+        "total_interest_expense": _amount(rng, 0),
+        "total_termination_adjustment": _amount(rng),
+    }
+
+
+def _rvm(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "resource_label": f"resource-{index}",
+        "daily_average_extraction": _amount(rng, 0, 1e4),
+        "standard_extraction_value": _amount(rng, 0),
+        "total_extraction_value": _amount(rng, 0),
+        "extraction_rate": _ratio(rng),
+        "market_change_index": _ratio(rng),
+        "market_sensitivity": _ratio(rng),
+        "final_revaluation_value": _amount(rng),
+    }
+
+
+def _ceem(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "expense_label": f"consumable-{index}",
+        "daily_average_usage_units": _amount(rng, 0, 1e4),
+        "standard_usage_value_non_quantitative": _amount(rng, 0),
+        "standard_usage_value_quantitative": _amount(rng, 0) if index % 2 else None,
+        "selected_standard_usage_value": _amount(rng, 0),
+        "total_consumable_usage_value": _amount(rng, 0),
+        "adjusted_consumable_usage_value": _amount(rng, 0),
+        "usage_change_rate": _ratio(rng),
+        "market_change_index": _ratio(rng),
+        "market_sensitivity_value": _ratio(rng),
+        "final_revaluation_value": _amount(rng),
+    }
+
+
+def _bdm(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "bond_label": f"bond-{index}",
+        "daily_estimated_usage": _amount(rng, 0, 1e6),
+        "estimated_value_ps": _amount(rng, 0),
+        "market_beta": _ratio(rng),
+        "final_book_value": _amount(rng, 0),
+        "interest_cost": _amount(rng, 0, 1e8),
+        "interest_type": "fixed" if index % 2 else "floating",
+    }
+
+
+def _belm(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "debtor_label": f"debtor-{index}",
+        "daily_estimated_repayment": _amount(rng, 0, 1e6),
+        "expected_repayment_at_evaluation": _amount(rng, 0),
+        "interest_rate_adjustment": _ratio(rng),
+        "actual_interest_cost": _amount(rng, 0, 1e8),
+        "preliminary_bad_debt_ratio": abs(_ratio(rng)),
+        "final_bad_debt_ratio": abs(_ratio(rng)),
+    }
+
+
+def _cprm(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "exposure_id": f"exposure-{index}",
+        "assumed_bad_debt_occurrence_rate": abs(_ratio(rng)),
+        "convertible_bond_rate": abs(_ratio(rng)),
+        "convertible_bond_first_amount": _amount(rng, 0),
+        "average_past_bad_debt_recovery": abs(_ratio(rng)),
+        "average_convertible_bond_price": _amount(rng, 0, 1e6),
+        "additional_adjustment_beta": _ratio(rng),
+        "final_convertible_bond_amount": _amount(rng, 0),
+        "trigger_applied": bool(index % 2),
+        "convertible_bond_rate_adjustment": _ratio(rng),
+        "final_adjusted_convertible_bond_rate": abs(_ratio(rng)),
+    }
+
+
+def _cocim(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    balance = _amount(rng, 0)
+    quarters = []
+    for quarter in range(1, 5):
+        adjustment = round(balance * _ratio(rng) / 10, 2)
+        quarters.append(
+            {
+                "quarter_index": quarter,
+                "adjustment_value": adjustment,
+                "pre_compound_balance": balance,
+                "post_compound_balance": round(balance + adjustment, 2),
+            }
+        )
+        balance = round(balance + adjustment, 2)
+    return {
+        "portfolio_label": f"oci-portfolio-{index}",
+        "account_ratio": abs(_ratio(rng)),
+        "initial_compound_measurement": _amount(rng, 0),
+        "quarterly_adjustments": quarters,
+        "annual_compound_growth_rate": _ratio(rng),
+        "compound_growth_trigger_applied": bool(index % 2),
+        "compound_adjustment_amount": _amount(rng),
+        "final_adjusted_balance": balance,
+    }
+
+
+def _farex(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "contract_id": f"fx-contract-{index}",
+        "last_year_trade_ratio": _ratio(rng),
+        "current_year_trade_ratio": _ratio(rng),
+        "export_import_beta": _ratio(rng),
+        "adjustment_indicator": _ratio(rng),
+        "inflation_adjusted_rate": _ratio(rng),
+        "final_adjusted_rate": _ratio(rng),
+        "revaluation_amount": _amount(rng),
+    }
+
+
+def _tct_beam(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "model_label": f"product-line-{index}",
+        "evaluation_years": max(rows, 1),
+        "cumulative_fixed_cost": _amount(rng, 0),
+        "cumulative_variable_cost": _amount(rng, 0),
+        "cumulative_operating_profit": _amount(rng),
+        "break_even_year_index": rng.randint(1, max(rows, 1)) if index % 3 else None,
+        "schedule": _schedule(rng, rows),
+    }
+
+
+def _cpmrv(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "asset_label": f"crypto-{index}",
+        "last_year_average_performance": _ratio(rng),
+        "current_year_log_ratio": _ratio(rng),
+        "monthly_growth_risk": _ratio(rng),
+        "risk_direction": "up" if index % 2 else "down",
+        "relative_asset_risk": _ratio(rng),
+        "adjusted_crypto_value": _amount(rng),
+    }
+
+
+def _dcbpra(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "asset_label": f"bio-asset-{index}",
+        "growth_percentage_factor": _ratio(rng),
+        "real_growth_adjustment": _ratio(rng),
+        "last_year_average_performance": _ratio(rng),
+        "current_year_log_ratio": _ratio(rng),
+        "monthly_growth_risk": _ratio(rng),
+        "risk_adjustment_component": _ratio(rng),
+        "risk_direction": "up" if index % 2 else "down",
+        "adjusted_beta": _ratio(rng),
+        "baseline_capm_return": _ratio(rng),
+        "adjusted_expected_return": _ratio(rng),
+    }
+
+
+def _psras(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "portfolio_label": f"insurance-cohort-{index}",
+        "assumed_revenue_recognition_rate": abs(_ratio(rng)),
+        "new_subscriber_average_payment": _amount(rng, 0, 1e6),
+        "existing_subscriber_average_payment": _amount(rng, 0, 1e6),
+        "payment_comparison_index": _ratio(rng),
+        "payment_index_baseline_amount": _amount(rng, 0),
+        "pure_performance_break_even": _amount(rng, 0),
+        "final_recognised_revenue": _amount(rng, 0),
+    }
+
+
+def _lsmrv(rng: random.Random, index: int, rows: int) -> Dict[str, Any]:
+    return {
+        "evaluation_label": f"scenario-{index}",
+        "probability_distribution_a": abs(_ratio(rng)),
+        "probability_distribution_b": abs(_ratio(rng)),
+        "growth_correction_value": _ratio(rng),
+        "cumulative_adjustment_value": _amount(rng),
+        "expected_adjustment_value": _amount(rng),
+        "final_adjustment_amount": _amount(rng),
+    }
+
+
+PAYLOAD_FACTORIES: Dict[str, Callable[[random.Random, int, int], Dict[str, Any]]] = {
+    "SEBIT-DDA": _dda,
+    "SEBIT-LAM": _lam,
+    "SEBIT-RVM": _rvm,
+    "SEBIT-CEEM": _ceem,
+    "SEBIT-BDM": _bdm,
+    "SEBIT-BELM": _belm,
+    "SEBIT-CPRM": _cprm,
+    "SEBIT-C-OCIM": _cocim,
+    "SEBIT-FAREX": _farex,
+    "SEBIT-TCT-BEAM": _tct_beam,
+    "SEBIT-CPMRV": _cpmrv,
+    "SEBIT-DCBPRA": _dcbpra,
+    "SEBIT-PSRAS": _psras,
+    "SEBIT-LSMRV": _lsmrv,
+}
+
+assert set(PAYLOAD_FACTORIES) == set(BUILTIN_MODELS), "every built-in model needs a factory"
+
+
+def model_payload(model_name: str, index: int = 0, schedule_rows: int = 0, seed: int = 0) -> Dict[str, Any]:
+    rng = random.Random(f"{seed}:{model_name}:{index}")
+    return PAYLOAD_FACTORIES[model_name](rng, index, schedule_rows)
+
+
+def model_outputs(
+    count: int,
+    schedule_rows: int = 0,
+    models: Optional[Sequence[str]] = None,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    names = list(models or BUILTIN_MODELS)
+    return [
+        {
+            "model_name": names[index % len(names)],
+            "payload": model_payload(names[index % len(names)], index, schedule_rows, seed),
+            "currency": "KRW",
+        }
+        for index in range(count)
+    ]
+
+
+def summary_entries(
+    count: int,
+    schedule_rows: int = 0,
+    models: Optional[Sequence[str]] = None,
+    seed: int = 0,
+) -> List[Dict[str, Any]]:
+    entries = []
+    for output in model_outputs(count, schedule_rows, models, seed):
+        registry_entry = MODEL_REGISTRY[output["model_name"]]
+        entries.append(
+            {
+                "series": registry_entry.series,
+                "model": registry_entry.model,
+                "headline_amount": output["payload"][registry_entry.headline_key],
+                "currency": output["currency"],
+                "details": output["payload"],
+            }
+        )
+    return entries
+
+
+def report_request(
+    count: int,
+    schedule_rows: int = 0,
+    models: Optional[Sequence[str]] = None,
+    prebuilt: bool = False,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    body: Dict[str, Any] = {
+        "report_label": f"Benchmark report ({count} entries)",
+        "as_of": "2025-10-30T09:40:15.788Z",
+    }
+    if prebuilt:
+        body["entries"] = summary_entries(count, schedule_rows, models, seed)
+    else:
+        body["model_outputs"] = model_outputs(count, schedule_rows, models, seed)
+    return body
@@ -0,0 +1,204 @@
+"""Benchmark suite and in-process load profile for the summary service.
+
+Measures request validation, ``build_summary_report`` and response
+serialisation separately for synthetic reports across all registered models,
+then drives ``/summary/report`` through the ASGI app with concurrent clients.
+Results are written as JSON so runs can be compared::
+
+    python -m benchmarks.suite --sizes 100,10000 --output before.json
+    python -m benchmarks.suite --sizes 100,10000 --output after.json
+    python -m benchmarks.suite --compare before.json after.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence
+
+import httpx
+import pydantic
+
+from app.columnar import columnar_available
+from app.main import create_app
+from app.schemas import SummaryReportRequest
+from app.services import build_summary_report, serialization_context
+from app.settings import Settings
+
+from .payloads import report_request
+from .timing import measure
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def percentile(samples: Sequence[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def stage_benchmarks(size: int, schedule_rows: int, repeat: int) -> Dict[str, Any]:
+    body = json.dumps(report_request(size, schedule_rows=schedule_rows)).encode()
+    payload = SummaryReportRequest.model_validate_json(body)
+    report = build_summary_report(payload)
+    context = serialization_context(payload)
+    encoded = report.model_dump_json(context=context)
+
+    stages = {
+        "validate": measure(lambda: SummaryReportRequest.model_validate_json(body), repeat),
+        "build": measure(lambda: build_summary_report(payload), repeat),
+        "serialize": measure(lambda: report.model_dump_json(context=context), repeat),
+    }
+    return {
+        "entries": size,
+        "schedule_rows": schedule_rows,
+        "request_bytes": len(body),
+        "response_bytes": len(encoded),
+        "stages": {
+            name: {**timings, "per_entry_us": timings["best"] / size * 1e6} for name, timings in stages.items()
+        },
+    }
+
+
+async def load_test(size: int, schedule_rows: int, requests: int, concurrency: int) -> Dict[str, Any]:
+    # The report cache is disabled so every request exercises the full pipeline.
+    app = create_app(Settings(cache_max_entries=0))
+    body = json.dumps(report_request(size, schedule_rows=schedule_rows)).encode()
+    headers = {"Content-Type": "application/json"}
+    latencies: List[float] = []
+    failures = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+
+        async def worker() -> None:
+            nonlocal failures
+            while not queue.empty():
+                queue.get_nowait()
+                start = time.perf_counter()
+                response = await client.post("/summary/report", content=body, headers=headers)
+                latencies.append(time.perf_counter() - start)
+                failures += response.status_code != 200
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "entries": size,
+        "schedule_rows": schedule_rows,
+        "requests": requests,
+        "concurrency": concurrency,
+        "failures": failures,
+        "throughput_rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+        "mean_ms": statistics.fmean(latencies) * 1e3,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "pydantic": pydantic.VERSION,
+            "numpy": columnar_available(),
+            "platform": platform.platform(),
+        },
+        "stages": [],
+        "load": [],
+    }
+    for schedule_rows in args.schedule_rows:
+        for size in args.sizes:
+            result = stage_benchmarks(size, schedule_rows, args.repeat)
+            results["stages"].append(result)
+            timings = "  ".join(
+                f"{name} {stage['per_entry_us']:8.2f} us/entry" for name, stage in result["stages"].items()
+            )
+            print(f"[stages] {size:>8} entries x {schedule_rows:>4} rows  {timings}")
+
+    for schedule_rows in args.schedule_rows:
+        result = asyncio.run(load_test(args.load_entries, schedule_rows, args.load_requests, args.concurrency))
+        results["load"].append(result)
+        print(
+            f"[load]   {result['entries']:>8} entries x {schedule_rows:>4} rows  "
+            f"p50 {result['p50_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+            f"{result['throughput_rps']:8.1f} req/s  ({result['failures']} failures)"
+        )
+    return results
+
+
+def compare(baseline_path: str, candidate_path: str) -> None:
+    with open(baseline_path) as handle:
+        baseline = json.load(handle)
+    with open(candidate_path) as handle:
+        candidate = json.load(handle)
+
+    def key(item: Dict[str, Any]) -> tuple:
+        return item["entries"], item["schedule_rows"]
+
+    before = {key(item): item for item in baseline["stages"]}
+    for item in candidate["stages"]:
+        previous = before.get(key(item))
+        if previous is None:
+            continue
+        for name, stage in item["stages"].items():
+            old = previous["stages"][name]["best"]
+            change = (stage["best"] - old) / old * 100
+            print(f"{item['entries']:>8} x {item['schedule_rows']:>4} {name:<10} {change:+7.1f}%")
+
+    before_load = {key(item): item for item in baseline["load"]}
+    for item in candidate["load"]:
+        previous = before_load.get(key(item))
+        if previous is None:
+            continue
+        for metric in ("p50_ms", "p99_ms", "throughput_rps"):
+            change = (item[metric] - previous[metric]) / previous[metric] * 100
+            print(f"load {item['entries']:>8} x {item['schedule_rows']:>4} {metric:<15} {change:+7.1f}%")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=_int_list, default=[10, 1_000, 10_000], help="comma-separated entry counts")
+    parser.add_argument("--schedule-rows", type=_int_list, default=[0, 120], help="schedule rows per DDA/LAM/TCT-BEAM output")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--load-entries", type=int, default=100)
+    parser.add_argument("--load-requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"), help="compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    results = run(args)
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Small timing helpers shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import statistics
+import time
+from typing import Callable, Dict
+
+
+def measure(func: Callable[[], object], repeat: int = 5, number: int = 1) -> Dict[str, float]:
+    """Run ``func`` ``number`` times per round and report per-call seconds."""
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+    return {"best": min(rounds), "median": statistics.median(rounds)}
+
+
+def format_row(label: str, timings: Dict[str, float], per: int = 1) -> str:
+    best_us = timings["best"] / per * 1e6
+    median_us = timings["median"] / per * 1e6
+    return f"{label:<32} best {best_us:10.2f} us   median {median_us:10.2f} us"
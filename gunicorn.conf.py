@@ -0,0 +1,51 @@
+"""Opt-in multi-process serving profile: one uvicorn worker per available core.
+
+    gunicorn -c gunicorn.conf.py app.main:app
+
+Sessions, rollups, report jobs and history live in each worker's memory and
+requests are spread across workers, so only use more than one worker when
+clients stick to the stateless endpoints (``/summary/report``, batches,
+partials, the store). The default deploy runs a single uvicorn process.
+
+The app is imported and warmed up once in the master, then forked, so the
+workers share the schemas, validators and OpenAPI document through
+copy-on-write. That is why ``SEBIT_SUMMARY_FAST_STARTUP`` is turned off here:
+it is meant for a single uvicorn process. ``WEB_CONCURRENCY`` overrides the
+worker count.
+"""
+
+import gc
+import os
+
+from app.batch import available_cores
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY") or available_cores())
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = 120
+
+# The workers already use every core; a batch or job process pool inside each
+# of them would oversubscribe the machine.
+os.environ.setdefault("SEBIT_SUMMARY_BATCH_WORKERS", "1")
+os.environ.setdefault("SEBIT_SUMMARY_JOB_WORKERS", "1")
+# Deferred schema builds would happen in every worker instead of once before the fork.
+os.environ["SEBIT_SUMMARY_FAST_STARTUP"] = "false"
+# Share one report cache between the workers, in memory where tmpfs exists.
+if workers > 1:
+    os.environ.setdefault(
+        "SEBIT_SUMMARY_CACHE_DIR",
+        "/dev/shm/sebit-summary-cache" if os.path.isdir("/dev/shm") else "/tmp/sebit-summary-cache",
+    )
+
+
+def when_ready(server):
+    from app.main import app
+    from app.warmup import warm_up
+
+    warm_up(app)
+    if app.state.report_cache is not None:
+        app.state.report_cache.clear()  # drop responses cached by a previous release
+    # Keep the collector from touching (and so copying) the warmed-up objects.
+    gc.collect()
+    gc.freeze()
@@ -0,0 +1,122 @@
+import bisect
+import math
+import random
+
+import pytest
+
+from app.aggregation import CompensatedSum, aggregate_entries
+from app.schemas import SummaryEntry
+from app.services import summarize_entries
+from app.sketches import KllSketch, TopK
+
+
+def _entry(model: str, amount: float, series: str = "Asset & Depreciation") -> SummaryEntry:
+    return SummaryEntry.model_validate(
+        {
+            "series": series,
+            "model": model,
+            "headline_amount": amount,
+            "details": {
+                "asset_label": model.lower(),
+                "total_depreciation": 0.0,
+                "total_revaluation_gain_loss": amount,
+                "total_unrecognised_revaluation": 0.0,
+            },
+        }
+    )
+
+
+def test_compensated_sum_matches_fsum():
+    rng = random.Random(7)
+    values = [rng.uniform(-1e12, 1e12) for _ in range(5000)] + [0.01] * 1000
+    running = CompensatedSum()
+    for value in values:
+        running.add(value)
+    assert running.value == math.fsum(values)
+
+
+def test_single_pass_aggregates_from_generator():
+    amounts = [("A", 5.0), ("B", 9.0), ("C", 9.0), ("D", -2.0), ("E", -2.0)]
+    report = summarize_entries(_entry(model, amount) for model, amount in amounts)
+
+    assert report.total_models == 5
+    assert report.overall_headline_total == 19.0
+    (series,) = report.series_summary
+    assert series.model_count == 5
+    assert series.headline_average == 3.8
+    assert (series.top_model.model, series.top_model.headline_amount) == ("B", 9.0)
+    assert (series.bottom_model.model, series.bottom_model.headline_amount) == ("D", -2.0)
+
+
+def test_series_keep_first_seen_order():
+    accumulator = aggregate_entries(
+        [_entry("A", 1.0, "Second"), _entry("B", 2.0, "First"), _entry("C", 3.0, "Second")]
+    )
+    assert [aggregate.series for aggregate in accumulator.series_summary()] == ["Second", "First"]
+
+
+def test_columnar_engine_matches_python_engine():
+    pytest.importorskip("numpy")
+    from app.aggregation import ReportAccumulator
+    from app.columnar import ColumnarAccumulator
+
+    rng = random.Random(11)
+    series_names = ["Asset & Depreciation", "Expense & Profitability", "Advanced Analytics"]
+    entries = [
+        SummaryEntry.model_construct(
+            series=rng.choice(series_names),
+            model=f"SEBIT-{rng.randint(0, 40)}",
+            # Coarse amounts produce plenty of ties for the top/bottom model checks.
+            headline_amount=rng.choice([round(rng.uniform(-1e9, 1e10), 2), float(rng.randint(-3, 3))]),
+            currency="KRW",
+        )
+        for _ in range(20_000)
+    ]
+
+    python_engine, columnar_engine = ReportAccumulator(), ColumnarAccumulator()
+    for entry in entries:
+        python_engine.add(entry)
+        columnar_engine.add(entry)
+
+    assert columnar_engine.count == python_engine.count
+    assert columnar_engine.overall_total == python_engine.overall_total
+    assert [aggregate.model_dump() for aggregate in columnar_engine.series_summary()] == [
+        aggregate.model_dump() for aggregate in python_engine.series_summary()
+    ]
+
+
+def test_top_k_and_quantiles_are_exact_for_small_series():
+    amounts = [("A", 5.0), ("B", 9.0), ("C", 9.0), ("D", -2.0), ("E", 1.0)]
+    entries = (_entry(model, amount) for model, amount in amounts)
+    report = summarize_entries(entries, top_k=3, quantiles=[0.0, 0.5, 1.0])
+    (series,) = report.series_summary
+    assert [(item.model, item.headline_amount) for item in series.top_contributors] == [
+        ("B", 9.0),
+        ("C", 9.0),
+        ("A", 5.0),
+    ]
+    assert [item.headline_amount for item in series.headline_quantiles] == [-2.0, 5.0, 9.0]
+
+
+def test_quantile_sketches_merge_across_shards():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(8, 1.5) for _ in range(50_000)]
+    shards = [KllSketch() for _ in range(4)]
+    for index, value in enumerate(values):
+        shards[index % 4].add(value)
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(KllSketch.from_state(shard.to_state()))
+    assert merged.count == len(values)
+    ordered = sorted(values)
+    for fraction, estimate in zip((0.5, 0.9, 0.99), merged.quantiles([0.5, 0.9, 0.99])):
+        assert abs(bisect.bisect_left(ordered, estimate) / len(values) - fraction) < 0.02
+
+    top = TopK(5)
+    for index, value in enumerate(values[:25_000]):
+        top.offer(value, index)
+    other = TopK(5)
+    for index, value in enumerate(values[25_000:], start=25_000):
+        other.offer(value, index)
+    top.merge(other)
+    assert [value for value, _ in top.items()] == ordered[::-1][:5]
@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import report_request
+
+
+def test_batch_reports_keep_order_and_report_errors():
+    documents = [report_request(4), {"report_label": "empty"}, report_request(9, seed=1)]
+    with TestClient(create_app(Settings(batch_workers=2))) as client:
+        response = client.post("/summary/reports:batch", json=documents)
+        single = client.post("/summary/report", json=documents[2]).json()
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [(result["index"], result["status"]) for result in results] == [(0, "ok"), (1, "error"), (2, "ok")]
+    assert results[0]["report"]["total_models"] == 4
+    assert "Either 'entries' or 'model_outputs'" in results[1]["errors"][0]["msg"]
+    assert results[2]["report"] == single
+
+
+def test_batch_rejects_non_array_body():
+    client = TestClient(create_app(Settings(batch_workers=1)))
+    response = client.post("/summary/reports:batch", json={"model_outputs": []})
+    assert response.status_code == 422
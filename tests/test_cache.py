@@ -0,0 +1,96 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.cache import FileReportCache, ReportCache
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import report_request
+
+
+def test_report_cache_lru_bytes_and_ttl():
+    now = [0.0]
+    cache = ReportCache(max_entries=2, max_bytes=10, ttl_seconds=5, clock=lambda: now[0])
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") is not None
+    cache.put("c", b"1234")  # over both limits: "b" is least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    now[0] = 6.0
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["hits"] == 3
+
+
+def test_file_report_cache_is_shared_between_instances(tmp_path):
+    now = [100.0]
+    writer = FileReportCache(tmp_path, max_entries=2, ttl_seconds=5, clock=lambda: now[0])
+    reader = FileReportCache(tmp_path, max_entries=2, ttl_seconds=5, clock=lambda: now[0])
+    writer.put("a", b"1234", headers=(("x-report-id", "r1"),))
+    hit = reader.get("a")
+    assert (hit.body, hit.headers, hit.etag) == (b"1234", (("x-report-id", "r1"),), writer.get("a").etag)
+
+    writer.put("b", b"1234")
+    writer.put("c", b"1234")
+    assert reader.stats()["entries"] == 2 and writer.stats()["evictions"] == 1
+
+    now[0] = 106.0
+    assert reader.get("c") is None
+
+
+def test_workers_share_the_file_cache(tmp_path):
+    settings = Settings(cache_max_entries=8, cache_dir=str(tmp_path))
+    first, second = TestClient(create_app(settings)), TestClient(create_app(settings))
+    payload = report_request(5)
+    assert first.post("/summary/report", json=payload).headers["X-Cache"] == "MISS"
+    assert second.post("/summary/report", json=payload).headers["X-Cache"] == "HIT"
+
+
+def test_repeated_report_requests_are_served_from_cache():
+    client = TestClient(create_app(Settings(cache_max_entries=8)))
+    payload = report_request(5)
+
+    first = client.post("/summary/report", json=payload)
+    assert first.headers["X-Cache"] == "MISS"
+
+    repeat = client.post("/summary/report", json=payload)
+    assert repeat.headers["X-Cache"] == "HIT"
+    assert repeat.content == first.content
+
+    not_modified = client.post(
+        "/summary/report", json=payload, headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert not_modified.status_code == 304
+
+    stats = client.get("/summary/cache").json()
+    assert stats["enabled"] is True
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+
+    # Raw-byte keys only by default: a reordered body is a new report.
+    reordered = json.dumps(dict(reversed(list(payload.items()))), indent=2)
+    headers = {"Content-Type": "application/json"}
+    assert client.post("/summary/report", content=reordered, headers=headers).headers["X-Cache"] == "MISS"
+
+
+def test_canonical_keys_match_reordered_requests():
+    client = TestClient(create_app(Settings(cache_max_entries=8, cache_canonical_keys=True)))
+    payload = report_request(5)
+    first = client.post("/summary/report", json=payload)
+    reordered = json.dumps(dict(reversed(list(payload.items()))), indent=2)
+    canonical = client.post("/summary/report", content=reordered, headers={"Content-Type": "application/json"})
+    assert canonical.headers["X-Cache"] == "HIT"
+    assert canonical.headers["ETag"] == first.headers["ETag"]
+
+    surrogate = json.dumps({**payload, "report_label": "\ud800"})
+    response = client.post("/summary/report", content=surrogate, headers={"Content-Type": "application/json"})
+    assert response.status_code == 422
+
+
+def test_cache_can_be_disabled():
+    client = TestClient(create_app(Settings(cache_max_entries=0)))
+    response = client.post("/summary/report", json=report_request(2))
+    assert response.status_code == 200
+    assert "X-Cache" not in response.headers
+    assert client.get("/summary/cache").json() == {"enabled": False}
@@ -0,0 +1,97 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import model_outputs
+
+SERIES = "Capital & Risk Derivatives"
+
+
+def _outputs(*amounts_and_currencies):
+    outputs = model_outputs(len(amounts_and_currencies), models=["SEBIT-FAREX"])
+    for output, (amount, currency) in zip(outputs, amounts_and_currencies):
+        output["payload"]["revaluation_amount"] = amount
+        output["currency"] = currency
+    return outputs
+
+
+def _client(tmp_path, **overrides):
+    rates = tmp_path / "rates.json"
+    rates.write_text(
+        json.dumps({"base": "KRW", "rates": {"USD": 1300.0}, "dated": {"2025-07-01": {"USD": 1400.0}}})
+    )
+    return TestClient(create_app(Settings(cache_max_entries=0, fx_rates_path=str(rates), **overrides)))
+
+
+def test_reporting_currency_converts_aggregates_and_entries(tmp_path):
+    client = _client(tmp_path)
+    body = {"reporting_currency": "KRW", "model_outputs": _outputs((1000.0, "KRW"), (2.5, "USD"), (10.0, "USD"))}
+    report = client.post("/summary/report", json=body).json()
+    assert report["reporting_currency"] == "KRW"
+    assert report["overall_headline_total"] == 1000.0 + 12.5 * 1300.0
+    assert [entry["reporting_amount"] for entry in report["entries"]] == [1000.0, 3250.0, 13000.0]
+    (series,) = report["series_summary"]
+    assert (series["series"], series["headline_total"], series["headline_max"], series["headline_min"]) == (SERIES, 17250.0, 13000.0, 1000.0)
+    assert [(item["currency"], item["rate"], item["headline_total"]) for item in report["currency_breakdown"]] == [
+        ("KRW", 1.0, 1000.0),
+        ("USD", 1300.0, 12.5),
+    ]
+
+    # Dated tables apply from their day onwards.
+    dated = client.post("/summary/report", json={**body, "as_of": "2025-08-01T00:00:00Z"}).json()
+    assert dated["overall_headline_total"] == 1000.0 + 12.5 * 1400.0
+
+    streamed = client.post("/summary/report", params={"stream": "true"}, json=body)
+    assert streamed.json() == report
+
+
+def test_reporting_currency_without_a_rate_is_rejected(tmp_path):
+    body = {"reporting_currency": "KRW", "model_outputs": _outputs((1.0, "EUR"))}
+    response = _client(tmp_path).post("/summary/report", json=body)
+    assert response.status_code == 422
+    assert "EUR" in response.json()["detail"]
+
+    unconfigured = TestClient(create_app(Settings(cache_max_entries=0)))
+    assert unconfigured.post("/summary/report", json=body).status_code == 422
+    assert unconfigured.post("/summary/report", json={**body, "reporting_currency": "EUR"}).status_code == 200
+
+
+def test_stored_report_replays_reporting_amounts(tmp_path):
+    client = _client(tmp_path, store_path=str(tmp_path / "store"))
+    body = {"reporting_currency": "USD", "model_outputs": _outputs((2600.0, "KRW"))}
+    response = client.post("/summary/report", json=body)
+    replayed = client.get(f"/summary/store/reports/{response.headers['X-Report-Id']}")
+    assert replayed.json() == response.json()
+    assert replayed.json()["entries"][0]["reporting_amount"] == 2.0
+
+
+def test_top_contributors_and_quantiles_are_converted(tmp_path):
+    client = _client(tmp_path)
+    body = {
+        "reporting_currency": "KRW",
+        "top_k": 2,
+        "quantiles": [0.5],
+        "model_outputs": _outputs((1000.0, "KRW"), (2.5, "USD"), (10.0, "USD")),
+    }
+    (series,) = client.post("/summary/report", json=body).json()["series_summary"]
+    assert [item["headline_amount"] for item in series["top_contributors"]] == [13000.0, 3250.0]
+    assert series["headline_quantiles"] == [{"quantile": 0.5, "headline_amount": 3250.0}]
+    streamed = client.post("/summary/report", params={"stream": "true"}, json=body).json()
+    assert streamed["series_summary"] == [series]
+
+
+def test_batched_conversion_matches_with_and_without_numpy(monkeypatch):
+    import random
+
+    from app import fx
+
+    rng = random.Random(7)
+    amounts = [rng.uniform(-1e6, 1e6) for _ in range(500)]
+    currencies = [rng.choice(["KRW", "EUR", None]) for _ in amounts]
+    rates = {"KRW": 0.00073, "EUR": 1.0843, None: 1.0}
+    expected = [round(amount * rates[currency], 2) for amount, currency in zip(amounts, currencies)]
+    assert fx.reporting_amounts(amounts, currencies, rates) == expected
+    monkeypatch.setattr(fx, "COLUMNAR_THRESHOLD", 1)
+    assert fx.reporting_amounts(amounts, currencies, rates) == expected
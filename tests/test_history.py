@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.history import HistoryIndex
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import model_outputs
+
+
+def _report(as_of, amount):
+    outputs = model_outputs(2, models=["SEBIT-FAREX"])
+    for index, output in enumerate(outputs):
+        output["payload"]["revaluation_amount"] = amount + index
+    return {"as_of": as_of, "model_outputs": outputs}
+
+
+def test_history_endpoints_serve_ranges_latest_and_rollups(tmp_path):
+    settings = Settings(cache_max_entries=0, store_path=str(tmp_path), history_enabled=True)
+    client = TestClient(create_app(settings))
+    for as_of, amount in [
+        ("2025-07-10T00:00:00Z", 100.0),
+        ("2025-07-25T00:00:00Z", 110.0),
+        ("2025-08-15T00:00:00Z", 130.0),
+        ("2025-09-15T00:00:00Z", 90.0),
+    ]:
+        assert client.post("/summary/report", json=_report(as_of, amount)).status_code == 200
+
+    series = "Capital & Risk Derivatives"
+    points = client.get(
+        "/summary/history/points",
+        params={"model": "SEBIT-FAREX", "as_of_from": "2025-07-20", "as_of_to": "2025-08-31"},
+    ).json()["points"]
+    assert [point["headline_amount"] for point in points] == [110.0, 130.0, 111.0, 131.0]
+
+    latest = client.get("/summary/history/latest", params={"series": series, "at": "2025-08-31"}).json()["points"]
+    assert sorted(point["headline_amount"] for point in latest) == [130.0, 131.0]
+
+    rollups = client.get("/summary/history/rollups", params={"series": series}).json()["rollups"]
+    assert [(r["period"], r["snapshots"], r["opening_total"], r["closing_total"]) for r in rollups] == [
+        ("2025-07", 2, 201.0, 221.0),
+        ("2025-08", 1, 261.0, 261.0),
+        ("2025-09", 1, 181.0, 181.0),
+    ]
+    rolling = client.get("/summary/history/rolling", params={"series": series, "window": 2}).json()["rolling"]
+    assert [(r["rolling_mean"], r["change"]) for r in rolling] == [(221.0, None), (241.0, 40.0), (221.0, -80.0)]
+
+    # A fresh app rebuilds the same history from the report store, once the snapshots are written.
+    client.app.state.report_store.flush()
+    reloaded = TestClient(create_app(settings))
+    assert reloaded.get("/summary/history/rollups", params={"series": series}).json()["rollups"] == rollups
+
+
+def test_history_replaces_points_recorded_at_the_same_as_of():
+    history = HistoryIndex(period="quarter")
+    moment = datetime(2025, 8, 1, tzinfo=timezone.utc)
+    key = ("Series", "SEBIT-FAREX", "fx-1")
+    history.record([(key, moment, 10.0), (("Series", "SEBIT-FAREX", "fx-2"), moment, 5.0)])
+    history.record([(key, moment, 12.5)])
+    (rollup,) = history.rollups("Series")
+    assert (rollup.period, rollup.entries, rollup.closing_total) == ("2025-Q3", 2, 17.5)
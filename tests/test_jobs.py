@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import report_request
+
+
+def test_jobs_return_the_same_report_as_the_synchronous_endpoint():
+    with TestClient(create_app(Settings(cache_max_entries=0, job_workers=1))) as client:
+        document = report_request(12, schedule_rows=2)
+        submitted = client.post("/summary/jobs", json=document)
+        assert submitted.status_code == 202
+        job_id = submitted.json()["job_id"]
+        assert submitted.headers["location"] == f"/summary/jobs/{job_id}"
+
+        finished = client.get(f"/summary/jobs/{job_id}", params={"wait": 10}).json()
+        assert finished["status"] == "succeeded"
+        assert finished["report"] == client.post("/summary/report", json=document).json()
+
+        failed = client.post("/summary/jobs", json={"report_label": "empty"}).json()
+        failed = client.get(f"/summary/jobs/{failed['job_id']}", params={"wait": 10}).json()
+        assert failed["status"] == "failed"
+        assert "Either 'entries' or 'model_outputs'" in failed["errors"][0]["msg"]
+
+        assert client.get("/summary/jobs/missing").status_code == 404
+
+
+def test_full_job_queue_answers_429_with_retry_after():
+    app = create_app(Settings(cache_max_entries=0, job_queue_size=2, job_workers=1))
+    client = TestClient(app)
+    release = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.submit(release.wait)  # occupy the only worker
+    app.state.jobs._pool = pool
+    try:
+        queued = [client.post("/summary/jobs", json=report_request(3)) for _ in range(2)]
+        assert [response.json()["status"] for response in queued] == ["queued", "queued"]
+        rejected = client.post("/summary/jobs", json=report_request(3))
+        assert rejected.status_code == 429
+        assert int(rejected.headers["retry-after"]) >= 1
+        assert "sebit_summary_jobs_pending 2" in client.get("/metrics").text
+    finally:
+        release.set()
+    for response in queued:
+        assert client.get(response.headers["location"], params={"wait": 10}).json()["status"] == "succeeded"
+    app.state.jobs.shutdown()
@@ -0,0 +1,62 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.metrics import Histogram, StageTimer, timed_chunks
+from app.settings import Settings
+from benchmarks.payloads import report_request
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("demo_seconds", "Demo.", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "parse")
+    histogram.observe(0.5, "parse")
+    histogram.observe(5.0, "parse")
+    lines = histogram.render()
+    assert 'demo_seconds_bucket{stage="parse",le="0.1"} 1' in lines
+    assert 'demo_seconds_bucket{stage="parse",le="1.0"} 2' in lines
+    assert 'demo_seconds_bucket{stage="parse",le="+Inf"} 3' in lines
+    assert 'demo_seconds_count{stage="parse"} 3' in lines
+
+
+def test_report_stages_are_exported_and_timed():
+    client = TestClient(create_app(Settings(cache_max_entries=0, metrics_enabled=True, server_timing=True)))
+    response = client.post("/summary/report", json=report_request(14))
+    assert response.status_code == 200
+    timing = response.headers["Server-Timing"]
+    for name in ("validate", "resolve", "aggregate", "serialize"):
+        assert f"{name};dur=" in timing
+
+    metrics = client.get("/metrics").text
+    assert 'sebit_summary_stage_seconds_count{stage="validate"} 1' in metrics
+    assert 'sebit_summary_model_resolve_seconds_count{model="SEBIT-DDA"} 1' in metrics
+    assert "sebit_summary_report_entries_sum 14.0" in metrics
+    assert "sebit_summary_request_bytes_count 1" in metrics
+
+
+def test_chunk_time_is_split_across_its_models():
+    def chunks():
+        time.sleep(0.02)
+        yield [SimpleNamespace(model="A"), SimpleNamespace(model="A"), SimpleNamespace(model="B")]
+
+    timer = StageTimer()
+    assert [entry.model for entry in timed_chunks(chunks(), timer)] == ["A", "A", "B"]
+    assert timer.models["A"] == pytest.approx(2 * timer.models["B"])
+    assert sum(timer.models.values()) == pytest.approx(timer.stages["resolve"])
+
+
+def test_metrics_disabled_by_default_and_errors_match_fastapi():
+    client = TestClient(create_app(Settings()))
+    response = client.post("/summary/report", json=report_request(2))
+    assert "Server-Timing" not in response.headers
+    assert "sebit_summary_stage_seconds" not in client.get("/metrics").text
+
+    invalid = client.post("/summary/report", json={"model_outputs": [{"model_name": "SEBIT-DDA"}]})
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"] == ["body", "model_outputs", 0, "payload"]
+    malformed = client.post("/summary/report", content=b"{", headers={"Content-Type": "application/json"})
+    assert malformed.status_code == 422
+    assert malformed.json()["detail"][0]["type"] == "json_invalid"
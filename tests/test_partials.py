@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import report_request
+
+
+def test_merged_shard_partials_match_a_single_report():
+    client = TestClient(create_app(Settings(cache_max_entries=0)))
+    document = {**report_request(60, schedule_rows=2), "top_k": 3, "quantiles": [0.5, 0.9]}
+    report = client.post("/summary/report", json=document).json()
+
+    outputs = document["model_outputs"]
+    shards = [outputs[:25], outputs[25:40], outputs[40:]]
+    partials = [client.post("/summary/partials", json={**document, "model_outputs": shard}).json() for shard in shards]
+    assert all(len(partial["series"]) <= len(report["series_summary"]) for partial in partials)
+
+    merged = client.post("/summary/partials:merge", json={"partials": partials}).json()
+    assert merged["total_models"] == report["total_models"]
+    assert merged["overall_headline_total"] == report["overall_headline_total"]
+    assert merged["series_summary"] == report["series_summary"]
+
+    # Tree reduction: merge two partials first, then merge the result with the third.
+    pair = client.post("/summary/partials:merge", params={"output": "partial"}, json={"partials": partials[:2]})
+    tree = client.post("/summary/partials:merge", json={"partials": [pair.json(), partials[2]]}).json()
+    assert tree["series_summary"] == report["series_summary"]
+
+
+def test_merge_drops_stats_missing_from_any_partial():
+    client = TestClient(create_app(Settings(cache_max_entries=0)))
+    with_stats = client.post("/summary/partials", json={**report_request(10), "top_k": 2, "quantiles": [0.5]}).json()
+    plain = client.post("/summary/partials", json=report_request(10, seed=1)).json()
+    merged = client.post("/summary/partials:merge", json={"partials": [with_stats, plain]}).json()
+    assert merged["total_models"] == 20
+    assert all(item["top_contributors"] is None for item in merged["series_summary"])
+    assert client.post("/summary/partials:merge", json={"partials": []}).status_code == 422
+
+
+def test_merge_rejects_malformed_sketches():
+    client = TestClient(create_app(Settings(cache_max_entries=0)))
+    partial = client.post("/summary/partials", json={**report_request(10), "quantiles": [0.5]}).json()
+    sketch = partial["series"][0]["sketch"]
+    for broken in ({"levels": []}, {"k": 0}, {"count": -1}):
+        series = [{**partial["series"][0], "sketch": {**sketch, **broken}}] + partial["series"][1:]
+        response = client.post("/summary/partials:merge", json={"partials": [{**partial, "series": series}]})
+        assert response.status_code == 422
@@ -0,0 +1,150 @@
+import itertools
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.registry import RegistryLoader, RegistrySpec, RegistrySpecError, install
+from app.schemas import MODEL_REGISTRY
+from app.settings import Settings
+from benchmarks.payloads import model_outputs
+
+NEW_MODEL = {
+    "series": "Emerging Models",
+    "headline_key": "final_value",
+    "label_key": "asset_label",
+    "fields": {"asset_label": "str", "final_value": "float", "note": "str?"},
+}
+OUTPUTS = [
+    {"model_name": "SEBIT-NEW", "payload": {"asset_label": "a", "final_value": 2.5}},
+    {"model_name": "SEBIT-NEW", "payload": {"asset_label": "b", "final_value": 1.5, "note": "x"}},
+]
+# Distinct modification times for every rewrite, however coarse the filesystem clock.
+_MTIMES = itertools.count(1_700_000_000 * 10**9, 10**9)
+
+
+@pytest.fixture(autouse=True)
+def builtin_registry():
+    yield
+    install(None)
+
+
+def _write(path, models):
+    path.write_text(json.dumps({"models": models}))
+    mtime = next(_MTIMES)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def _client(tmp_path, models, **overrides):
+    spec = tmp_path / "registry.json"
+    _write(spec, models)
+    settings = Settings(registry_path=str(spec), **{"cache_max_entries": 0, **overrides})
+    return TestClient(create_app(settings)), spec
+
+
+def test_spec_models_report_in_every_detail_mode(tmp_path):
+    client, _ = _client(tmp_path, {"SEBIT-NEW": NEW_MODEL, "SEBIT-FAREX": {"series": "FX"}})
+    registry = client.get("/summary/registry").json()
+    assert {model["model"] for model in registry["models"] if model["source"] == "spec"} == {"SEBIT-NEW", "SEBIT-FAREX"}
+
+    outputs = OUTPUTS + model_outputs(1, models=["SEBIT-FAREX"])
+    full = client.post("/summary/report", json={"model_outputs": outputs}).json()
+    assert [series["series"] for series in full["series_summary"]] == ["Emerging Models", "FX"]
+    assert full["entries"][1]["details"] == {"asset_label": "b", "final_value": 1.5, "note": "x"}
+    for mode in ("lazy", "none"):
+        data = client.post("/summary/report", json={"model_outputs": outputs, "detail_mode": mode}).json()
+        assert data["series_summary"] == full["series_summary"]
+    ranked = client.post("/summary/report", json={"model_outputs": outputs, "detail_mode": "lazy", "top_k": 1}).json()
+    assert ranked["series_summary"][0]["top_contributors"][0]["label"] == "a"
+
+    entry = {"series": "Emerging Models", "model": "SEBIT-NEW", "headline_amount": 2.5, "details": OUTPUTS[0]["payload"]}
+    prebuilt = client.post("/summary/report", json={"entries": [entry]})
+    assert prebuilt.json()["entries"][0]["details"] == {"asset_label": "a", "final_value": 2.5, "note": None}
+    invalid = client.post("/summary/report", json={"entries": [{**entry, "details": {"asset_label": "a"}}]})
+    assert invalid.status_code == 422
+    assert invalid.json()["detail"][0]["loc"][-1] == "final_value"
+
+
+def test_extract_headlines_matches_per_output_conversion():
+    outputs = model_outputs(30, models=["SEBIT-LAM"])
+    payloads = [output["payload"] for output in outputs]
+    entry = MODEL_REGISTRY["SEBIT-LAM"]
+    assert MODEL_REGISTRY.extract_headlines("SEBIT-LAM", payloads) == [entry.headline(data) for data in payloads]
+
+    broken = payloads[:3] + [{"lease_label": "no headline"}]
+    with pytest.raises(ValueError, match="missing headline key 'total_revaluation_gain_loss'"):
+        entry.extract_headlines(broken)
+    with pytest.raises(ValueError, match="not registered"):
+        MODEL_REGISTRY.extract_headlines("SEBIT-NEW", payloads)
+
+
+def test_reload_swaps_the_registry_and_rejects_invalid_specs(tmp_path):
+    client, spec = _client(tmp_path, {"SEBIT-NEW": NEW_MODEL})
+    digest = client.get("/summary/registry").json()["spec_digest"]
+
+    _write(spec, {"SEBIT-NEW": {**NEW_MODEL, "series": "Renamed"}})
+    reloaded = client.post("/summary/registry:reload").json()
+    assert reloaded["spec_digest"] != digest
+    report = client.post("/summary/report", json={"model_outputs": OUTPUTS}).json()
+    assert report["series_summary"][0]["series"] == "Renamed"
+
+    _write(spec, {"SEBIT-NEW": {**NEW_MODEL, "headline_key": "asset_label"}})
+    rejected = client.post("/summary/registry:reload")
+    assert rejected.status_code == 422
+    assert "must be a float or int field" in rejected.json()["detail"]
+    current = client.get("/summary/registry").json()
+    assert current["spec_digest"] == reloaded["spec_digest"]
+    assert current["reload_error"] == rejected.json()["detail"]
+
+    unconfigured = TestClient(create_app(Settings()))
+    assert unconfigured.post("/summary/registry:reload").status_code == 404
+
+
+def test_loader_refreshes_only_when_the_file_changes(tmp_path):
+    spec = tmp_path / "registry.json"
+    _write(spec, {"SEBIT-NEW": NEW_MODEL})
+    changes = []
+    loader = RegistryLoader(str(spec), on_change=lambda: changes.append(MODEL_REGISTRY["SEBIT-NEW"].series))
+    assert loader.load()
+    assert not loader.refresh()
+    generated = MODEL_REGISTRY["SEBIT-NEW"].detail_model
+
+    _write(spec, {"SEBIT-NEW": {**NEW_MODEL, "series": "Polled"}})
+    assert loader.refresh()
+    assert changes == ["Emerging Models", "Polled"]
+    # Unchanged fields reuse the generated class and its validator.
+    assert MODEL_REGISTRY["SEBIT-NEW"].detail_model is generated
+
+    with pytest.raises(RegistrySpecError, match="unknown keys"):
+        RegistrySpec.parse({"models": {"SEBIT-DDA": {"headline": "x"}}})
+    with pytest.raises(RegistrySpecError, match="missing"):
+        RegistrySpec.parse({"models": {"SEBIT-OTHER": {"series": "x"}}})
+    fields = {**NEW_MODEL["fields"], "asset_label": "str?"}
+    with pytest.raises(RegistrySpecError, match="must be a required field"):
+        RegistrySpec.parse({"models": {"SEBIT-NEW": {**NEW_MODEL, "fields": fields}}})
+    with pytest.raises(RegistrySpecError, match="must be a required field"):
+        RegistrySpec.parse({"models": {"SEBIT-CEEM": {"label_key": "standard_usage_value_quantitative"}}})
+
+
+def test_batch_workers_use_the_spec_registry(tmp_path):
+    client, _ = _client(tmp_path, {"SEBIT-NEW": NEW_MODEL}, batch_workers=2)
+    with client:
+        response = client.post("/summary/reports:batch", json=[{"model_outputs": OUTPUTS}] * 2)
+    results = response.json()["results"]
+    assert [result["status"] for result in results] == ["ok", "ok"]
+    assert results[1]["report"]["series_summary"][0]["series"] == "Emerging Models"
+
+
+def test_report_cache_is_keyed_by_the_active_registry(tmp_path):
+    client, _ = _client(tmp_path, {"SEBIT-NEW": NEW_MODEL}, cache_max_entries=8)
+    body = {"model_outputs": OUTPUTS}
+    assert client.post("/summary/report", json=body).headers["X-Cache"] == "MISS"
+    assert client.post("/summary/report", json=body).headers["X-Cache"] == "HIT"
+
+    # Another worker's reload: the registry changes without this cache being cleared.
+    install(RegistrySpec.parse({"models": {"SEBIT-NEW": {**NEW_MODEL, "series": "Elsewhere"}}}))
+    response = client.post("/summary/report", json=body)
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json()["series_summary"][0]["series"] == "Elsewhere"
@@ -0,0 +1,54 @@
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.settings import Settings
+from benchmarks.payloads import model_outputs, report_request
+
+STATS = ("model_count", "headline_total", "headline_average", "headline_min", "headline_max", "top_model", "bottom_model")
+
+
+def test_rollup_levels_match_the_report_and_page_subtrees():
+    client = TestClient(create_app(Settings(cache_max_entries=0)))
+    document = report_request(40, schedule_rows=2)
+    report = client.post("/summary/report", json=document).json()
+
+    created = client.post("/summary/rollups", params={"depth": 2}, json=document)
+    assert created.status_code == 201
+    top = created.json()
+    assert (top["total_models"], top["overall_headline_total"]) == (40, report["overall_headline_total"])
+    assert [node["key"] for node in top["children"]] == [item["series"] for item in report["series_summary"]]
+    for node, aggregate in zip(top["children"], report["series_summary"]):
+        assert {name: node[name] for name in STATS} == {name: aggregate[name] for name in STATS}
+        assert sum(child["model_count"] for child in node["children"]) == node["model_count"]
+
+    series = top["children"][0]["key"]
+    model = top["children"][0]["children"][0]["key"]
+    labels = client.get(
+        f"/summary/rollups/{top['rollup_id']}", params={"path": [series, model], "limit": 2, "offset": 1}
+    ).json()
+    assert labels["node"]["key"] == model and labels["node"]["level"] == "model"
+    expected = [entry for entry in report["entries"] if entry["model"] == model]
+    assert labels["total_children"] == len(expected)
+    assert [child["level"] for child in labels["children"]] == ["label"] * min(2, len(expected) - 1)
+    assert [child["headline_total"] for child in labels["children"]] == [
+        entry["headline_amount"] for entry in expected[1:3]
+    ]
+
+    assert client.get(f"/summary/rollups/{top['rollup_id']}", params={"path": ["missing"]}).status_code == 404
+    assert client.delete(f"/summary/rollups/{top['rollup_id']}").status_code == 204
+    assert client.get(f"/summary/rollups/{top['rollup_id']}").status_code == 404
+
+
+def test_rollup_groups_outputs_sharing_a_label():
+    outputs = model_outputs(3, models=["SEBIT-FAREX"])
+    for output, (label, amount) in zip(outputs, [("fx-a", 10.0), ("fx-b", 5.0), ("fx-a", 2.5)]):
+        output["payload"].update(contract_id=label, revaluation_amount=amount)
+    client = TestClient(create_app(Settings()))
+    rollup = client.post(
+        "/summary/rollups", params={"depth": 3}, json={"model_outputs": outputs, "detail_mode": "lazy"}
+    ).json()
+    (leaves,) = [model["children"] for model in rollup["children"][0]["children"]]
+    assert [(leaf["key"], leaf["model_count"], leaf["headline_total"]) for leaf in leaves] == [
+        ("fx-a", 2, 12.5),
+        ("fx-b", 1, 5.0),
+    ]
@@ -0,0 +1,45 @@
+from array import array
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.schedules import ScheduleTable
+from app.schemas import DdaDetails
+from benchmarks.payloads import model_payload, report_request
+
+
+def test_schedule_is_stored_by_column_and_round_trips():
+    payload = model_payload("SEBIT-DDA", schedule_rows=30)
+    details = DdaDetails.model_validate(payload)
+
+    schedule = details.schedule
+    assert isinstance(schedule, ScheduleTable)
+    assert len(schedule) == 30
+    assert isinstance(schedule.values[schedule.columns.index("charge")], array)
+    assert schedule[0] == payload["schedule"][0]
+    assert details.model_dump()["schedule"] == payload["schedule"]
+    assert DdaDetails.model_validate_json(details.model_dump_json()).schedule == payload["schedule"]
+
+
+def test_ragged_schedule_rows_are_kept_as_is():
+    rows = [{"period": 1, "charge": 1.5}, {"period": 2, "charge": 2.5, "note": "final"}]
+    schedule = ScheduleTable.from_rows(rows)
+    assert list(schedule) == rows
+    assert schedule.column_map() == {"period": [1, 2], "charge": [1.5, 2.5], "note": [None, "final"]}
+
+
+def test_schedule_mode_controls_report_output():
+    client = TestClient(create_app())
+    body = report_request(3, schedule_rows=4, models=["SEBIT-DDA"])
+
+    rows = client.post("/summary/report", json=body).json()["entries"][0]["details"]["schedule"]
+    assert len(rows) == 4 and rows[0]["period"] == 1
+
+    columns = client.post("/summary/report", json={**body, "schedule_mode": "columns"}).json()
+    assert columns["entries"][0]["details"]["schedule"]["period"] == [1, 2, 3, 4]
+
+    summary = client.post("/summary/report", json={**body, "schedule_mode": "summary"}).json()
+    assert summary["entries"][0]["details"]["schedule"]["periods"] == 4
+
+    omitted = client.post("/summary/report", params={"stream": "true"}, json={**body, "schedule_mode": "omit"})
+    assert omitted.json()["entries"][0]["details"]["schedule"] is None
@@ -0,0 +1,104 @@
+import random
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.schemas import MODEL_REGISTRY, SummaryReportRequest
+from app.services import build_summary_report
+from app.sessions import SessionStore
+from benchmarks.payloads import model_outputs, model_payload
+
+
+def _digest(report):
+    data = report.model_dump()
+    data.pop("entries", None)
+    data.pop("session_id", None)
+    return data
+
+
+def test_session_updates_match_a_full_rebuild():
+    outputs = model_outputs(60)
+    session = SessionStore().create(SummaryReportRequest(model_outputs=outputs).iter_entries())
+
+    rng = random.Random(3)
+    for step in range(40):
+        index = rng.randrange(len(outputs))
+        name = outputs[index]["model_name"]
+        label_key = MODEL_REGISTRY[name].label_key
+        payload = {**model_payload(name, index, seed=step + 1), label_key: outputs[index]["payload"][label_key]}
+        outputs[index] = {"model_name": name, "payload": payload, "currency": "KRW"}
+        session.upsert(SummaryReportRequest(model_outputs=[outputs[index]]).resolve_entries()[0])
+        if step % 10 == 9:
+            removed = outputs.pop(rng.randrange(len(outputs)))
+            label = removed["payload"][MODEL_REGISTRY[removed["model_name"]].label_key]
+            assert session.remove(removed["model_name"], label)
+
+        rebuilt = build_summary_report(SummaryReportRequest(model_outputs=outputs))
+        assert _digest(session.digest()) == _digest(rebuilt)
+    assert session.report().model_dump() == build_summary_report(SummaryReportRequest(model_outputs=outputs)).model_dump()
+
+
+def test_session_endpoints():
+    client = TestClient(create_app())
+    created = client.post("/summary/sessions", json={"model_outputs": model_outputs(3)})
+    assert created.status_code == 201
+    session_id = created.json()["session_id"]
+
+    revalued = model_payload("SEBIT-RVM", 2)
+    revalued["final_revaluation_value"] = 1000.0
+    patched = client.patch(
+        f"/summary/sessions/{session_id}",
+        json={
+            "upserts": [{"model_name": "SEBIT-RVM", "payload": revalued}],
+            "removals": [{"model_name": "SEBIT-LAM", "label": "lease-1"}],
+        },
+    )
+    assert patched.status_code == 200
+    assert patched.json()["total_models"] == 2
+    assert patched.json()["series_summary"][0]["headline_max"] >= 1000.0
+
+    missing = client.patch(
+        f"/summary/sessions/{session_id}",
+        json={"removals": [{"model_name": "SEBIT-LAM", "label": "lease-1"}]},
+    )
+    assert missing.status_code == 404
+
+    report = client.get(f"/summary/sessions/{session_id}").json()
+    assert [entry["model"] for entry in report["entries"]] == ["SEBIT-DDA", "SEBIT-RVM"]
+    assert client.delete(f"/summary/sessions/{session_id}").status_code == 204
+    assert client.get(f"/summary/sessions/{session_id}").status_code == 404
+
+
+def test_unkeyable_upsert_leaves_the_session_untouched(monkeypatch):
+    from app.sessions import ReportSession
+
+    client = TestClient(create_app())
+    session_id = client.post("/summary/sessions", json={"model_outputs": model_outputs(3)}).json()["session_id"]
+
+    def no_label(entry):
+        raise ValueError(f"Model '{entry.model}' has no registered label and cannot be tracked in a session.")
+
+    monkeypatch.setattr(ReportSession, "key_for", staticmethod(no_label))
+    patched = client.patch(
+        f"/summary/sessions/{session_id}",
+        json={
+            "upserts": [{"model_name": "SEBIT-RVM", "payload": model_payload("SEBIT-RVM", 2)}],
+            "removals": [{"model_name": "SEBIT-LAM", "label": "lease-1"}],
+        },
+    )
+    assert patched.status_code == 422
+    assert client.get(f"/summary/sessions/{session_id}").json()["total_models"] == 3
+
+
+def test_lazy_sessions_validate_details_when_created():
+    client = TestClient(create_app())
+    outputs = model_outputs(3)
+    body = {"model_outputs": outputs, "detail_mode": "lazy"}
+    created = client.post("/summary/sessions", json=body)
+    assert created.status_code == 201
+    assert client.get(f"/summary/sessions/{created.json()['session_id']}").status_code == 200
+
+    label_key = MODEL_REGISTRY["SEBIT-LAM"].label_key
+    broken = {**outputs[1], "payload": {label_key: "lease-1", "total_revaluation_gain_loss": 1.0}}
+    rejected = client.post("/summary/sessions", json={**body, "model_outputs": [outputs[0], broken]})
+    assert rejected.status_code == 422
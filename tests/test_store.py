@@ -0,0 +1,59 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.schemas import SummaryReportRequest
+from app.services import build_summary_report
+from app.settings import Settings
+from app.store import ReportStore
+from benchmarks.payloads import model_outputs, report_request
+
+
+def test_snapshots_replay_reports_and_answer_headline_queries(tmp_path):
+    client = TestClient(create_app(Settings(store_path=str(tmp_path))))
+    q3 = {**report_request(30, schedule_rows=3), "as_of": "2025-08-15T00:00:00Z"}
+    q4 = {**report_request(14), "as_of": "2025-11-15T00:00:00Z", "schedule_mode": "summary"}
+
+    first = client.post("/summary/report", json=q3)
+    second = client.post("/summary/report", json=q4)
+    report_id = first.headers["X-Report-Id"]
+    assert client.post("/summary/report", json=q3).headers["X-Report-Id"] == report_id  # cache hit
+
+    for response in (first, second):
+        replay = client.get(f"/summary/store/reports/{response.headers['X-Report-Id']}")
+        assert replay.json() == response.json()
+
+    listed = client.get("/summary/store/reports", params={"as_of_from": "2025-07-01", "as_of_to": "2025-09-30"})
+    assert [item["report_id"] for item in listed.json()["reports"]] == [report_id]
+
+    headlines = client.get(
+        "/summary/store/headlines",
+        params={"model": "SEBIT-CPRM", "as_of_from": "2025-07-01T00:00:00Z", "as_of_to": "2025-09-30T23:59:59Z"},
+    ).json()["headlines"]
+    expected = [entry for entry in first.json()["entries"] if entry["model"] == "SEBIT-CPRM"]
+    assert [item["headline_amount"] for item in headlines] == [entry["headline_amount"] for entry in expected]
+    assert [item["label"] for item in headlines] == [entry["details"]["exposure_id"] for entry in expected]
+
+    assert client.get("/summary/store/reports/missing").status_code == 404
+
+
+def test_store_index_is_shared_between_instances(tmp_path):
+    writer = ReportStore(str(tmp_path))
+    reader = ReportStore(str(tmp_path))
+    report = build_summary_report(SummaryReportRequest.model_validate(report_request(5)))
+    record = writer.append(report)
+    writer.flush()
+    assert reader.get(record.report_id) == record
+    with reader.open(record) as snapshot:
+        assert list(snapshot.headlines) == [entry.headline_amount for entry in report.entries]
+
+
+def test_non_finite_headlines_are_stored_as_null(tmp_path):
+    client = TestClient(create_app(Settings(cache_max_entries=0, store_path=str(tmp_path))))
+    outputs = model_outputs(2, models=["SEBIT-FAREX"])
+    outputs[0]["payload"]["revaluation_amount"] = float("inf")
+    response = client.post("/summary/report", content=json.dumps({"model_outputs": outputs}))
+    assert response.json()["entries"][0]["headline_amount"] is None
+    replay = client.get(f"/summary/store/reports/{response.headers['X-Report-Id']}")
+    assert replay.content == response.content
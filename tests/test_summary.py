@@ -1,4 +1,11 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 from app.main import create_app
 
@@ -47,3 +54,174 @@ def test_summary_report():
     assert first_entry["model"] == "SEBIT-DDA"
     assert first_entry["headline_amount"] == 5400.25
     assert first_entry["details"]["total_depreciation"] == 233449.88
+
+
+def test_entry_details_follow_model_tag():
+    from app.schemas import CpmrvDetails, DdaDetails, SummaryEntry
+
+    details = {
+        "asset_label": "btc-treasury",
+        "last_year_average_performance": 0.12,
+        "current_year_log_ratio": 0.05,
+        "monthly_growth_risk": 0.02,
+        "risk_direction": "up",
+        "relative_asset_risk": 0.3,
+        "adjusted_crypto_value": 1250.0,
+    }
+    entry = SummaryEntry.model_validate(
+        {
+            "series": "Advanced Analytics",
+            "model": "SEBIT-CPMRV",
+            "headline_amount": 1250.0,
+            "details": details,
+        }
+    )
+    assert isinstance(entry.details, CpmrvDetails)
+    assert "kind" not in details
+
+    tagged = {"series": "Advanced Analytics", "model": "SEBIT-CPMRV", "headline_amount": 1250.0}
+    explicit = SummaryEntry.model_validate({**tagged, "details": {**details, "kind": "SEBIT-CPMRV"}})
+    assert isinstance(explicit.details, CpmrvDetails)
+    with pytest.raises(ValidationError, match="does not match model 'SEBIT-CPMRV'"):
+        SummaryEntry.model_validate({**tagged, "details": {**details, "kind": "SEBIT-DDA"}})
+
+    unregistered = SummaryEntry.model_validate(
+        {
+            "series": "Asset & Depreciation",
+            "model": "LEGACY-DDA",
+            "headline_amount": 10.0,
+            "details": {
+                "asset_label": "legacy",
+                "total_depreciation": 1.0,
+                "total_revaluation_gain_loss": 10.0,
+                "total_unrecognised_revaluation": 0.0,
+            },
+        }
+    )
+    assert isinstance(unregistered.details, DdaDetails)
+
+
+def test_summary_report_ndjson_stream():
+    import json
+
+    client = TestClient(create_app())
+    outputs = [
+        {
+            "model_name": "SEBIT-FAREX",
+            "payload": {
+                "contract_id": f"fx-{index}",
+                "last_year_trade_ratio": 0.4,
+                "current_year_trade_ratio": 0.5,
+                "export_import_beta": 1.1,
+                "adjustment_indicator": 0.02,
+                "inflation_adjusted_rate": 0.03,
+                "final_adjusted_rate": 0.035,
+                "revaluation_amount": 100.0 * (index + 1),
+            },
+            "currency": "KRW",
+        }
+        for index in range(3)
+    ]
+    body = "\n".join(json.dumps(output) for output in outputs) + "\n"
+
+    response = client.post(
+        "/summary/report/stream",
+        params={"report_label": "Streamed"},
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["report_label"] == "Streamed"
+    assert data["total_models"] == 3
+    assert data["overall_headline_total"] == 600.0
+    assert "entries" not in data
+    assert data["series_summary"][0]["top_model"]["headline_amount"] == 300.0
+
+    ranked = client.post(
+        "/summary/report/stream", params={"top_k": 2, "quantiles": [0.5]}, content=body
+    ).json()["series_summary"][0]
+    assert [item["label"] for item in ranked["top_contributors"]] == ["fx-2", "fx-1"]
+    assert ranked["headline_quantiles"] == [{"quantile": 0.5, "headline_amount": 200.0}]
+
+    bad = client.post("/summary/report/stream", content=body + '{"model_name": "SEBIT-X", "payload": {}}\n')
+    assert bad.status_code == 422
+    assert bad.json()["detail"].startswith("Line 4:")
+
+
+def test_summary_report_streamed_response_matches_buffered():
+    from benchmarks.payloads import report_request
+
+    client = TestClient(create_app())
+    payload = report_request(40, schedule_rows=12)
+
+    buffered = client.post("/summary/report", json=payload)
+    streamed = client.post("/summary/report", params={"stream": "true"}, json=payload)
+    assert streamed.status_code == 200
+    assert streamed.headers["content-type"] == "application/json"
+    assert streamed.json() == buffered.json()
+
+
+def test_registry_converters_match_validated_entries():
+    from app.schemas import MODEL_REGISTRY, SummaryEntry
+    from benchmarks.payloads import model_payload
+
+    for name, registry_entry in MODEL_REGISTRY.items():
+        data = model_payload(name, schedule_rows=3)
+        converted = SummaryEntry.from_model_output(name, data, currency="KRW")
+        validated = SummaryEntry(
+            series=registry_entry.series,
+            model=name,
+            headline_amount=data[registry_entry.headline_key],
+            currency="KRW",
+            details=data,
+        )
+        assert converted == validated
+        assert converted.model_fields_set == validated.model_fields_set
+
+
+def test_detail_modes_share_aggregates_and_drop_details():
+    from app.schemas import SummaryEntry
+    from benchmarks.payloads import model_payload, report_request
+
+    client = TestClient(create_app())
+    payload = report_request(28, schedule_rows=4)
+    full = client.post("/summary/report", json=payload).json()
+    for mode in ("lazy", "none"):
+        data = client.post("/summary/report", json={**payload, "detail_mode": mode}).json()
+        assert data["series_summary"] == full["series_summary"]
+        assert data["overall_headline_total"] == full["overall_headline_total"]
+        assert all(entry["details"] is None for entry in data["entries"])
+
+    raw = model_payload("SEBIT-LAM", schedule_rows=2)
+    lazy = SummaryEntry.from_model_output("SEBIT-LAM", raw, detail_mode="lazy")
+    assert lazy.label == raw["lease_label"]
+    assert lazy.details == SummaryEntry.from_model_output("SEBIT-LAM", raw).details
+    assert lazy.label == raw["lease_label"]
+    dropped = SummaryEntry.from_model_output("SEBIT-LAM", raw, detail_mode="none")
+    assert dropped.details is None and dropped.label is None
+
+
+def test_fast_startup_defers_schema_builds():
+    # A fresh interpreter, since importing app.main here already built everything.
+    script = """
+import sys
+from fastapi.testclient import TestClient
+from app.main import app
+from app.schemas import SummaryEntry, SummaryReportRequest
+assert not SummaryReportRequest.__pydantic_complete__
+assert not SummaryEntry.__pydantic_complete__
+assert "numpy" not in sys.modules
+response = TestClient(app).post(
+    "/summary/report",
+    json={"model_outputs": [{"model_name": "SEBIT-DDA", "payload": {
+        "asset_label": "a", "total_depreciation": 2.0,
+        "total_revaluation_gain_loss": 1.5, "total_unrecognised_revaluation": 0.0,
+    }}]},
+)
+assert response.status_code == 200, response.text
+assert response.json()["overall_headline_total"] == 1.5
+assert SummaryReportRequest.__pydantic_complete__
+"""
+    env = {**os.environ, "SEBIT_SUMMARY_FAST_STARTUP": "true"}
+    subprocess.run([sys.executable, "-c", script], env=env, check=True, cwd=Path(__file__).resolve().parents[1])